@@ -71,6 +71,9 @@ class Agent:
             selected_tool=None,
             tool_input=None,
             observation=None,
+            pending_tool_calls=None,
+            observations=[],
+            ensemble_size=1,
             should_stop=False,
             pending_approval=None,
             guidance=None,
@@ -0,0 +1,174 @@
+"""
+Deferred Checkpointing
+
+MemorySaver variants that drop threads left idle past a TTL, and that keep
+only the latest checkpoint of a run in memory and serialize it once, instead
+of after every think/act step.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import MemorySaver
+
+# Conversations untouched for this long are dropped from the checkpointer
+THREAD_TTL_SECONDS = 24 * 3600
+
+
+class ExpiringMemorySaver(MemorySaver):
+    """
+    MemorySaver that forgets threads with no checkpoint written for
+    ``thread_ttl_seconds``.
+
+    Expiry is purely time-based – there is no size bound, so a busy server
+    never drops a live conversation to make room for another. Threads are
+    kept in write order, so each ``put`` only inspects the oldest ones.
+    """
+
+    def __init__(self, *args: Any, thread_ttl_seconds: float = THREAD_TTL_SECONDS, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.thread_ttl_seconds = thread_ttl_seconds
+        # thread_id -> monotonic time of its last checkpoint, oldest first
+        self._last_put: "OrderedDict[str, float]" = OrderedDict()
+
+    def _touch(self, thread_id: str) -> None:
+        now = time.monotonic()
+        self._last_put[thread_id] = now
+        self._last_put.move_to_end(thread_id)
+        while self._last_put:
+            oldest, stamp = next(iter(self._last_put.items()))
+            if now - stamp <= self.thread_ttl_seconds:
+                break
+            self.delete_thread(oldest)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        self._touch(config["configurable"]["thread_id"])
+        return super().put(config, checkpoint, metadata, new_versions)
+
+    def delete_thread(self, thread_id: str) -> None:
+        self._last_put.pop(thread_id, None)
+        super().delete_thread(thread_id)
+
+
+class DeferredMemorySaver(ExpiringMemorySaver):
+    """
+    MemorySaver that defers checkpoint serialization until it is read.
+
+    Each ``put`` replaces the buffered checkpoint for its (thread, namespace),
+    so a k-step ReAct loop serializes one checkpoint instead of k. The buffer
+    is flushed before any read (``get_tuple``/``list``), which means callers
+    such as ``graph.get_state`` or the next run on the same thread always see
+    the latest state.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # (thread_id, checkpoint_ns) -> buffered put arguments and writes
+        self._buf: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        key = (thread_id, checkpoint_ns)
+        self._touch(thread_id)
+
+        pending = self._buf.get(key)
+        if pending is None:
+            # First checkpoint of the run keeps the parent link to stored history
+            pending = {"config": config, "versions": {}}
+            self._buf[key] = pending
+
+        # Channels bumped by skipped checkpoints must still be written on flush
+        pending["versions"].update(new_versions)
+        pending["checkpoint"] = checkpoint
+        pending["metadata"] = metadata
+        pending["writes"] = []
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        key = (
+            config["configurable"]["thread_id"],
+            config["configurable"].get("checkpoint_ns", ""),
+        )
+        pending = self._buf.get(key)
+        if pending and pending["checkpoint"]["id"] == config["configurable"]["checkpoint_id"]:
+            pending["writes"].append((config, writes, task_id, task_path))
+        else:
+            super().put_writes(config, writes, task_id, task_path)
+
+    def flush(self, thread_id: Optional[str] = None) -> None:
+        """
+        Persist buffered checkpoints.
+
+        Args:
+            thread_id: Only flush this thread (all threads if omitted)
+        """
+        keys: List[Tuple[str, str]] = [
+            key for key in self._buf if thread_id is None or key[0] == thread_id
+        ]
+        for key in keys:
+            pending = self._buf.pop(key)
+            # Write straight to MemorySaver: the thread's TTL was stamped when
+            # the checkpoint was buffered, not when it is read back
+            saved = MemorySaver.put(
+                self,
+                pending["config"],
+                pending["checkpoint"],
+                pending["metadata"],
+                pending["versions"],
+            )
+            for _, writes, task_id, task_path in pending["writes"]:
+                MemorySaver.put_writes(self, saved, writes, task_id, task_path)
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        self.flush(config["configurable"]["thread_id"])
+        return super().get_tuple(config)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        self.flush(config["configurable"]["thread_id"] if config else None)
+        return super().list(config, filter=filter, before=before, limit=limit)
+
+    def delete_thread(self, thread_id: str) -> None:
+        for key in [key for key in self._buf if key[0] == thread_id]:
+            del self._buf[key]
+        super().delete_thread(thread_id)
@@ -4,13 +4,36 @@ LangGraph Agent Graph
 Creates the state graph for the ReAct agent.
 """
 
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List, Union
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.types import Send
 
 from ..state.agent_state import AgentState, Phase
+from .checkpointer import DeferredMemorySaver, ExpiringMemorySaver
 from .react_nodes import ReActNodes
 
+# Checkpoint after every node, or once per run (see DeferredMemorySaver)
+CHECKPOINT_MODES = ("per_step", "end_of_workflow")
+
+# Process-wide checkpointers, one per mode; state is partitioned by the
+# thread_id in each run's config, so every graph can share them. Threads idle
+# past THREAD_TTL_SECONDS are dropped, which bounds their memory over time.
+_SHARED_MEMORY = {
+    "per_step": ExpiringMemorySaver(),
+    "end_of_workflow": DeferredMemorySaver(),
+}
+
+
+# next_action -> node name; anything not listed routes back to "think"
+_ROUTES: Dict[str, str] = {
+    "end": "end",
+    "act": "act",
+    "approval": "approval",
+    "think": "think",
+}
+
 
 def should_continue(state: AgentState) -> str:
     """
@@ -19,21 +42,37 @@ def should_continue(state: AgentState) -> str:
     Returns:
         Name of the next node to execute
     """
-    if state.get("should_stop", False):
+    if state.get("should_stop"):
         return "end"
     
-    next_action = state.get("next_action", "think")
+    return _ROUTES.get(state.get("next_action"), "think")
+
+
+def route_after_think(state: AgentState) -> Union[str, List[Send]]:
+    """
+    Route out of the think node.
+    
+    When the LLM proposed several independent tool calls, fan them out as
+    parallel ``act`` branches; otherwise defer to should_continue.
+    """
+    tool_calls = state.get("pending_tool_calls")
+    if tool_calls and len(tool_calls) > 1 and not state.get("should_stop"):
+        return [Send("act", {**state, "tool_call": call}) for call in tool_calls]
     
-    if next_action == "end":
-        return "end"
-    elif next_action == "act":
-        return "act"
-    elif next_action == "approval":
-        return "approval"
-    elif next_action == "observe":
-        return "observe"
-    else:
+    return should_continue(state)
+
+
+def route_after_act(state: AgentState) -> str:
+    """
+    Route out of the act node.
+    
+    Parallel branches report through the ``observations`` channel and always
+    join back into think, which folds them into the conversation.
+    """
+    if state.get("observations"):
         return "think"
+    
+    return should_continue(state)
 
 
 async def approval_gate(state: AgentState) -> Dict[str, Any]:
@@ -64,32 +103,32 @@ async def approval_gate(state: AgentState) -> Dict[str, Any]:
     return {"next_action": "end", "should_stop": True}
 
 
-def create_agent_graph(
-    model_provider: str = "openai",
-    model_name: str = "gpt-4",
-    enable_memory: bool = True
-):
+async def _think(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
+    """Think node: delegates to the ReActNodes bound in the run config."""
+    return await config["configurable"]["react_nodes"].think(state)
+
+
+async def _act(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
+    """Act node: delegates to the ReActNodes bound in the run config."""
+    return await config["configurable"]["react_nodes"].act(state)
+
+
+def _build_workflow() -> StateGraph:
     """
-    Create the LangGraph state machine for the agent.
+    Build the agent graph topology.
     
-    Args:
-        model_provider: "openai" or "anthropic"
-        model_name: Model identifier
-        enable_memory: Whether to enable state persistence with MemorySaver
-        
-    Returns:
-        Compiled LangGraph graph
-    """
-    # Initialize ReAct nodes
-    react_nodes = ReActNodes(model_provider=model_provider, model_name=model_name)
+    The topology is independent of the LLM: nodes resolve their ReActNodes
+    from ``config["configurable"]["react_nodes"]`` at run time.
     
+    There is no separate observe node: act records its observation itself,
+    so each tool iteration costs one super-step fewer.
+    """
     # Create state graph
     workflow = StateGraph(AgentState)
     
     # Add nodes
-    workflow.add_node("think", react_nodes.think)
-    workflow.add_node("act", react_nodes.act)
-    workflow.add_node("observe", react_nodes.observe)
+    workflow.add_node("think", _think)
+    workflow.add_node("act", _act)
     workflow.add_node("approval", approval_gate)
     
     # Set entry point
@@ -98,7 +137,7 @@ def create_agent_graph(
     # Add conditional edges
     workflow.add_conditional_edges(
         "think",
-        should_continue,
+        route_after_think,
         {
             "act": "act",
             "approval": "approval",
@@ -108,16 +147,7 @@ def create_agent_graph(
     
     workflow.add_conditional_edges(
         "act",
-        should_continue,
-        {
-            "observe": "observe",
-            "think": "think",
-        }
-    )
-    
-    workflow.add_conditional_edges(
-        "observe",
-        should_continue,
+        route_after_act,
         {
             "think": "think",
             "end": END,
@@ -133,10 +163,57 @@ def create_agent_graph(
         }
     )
     
-    # Add memory if enabled
-    memory = MemorySaver() if enable_memory else None
+    return workflow
+
+
+# Compiled once at import; create_agent_graph only binds nodes and a checkpointer
+_COMPILED_GRAPH = _build_workflow().compile()
+
+
+def create_agent_graph(
+    model_provider: str = "openai",
+    model_name: str = "gpt-4",
+    enable_memory: bool = True,
+    checkpoint_mode: str = "end_of_workflow"
+):
+    """
+    Create the LangGraph state machine for the agent.
+    
+    Graphs are cached per (model_provider, model_name, enable_memory,
+    checkpoint_mode) and shared across threads. All graphs use one
+    process-wide checkpointer per mode; per-thread state is keyed by the
+    ``thread_id`` passed in the run config.
+    
+    Args:
+        model_provider: "openai" or "anthropic"
+        model_name: Model identifier
+        enable_memory: Whether to enable state persistence with MemorySaver
+        checkpoint_mode: "per_step" to checkpoint after every node, or
+            "end_of_workflow" to keep only the latest checkpoint of a run
+        
+    Returns:
+        Compiled LangGraph graph
+    """
+    if checkpoint_mode not in CHECKPOINT_MODES:
+        raise ValueError(f"Unknown checkpoint mode: {checkpoint_mode}")
+    return _build_graph(model_provider, model_name, enable_memory, checkpoint_mode)
+
+
+@lru_cache(maxsize=16)
+def _build_graph(
+    model_provider: str,
+    model_name: str,
+    enable_memory: bool,
+    checkpoint_mode: str,
+):
+    """Bind ReAct nodes and a checkpointer to the precompiled graph."""
+    # Initialize ReAct nodes
+    react_nodes = ReActNodes(model_provider=model_provider, model_name=model_name)
     
-    # Compile graph
-    graph = workflow.compile(checkpointer=memory)
+    # Add memory if enabled
+    memory = _SHARED_MEMORY[checkpoint_mode] if enable_memory else None
     
-    return graph
+    # Copy the compiled graph rather than recompiling the topology
+    return _COMPILED_GRAPH.copy({"checkpointer": memory}).with_config(
+        configurable={"react_nodes": react_nodes}
+    )
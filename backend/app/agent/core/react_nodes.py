@@ -1,20 +1,23 @@
 """
 ReAct Pattern Nodes
 
-Implements the Reasoning, Action, and Observation nodes for the agent.
+Implements the Reasoning and Action nodes for the agent; observations are
+recorded by the act node itself.
 Enhanced with structured reasoning, multi-line parsing, context summarization,
 and error recovery guidance.
 """
 
+import asyncio
 import json
 import logging
+from collections import Counter
 from typing import Dict, Any, List
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 
 from ..state.agent_state import AgentState, Phase
-from ..prompts.system_prompts import get_system_prompt
+from ..prompts.system_prompts import get_system_message
 from ..tools.error_handling import truncate_output, ToolExecutionError, ToolTimeoutError
 
 logger = logging.getLogger(__name__)
@@ -26,6 +29,10 @@ MAX_CONTEXT_MESSAGES = 20
 MAX_FINDING_SUMMARY_LENGTH = 200
 MAX_TOOL_OUTPUT_SUMMARY_LENGTH = 150
 
+# Temperature range spread across candidate thoughts when ensembling
+ENSEMBLE_MIN_TEMPERATURE = 0.2
+ENSEMBLE_MAX_TEMPERATURE = 1.0
+
 # Common tool errors mapped to recovery suggestions
 TOOL_ERROR_RECOVERY: Dict[str, str] = {
     "timeout": "The tool timed out. Try reducing the scope (fewer ports, smaller wordlist) or increasing the timeout.",
@@ -38,7 +45,7 @@ TOOL_ERROR_RECOVERY: Dict[str, str] = {
 
 class ReActNodes:
     """
-    ReAct pattern implementation with think, act, and observe nodes.
+    ReAct pattern implementation with think and act nodes.
     Enhanced with context summarization, structured error recovery,
     and multi-line LLM response parsing.
     """
@@ -148,11 +155,16 @@ class ReActNodes:
         Returns:
             Updated state with next_action, selected_tool, tool_input
         """
-        # Get system prompt for current phase
-        system_prompt = get_system_prompt(state["current_phase"])
+        # Fold in results of parallel tool calls from the previous step
+        folded = self._fold_observations(state) if state.get("observations") else {}
+        if folded:
+            state = {**state, **folded}
+        
+        # Get system message for current phase
+        system_message = get_system_message(state["current_phase"])
         
         # Build message history with context summarization
-        raw_messages = [SystemMessage(content=system_prompt)] + state["messages"]
+        raw_messages = [system_message] + state["messages"]
         messages = self._summarize_context(raw_messages)
         
         # If we have an observation from previous action, add it
@@ -173,10 +185,9 @@ class ReActNodes:
         
         tool_descriptions = []
         for tool_name, tool in available_tools.items():
-            meta = registry.get_tool_metadata(tool_name)
             params_info = ""
-            if meta and meta.get("parameters"):
-                params_info = f" | Parameters: {json.dumps(meta['parameters'])}"
+            if tool.metadata.parameters:
+                params_info = f" | Parameters: {tool.parameters_schema_json}"
             tool_descriptions.append(f"- {tool_name}: {tool.description}{params_info}")
         
         tools_list = "\n".join(tool_descriptions) if tool_descriptions else "No tools available"
@@ -197,13 +208,14 @@ Format your response as:
 THOUGHT: [Your detailed reasoning about the current situation and next steps]
 ACTION: [tool_name or "respond"]
 TOOL_INPUT: [JSON parameters if using a tool, or your response text if responding directly]
+
+To run several independent tools at once, repeat the ACTION and TOOL_INPUT lines for each tool.
 """
         
         messages.append(HumanMessage(content=thinking_prompt))
         
         # Get LLM response
-        response = await self.llm.ainvoke(messages)
-        response_text = response.content
+        response_text = await self._reason(messages, state.get("ensemble_size") or 1)
         
         # Parse the response to extract action and tool info
         thought, action, tool_input = self._parse_llm_response(response_text)
@@ -212,6 +224,7 @@ TOOL_INPUT: [JSON parameters if using a tool, or your response text if respondin
         
         # Update state
         updates = {
+            **folded,
             "messages": state["messages"] + [AIMessage(content=f"THOUGHT: {thought}")],
         }
         
@@ -225,6 +238,10 @@ TOOL_INPUT: [JSON parameters if using a tool, or your response text if respondin
             updates["next_action"] = "act"
             updates["selected_tool"] = action
             updates["tool_input"] = tool_input
+            
+            # Several independent calls are fanned out to parallel act branches
+            tool_calls = self._parse_tool_calls(response_text)
+            updates["pending_tool_calls"] = tool_calls if len(tool_calls) > 1 else None
         
         # Clear guidance after it's been consumed
         if state.get("guidance"):
@@ -232,16 +249,65 @@ TOOL_INPUT: [JSON parameters if using a tool, or your response text if respondin
         
         return updates
     
+    async def _reason(self, messages: List, ensemble_size: int = 1) -> str:
+        """
+        Query the LLM for the next thought.
+        
+        With ``ensemble_size > 1`` several candidates are requested
+        concurrently at temperatures spread across
+        ENSEMBLE_MIN_TEMPERATURE..ENSEMBLE_MAX_TEMPERATURE, and the action
+        most candidates agree on wins (ties go to the lowest temperature).
+        Wall time stays close to a single call.
+        
+        Returns:
+            Raw text of the selected response
+        """
+        if ensemble_size <= 1:
+            response = await self.llm.ainvoke(messages)
+            return response.content
+        
+        step = (ENSEMBLE_MAX_TEMPERATURE - ENSEMBLE_MIN_TEMPERATURE) / (ensemble_size - 1)
+        temperatures = [
+            round(ENSEMBLE_MIN_TEMPERATURE + i * step, 2) for i in range(ensemble_size)
+        ]
+        responses = await asyncio.gather(
+            *(self.llm.ainvoke(messages, temperature=t) for t in temperatures)
+        )
+        candidates = [response.content for response in responses]
+        
+        actions = [self._parse_llm_response(text)[1] for text in candidates]
+        best_action, votes = Counter(actions).most_common(1)[0]
+        logger.info(f"Ensemble of {ensemble_size} voted '{best_action}' ({votes} votes)")
+        return candidates[actions.index(best_action)]
+    
     async def act(self, state: AgentState) -> Dict[str, Any]:
         """
         ACT node: Execute the selected tool.
         
         Takes the tool selection from the think node and executes it.
         Includes structured error handling with recovery suggestions.
+        The tool output is appended to the conversation here, so control
+        returns straight to think.
+        
+        When invoked as a parallel branch (via ``Send``) the state carries a
+        single ``tool_call``; its result is reported through the
+        ``observations`` channel so concurrent branches merge cleanly.
         
         Returns:
-            Updated state with tool outputs and next_action set to "observe"
+            Updated state with tool outputs and next_action set to "think"
         """
+        current_phase = state.get("current_phase", Phase.INFORMATIONAL)
+        
+        tool_call = state.get("tool_call")
+        if tool_call is not None:
+            tool_name = tool_call["tool"]
+            tool, error = self._resolve_tool(tool_name, current_phase)
+            if error is None:
+                output = await self._execute_tool(tool_name, tool, tool_call.get("input", {}))
+            else:
+                output = error
+            return {"observations": [{"tool": tool_name, "output": output}]}
+        
         tool_name = state.get("selected_tool")
         tool_input = state.get("tool_input", {})
         
@@ -251,33 +317,57 @@ TOOL_INPUT: [JSON parameters if using a tool, or your response text if respondin
                 "observation": "No tool was selected. Let me think again."
             }
         
-        # Get tool from registry
+        tool, error = self._resolve_tool(tool_name, current_phase)
+        if error is not None:
+            return {
+                "next_action": "think",
+                "observation": error,
+            }
+        
+        output = await self._execute_tool(tool_name, tool, tool_input)
+        
+        # Store tool output
+        tool_outputs = state.get("tool_outputs", {})
+        tool_outputs[tool_name] = output
+        
+        return {
+            "messages": state["messages"] + [
+                AIMessage(content=f"Tool output: {output}")
+            ],
+            "tool_outputs": tool_outputs,
+            "observation": output,
+            "next_action": "think"
+        }
+    
+    def _resolve_tool(self, tool_name: str, current_phase: Phase) -> tuple:
+        """
+        Look up a tool in the registry and check it is allowed in the phase.
+        
+        Returns:
+            (tool, None) on success, or (None, error_observation)
+        """
         from ..tools.tool_registry import get_global_registry
         
         registry = get_global_registry()
-        current_phase = state.get("current_phase", Phase.INFORMATIONAL)
         
-        # Check if tool is allowed in current phase
-        if not registry.is_tool_allowed(tool_name, current_phase):
-            return {
-                "next_action": "think",
-                "observation": (
-                    f"Tool '{tool_name}' is not available in {current_phase.value} phase. "
-                    f"Available tools: {', '.join(registry.get_tools_for_phase(current_phase).keys())}"
-                )
-            }
+        # Single name lookup in the tools allowed for the current phase
+        phase_tools = registry.get_tools_for_phase(current_phase)
+        tool = phase_tools.get(tool_name)
+        if tool is None:
+            return None, (
+                f"Tool '{tool_name}' is not available in {current_phase.value} phase. "
+                f"Available tools: {', '.join(phase_tools.keys())}"
+            )
         
-        tool = registry.get_tool(tool_name)
-        if not tool:
-            available = registry.list_all_tools()
-            return {
-                "next_action": "think",
-                "observation": (
-                    f"Unknown tool: {tool_name}. "
-                    f"Available tools: {', '.join(available)}"
-                )
-            }
+        return tool, None
+    
+    async def _execute_tool(self, tool_name: str, tool: Any, tool_input: Any) -> str:
+        """
+        Execute a resolved tool, converting failures into an observation string.
         
+        Returns:
+            Truncated tool output, or an error message with a recovery hint
+        """
         # Ensure tool_input is a dict for **kwargs unpacking
         if not isinstance(tool_input, dict):
             logger.warning(
@@ -305,36 +395,55 @@ TOOL_INPUT: [JSON parameters if using a tool, or your response text if respondin
             output = error_msg + self._get_error_recovery_hint(str(e))
             logger.error(error_msg, exc_info=True)
         
-        # Store tool output
-        tool_outputs = state.get("tool_outputs", {})
-        tool_outputs[tool_name] = output
-        
-        return {
-            "tool_outputs": tool_outputs,
-            "observation": output,
-            "next_action": "observe"
-        }
+        return output
     
-    async def observe(self, state: AgentState) -> Dict[str, Any]:
+    def _fold_observations(self, state: AgentState) -> Dict[str, Any]:
         """
-        OBSERVE node: Process tool output and decide next step.
-        
-        Analyzes the tool output and updates the agent's understanding.
+        Merge the results of parallel tool calls into the conversation.
         
         Returns:
-            Updated state with next_action set to "think" (continue loop)
+            State updates with the combined tool output appended to messages,
+            ``tool_outputs`` updated and the ``observations`` channel cleared
         """
-        observation = state.get("observation", "")
-        
-        # Add observation to messages
-        updates = {
+        tool_outputs = dict(state.get("tool_outputs") or {})
+        parts = []
+        for obs in state["observations"]:
+            tool_outputs[obs["tool"]] = obs["output"]
+            parts.append(f"[{obs['tool']}] {obs['output']}")
+        observation = "\n\n".join(parts)
+        return {
             "messages": state["messages"] + [
                 AIMessage(content=f"Tool output: {observation}")
             ],
-            "next_action": "think",  # Continue the ReAct loop
+            "tool_outputs": tool_outputs,
+            "observation": observation,
+            "observations": None,
+            "pending_tool_calls": None,
         }
+    
+    def _parse_tool_calls(self, response: str) -> List[Dict[str, Any]]:
+        """
+        Extract every ACTION/TOOL_INPUT pair from an LLM response.
         
-        return updates
+        Each ACTION line starts a new block which is parsed with
+        _parse_llm_response; "respond" actions are skipped.
+        
+        Returns:
+            List of {"tool": name, "input": parameters} dicts
+        """
+        blocks: List[List[str]] = []
+        for line in response.strip().split("\n"):
+            if line.strip().startswith("ACTION:"):
+                blocks.append([])
+            if blocks:
+                blocks[-1].append(line)
+        
+        calls = []
+        for block in blocks:
+            _, action, tool_input = self._parse_llm_response("\n".join(block))
+            if action != "respond":
+                calls.append({"tool": action, "input": tool_input})
+        return calls
     
     def _parse_llm_response(self, response: str) -> tuple:
         """
@@ -1,5 +1,5 @@
 """Agent prompts"""
 
-from .system_prompts import get_system_prompt
+from .system_prompts import get_system_prompt, get_system_message
 
-__all__ = ["get_system_prompt"]
+__all__ = ["get_system_prompt", "get_system_message"]
@@ -5,6 +5,10 @@ These prompts guide the agent's behavior in each phase of penetration testing.
 Enhanced with chain-of-thought reasoning, structured analysis, and error recovery.
 """
 
+from types import MappingProxyType
+
+from langchain_core.messages import SystemMessage
+
 INFORMATIONAL_PHASE_PROMPT = """You are an expert penetration testing AI agent in the INFORMATIONAL phase.
 
 Your goal is to gather as much information as possible about the target system without triggering alerts.
@@ -188,6 +192,15 @@ Provide a clear, structured summary of the engagement:
 Be professional, thorough, and actionable in your summary."""
 
 
+# Phase value -> prompt, built once at import
+_PROMPTS = MappingProxyType({
+    "informational": INFORMATIONAL_PHASE_PROMPT,
+    "exploitation": EXPLOITATION_PHASE_PROMPT,
+    "post_exploitation": POST_EXPLOITATION_PHASE_PROMPT,
+    "complete": COMPLETE_PHASE_PROMPT,
+})
+
+
 def get_system_prompt(phase: str) -> str:
     """
     Get the system prompt for a specific phase.
@@ -198,14 +211,24 @@ def get_system_prompt(phase: str) -> str:
     Returns:
         System prompt string
     """
-    # Handle both string and Phase enum values
-    phase_key = phase.value if hasattr(phase, 'value') else phase
-
-    prompts = {
-        "informational": INFORMATIONAL_PHASE_PROMPT,
-        "exploitation": EXPLOITATION_PHASE_PROMPT,
-        "post_exploitation": POST_EXPLOITATION_PHASE_PROMPT,
-        "complete": COMPLETE_PHASE_PROMPT,
-    }
+    # Phase is a str enum, so members hash and compare like their values
+    return _PROMPTS.get(phase, INFORMATIONAL_PHASE_PROMPT)
+
+
+# Phase value -> prebuilt system message, shared by every think step
+_SYSTEM_MESSAGES = MappingProxyType({
+    phase: SystemMessage(content=prompt) for phase, prompt in _PROMPTS.items()
+})
+
+
+def get_system_message(phase: str) -> SystemMessage:
+    """
+    Get the prebuilt system message for a specific phase.
     
-    return prompts.get(phase_key, INFORMATIONAL_PHASE_PROMPT)
+    Args:
+        phase: The operational phase (string or Phase enum value)
+        
+    Returns:
+        SystemMessage wrapping the phase prompt (shared; do not mutate)
+    """
+    return _SYSTEM_MESSAGES.get(phase, _SYSTEM_MESSAGES["informational"])
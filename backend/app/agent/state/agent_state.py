@@ -5,7 +5,7 @@ Defines the state structure for the LangGraph agent using TypedDict.
 """
 
 from enum import Enum
-from typing import TypedDict, List, Dict, Any, Optional
+from typing import TypedDict, Annotated, List, Dict, Any, Optional
 from langchain_core.messages import BaseMessage
 
 
@@ -17,6 +17,21 @@ class Phase(str, Enum):
     COMPLETE = "complete"
 
 
+def merge_observations(
+    left: Optional[List[Dict[str, Any]]],
+    right: Optional[List[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """
+    Reducer for the ``observations`` channel.
+
+    Parallel ``act`` branches append their results; writing ``None`` clears
+    the channel once the think node has folded them into the conversation.
+    """
+    if right is None:
+        return []
+    return (left or []) + right
+
+
 class AgentState(TypedDict):
     """
     State structure for the LangGraph agent.
@@ -38,7 +53,7 @@ class AgentState(TypedDict):
     # Session tracking
     thread_id: str
     
-    # Agent's next action (think, act, observe, end)
+    # Agent's next action (think, act, approval, end)
     next_action: str
     
     # Tool to execute (populated by think node)
@@ -50,6 +65,15 @@ class AgentState(TypedDict):
     # Observation from tool execution
     observation: Optional[str]
     
+    # Independent tool calls proposed in one think step (fanned out in parallel)
+    pending_tool_calls: Optional[List[Dict[str, Any]]]
+    
+    # Results from parallel tool calls, merged by the reducer
+    observations: Annotated[List[Dict[str, Any]], merge_observations]
+    
+    # Number of candidate thoughts sampled concurrently per think step (1 = single call)
+    ensemble_size: int
+    
     # Stop flag
     should_stop: bool
     
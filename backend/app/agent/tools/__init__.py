@@ -1,6 +1,6 @@
 """Agent tools"""
 
-from .base_tool import BaseTool, ToolMetadata
+from .base_tool import BaseTool, ToolMetadata, ToolProtocol
 from .error_handling import (
     ToolExecutionError,
     ToolTimeoutError,
@@ -16,8 +16,8 @@ from .error_handling import (
     with_error_context,
     with_retry,
 )
-from .echo_tool import EchoTool
-from .calculator_tool import CalculatorTool
+from .echo_tool import EchoTool, ECHO_TOOL
+from .calculator_tool import CalculatorTool, CALCULATOR_TOOL
 from .query_graph_tool import QueryGraphTool
 from .web_search_tool import WebSearchTool
 from .mcp_tools import NaabuTool, CurlTool, NucleiTool, MetasploitTool
@@ -48,6 +48,7 @@ __all__ = [
     # Base
     "BaseTool",
     "ToolMetadata",
+    "ToolProtocol",
     # Error handling (Day 98)
     "ToolExecutionError",
     "ToolTimeoutError",
@@ -64,7 +65,9 @@ __all__ = [
     "with_retry",
     # Core tools
     "EchoTool",
+    "ECHO_TOOL",
     "CalculatorTool",
+    "CALCULATOR_TOOL",
     "QueryGraphTool",
     "WebSearchTool",
     "NaabuTool",
@@ -1,38 +1,67 @@
 """
-Base Tool Abstract Class
+Base Tool Class
 
 Defines the interface for all tools that can be used by the agent.
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Any, Optional, Protocol, runtime_checkable
+import orjson
+from langchain_core.tools import StructuredTool
 
 
-class ToolMetadata(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ToolMetadata:
     """Metadata for a tool"""
-    name: str = Field(..., description="Tool name")
-    description: str = Field(..., description="What the tool does")
-    parameters: Dict[str, Any] = Field(default_factory=dict, description="Tool parameter schema")
+    name: str  # Tool name
+    description: str  # What the tool does
+    parameters: Dict[str, Any] = field(default_factory=dict)  # Tool parameter schema
+    # Parameter schema serialized once, reused in every prompt / tool spec
+    parameters_json: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "parameters_json", orjson.dumps(self.parameters).decode())
+
 
+@runtime_checkable
+class ToolProtocol(Protocol):
+    """Structural interface the agent relies on when dispatching a tool"""
+    name: str
+    description: str
+    
+    async def execute(self, **kwargs) -> str:
+        ...
 
-class BaseTool(ABC):
+
+class BaseTool:
     """
-    Abstract base class for all agent tools.
+    Base class for all agent tools.
     
     Tools are functions that the agent can invoke to interact with
     the environment (scan networks, exploit vulnerabilities, etc.)
+    
+    This is a plain class rather than an ABC: subclasses are checked once
+    at definition time for the required overrides, so instantiation and
+    isinstance checks carry no ABCMeta overhead.
     """
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        missing = [
+            attr for attr in ("_define_metadata", "execute")
+            if getattr(cls, attr) is getattr(BaseTool, attr)
+        ]
+        if missing:
+            raise TypeError(f"{cls.__name__} must implement {', '.join(missing)}")
+    
     def __init__(self):
         self._metadata = self._define_metadata()
     
-    @abstractmethod
     def _define_metadata(self) -> ToolMetadata:
         """Define tool metadata (name, description, parameters)"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     async def execute(self, **kwargs) -> str:
         """
         Execute the tool with given parameters.
@@ -40,7 +69,7 @@ class BaseTool(ABC):
         Returns:
             str: Tool output as a string (will be truncated if too long)
         """
-        pass
+        raise NotImplementedError
     
     @property
     def metadata(self) -> ToolMetadata:
@@ -57,12 +86,20 @@ class BaseTool(ABC):
         """Get tool description"""
         return self._metadata.description
     
-    def to_langchain_tool(self):
-        """Convert to LangChain tool format"""
-        from langchain_core.tools import StructuredTool
-        
+    @property
+    def parameters_schema_json(self) -> str:
+        """Tool parameter schema as a pre-serialized JSON string"""
+        return self._metadata.parameters_json
+    
+    @cached_property
+    def langchain_tool(self) -> StructuredTool:
+        """LangChain tool wrapper, built once per tool instance"""
         return StructuredTool.from_function(
             func=self.execute,
             name=self.name,
             description=self.description,
         )
+    
+    def to_langchain_tool(self) -> StructuredTool:
+        """Convert to LangChain tool format"""
+        return self.langchain_tool
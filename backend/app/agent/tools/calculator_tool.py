@@ -4,9 +4,19 @@ Mock Calculator Tool
 Simple calculator tool for testing agent math operations.
 """
 
+import operator
+
 from .base_tool import BaseTool, ToolMetadata
 from .error_handling import with_timeout, ToolExecutionError
 
+# Operation name -> implementation
+_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+
 
 class CalculatorTool(BaseTool):
     """Calculator tool for basic arithmetic"""
@@ -39,20 +49,19 @@ class CalculatorTool(BaseTool):
     @with_timeout(timeout_seconds=5)
     async def execute(self, operation: str, a: float, b: float, **kwargs) -> str:
         """Perform arithmetic operation"""
+        op = _OPS.get(operation)
+        if op is None:
+            raise ToolExecutionError(f"Calculator error: Unknown operation: {operation}")
+        if b == 0 and op is operator.truediv:
+            raise ToolExecutionError("Calculator error: Cannot divide by zero")
+        
         try:
-            if operation == "add":
-                result = a + b
-            elif operation == "subtract":
-                result = a - b
-            elif operation == "multiply":
-                result = a * b
-            elif operation == "divide":
-                if b == 0:
-                    raise ToolExecutionError("Cannot divide by zero")
-                result = a / b
-            else:
-                raise ToolExecutionError(f"Unknown operation: {operation}")
-            
-            return f"Result: {a} {operation} {b} = {result}"
-        except Exception as e:
+            result = op(a, b)
+        except (ArithmeticError, TypeError) as e:
             raise ToolExecutionError(f"Calculator error: {str(e)}")
+        
+        return f"Result: {a} {operation} {b} = {result}"
+
+
+# Shared stateless instance; use this instead of constructing per registry
+CALCULATOR_TOOL = CalculatorTool()
@@ -31,3 +31,7 @@ class EchoTool(BaseTool):
     async def execute(self, message: str, **kwargs) -> str:
         """Echo the message back"""
         return f"Echo: {message}"
+
+
+# Shared stateless instance; use this instead of constructing per registry
+ECHO_TOOL = EchoTool()
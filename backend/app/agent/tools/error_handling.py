@@ -14,8 +14,8 @@ Day 98 additions:
 import asyncio
 import logging
 from enum import Enum
-from functools import wraps
-from typing import Callable, Any, Dict, List, Optional, Type
+from functools import lru_cache, wraps
+from typing import Callable, Any, Dict, List, Optional, Tuple, Type
 
 logger = logging.getLogger(__name__)
 
@@ -254,18 +254,22 @@ def with_timeout(timeout_seconds: int = 300):
     """
     Decorator to add timeout to tool execution.
     
+    Uses ``asyncio.timeout`` so no extra wrapping task is scheduled per call.
+    
     Args:
-        timeout_seconds: Maximum execution time in seconds (default: 5 minutes)
+        timeout_seconds: Maximum execution time in seconds (default: 5 minutes).
+            ``None`` or a non-positive value disables the timeout.
     """
     def decorator(func: Callable) -> Callable:
+        if not timeout_seconds or timeout_seconds <= 0:
+            return func
+        
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
             try:
-                return await asyncio.wait_for(
-                    func(*args, **kwargs),
-                    timeout=timeout_seconds
-                )
-            except asyncio.TimeoutError:
+                async with asyncio.timeout(timeout_seconds):
+                    return await func(*args, **kwargs)
+            except TimeoutError:
                 raise ToolTimeoutError(
                     f"Tool execution timed out after {timeout_seconds} seconds",
                     timeout_seconds=timeout_seconds
@@ -386,6 +390,12 @@ def with_retry(
     return decorator
 
 
+@lru_cache(maxsize=32)
+def _truncation_bounds(max_chars: int) -> Tuple[int, int]:
+    """Head/tail lengths kept by truncate_output (first 80%, last 10%)."""
+    return int(max_chars * 0.8), int(max_chars * 0.1)
+
+
 def truncate_output(output: str, max_chars: int = 5000) -> str:
     """
     Truncate tool output to prevent overwhelming the LLM context.
@@ -397,16 +407,16 @@ def truncate_output(output: str, max_chars: int = 5000) -> str:
     Returns:
         Truncated output with indicator if truncated
     """
-    if len(output) <= max_chars:
+    length = len(output)
+    if length <= max_chars:
         return output
     
     # Keep first 80% and last 10% of allowed chars
-    first_part_len = int(max_chars * 0.8)
-    last_part_len = int(max_chars * 0.1)
-    
-    first_part = output[:first_part_len]
-    last_part = output[-last_part_len:]
+    first_part_len, last_part_len = _truncation_bounds(max_chars)
     
-    truncation_msg = f"\n\n... [Output truncated: {len(output) - max_chars} chars omitted] ...\n\n"
-    
-    return first_part + truncation_msg + last_part
+    # Slice from an absolute index: output[-0:] would keep the whole string
+    return (
+        f"{output[:first_part_len]}"
+        f"\n\n... [Output truncated: {length - max_chars} chars omitted] ...\n\n"
+        f"{output[length - last_part_len:]}"
+    )
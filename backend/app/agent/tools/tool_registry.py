@@ -4,13 +4,16 @@ Tool Registry System
 Manages dynamic tool loading and phase-based access control.
 """
 
-from typing import Dict, List, Optional, Type
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Type
 from app.agent.tools.base_tool import BaseTool
 from app.agent.state.agent_state import Phase
 import logging
 
 logger = logging.getLogger(__name__)
 
+_ALL_PHASES: FrozenSet[Phase] = frozenset(Phase)
+
 
 class ToolRegistry:
     """
@@ -20,8 +23,11 @@ class ToolRegistry:
     def __init__(self):
         """Initialize tool registry"""
         self._tools: Dict[str, BaseTool] = {}
-        self._tool_phases: Dict[str, List[Phase]] = {}
+        # Allowed phases per tool, as sets so phase checks are a hash lookup
+        self._tool_phases: Dict[str, FrozenSet[Phase]] = {}
         self._tool_classes: Dict[str, Type[BaseTool]] = {}
+        # Per-phase name -> tool views, built on first use and dropped on mutation
+        self._phase_tools: Dict[Phase, Mapping[str, BaseTool]] = {}
     
     def register_tool(
         self, 
@@ -37,10 +43,11 @@ class ToolRegistry:
         """
         tool_name = tool.name
         self._tools[tool_name] = tool
-        self._tool_phases[tool_name] = allowed_phases or list(Phase)
+        self._tool_phases[tool_name] = frozenset(allowed_phases) if allowed_phases else _ALL_PHASES
         self._tool_classes[tool_name] = type(tool)
+        self._phase_tools.clear()
         
-        logger.info(f"Registered tool '{tool_name}' for phases: {[p.value for p in self._tool_phases[tool_name]]}")
+        logger.info(f"Registered tool '{tool_name}' for phases: {self._phase_values(tool_name)}")
     
     def unregister_tool(self, tool_name: str):
         """
@@ -53,6 +60,7 @@ class ToolRegistry:
             del self._tools[tool_name]
             del self._tool_phases[tool_name]
             del self._tool_classes[tool_name]
+            self._phase_tools.clear()
             logger.info(f"Unregistered tool '{tool_name}'")
     
     def get_tool(self, tool_name: str) -> Optional[BaseTool]:
@@ -67,22 +75,27 @@ class ToolRegistry:
         """
         return self._tools.get(tool_name)
     
-    def get_tools_for_phase(self, phase: Phase) -> Dict[str, BaseTool]:
+    def get_tools_for_phase(self, phase: Phase) -> Mapping[str, BaseTool]:
         """
         Get all tools available for a specific phase.
         
+        The mapping is computed once per phase and reused until a tool is
+        registered or unregistered, so per-step lookups are O(1).
+        
         Args:
             phase: Current agent phase
             
         Returns:
-            Dictionary of tool name -> tool instance
+            Read-only mapping of tool name -> tool instance
         """
-        available_tools = {}
-        
-        for tool_name, tool in self._tools.items():
-            allowed_phases = self._tool_phases.get(tool_name, [])
-            if phase in allowed_phases:
-                available_tools[tool_name] = tool
+        available_tools = self._phase_tools.get(phase)
+        if available_tools is None:
+            available_tools = MappingProxyType({
+                tool_name: tool
+                for tool_name, tool in self._tools.items()
+                if phase in self._tool_phases[tool_name]
+            })
+            self._phase_tools[phase] = available_tools
         
         return available_tools
     
@@ -97,11 +110,8 @@ class ToolRegistry:
         Returns:
             True if tool is allowed
         """
-        if tool_name not in self._tool_phases:
-            return False
-        
-        allowed_phases = self._tool_phases[tool_name]
-        return phase in allowed_phases
+        allowed_phases = self._tool_phases.get(tool_name)
+        return allowed_phases is not None and phase in allowed_phases
     
     def list_all_tools(self) -> List[str]:
         """
@@ -128,10 +138,15 @@ class ToolRegistry:
                 "name": tool.name,
                 "description": tool.description,
                 "parameters": tool.metadata.parameters,
-                "allowed_phases": [p.value for p in self._tool_phases.get(tool_name, [])]
+                "allowed_phases": self._phase_values(tool_name)
             }
         return None
     
+    def _phase_values(self, tool_name: str) -> List[str]:
+        """Allowed phase values for a tool, in Phase declaration order"""
+        allowed_phases = self._tool_phases.get(tool_name, frozenset())
+        return [p.value for p in Phase if p in allowed_phases]
+    
     def get_all_tool_metadata(self, phase: Optional[Phase] = None) -> List[Dict]:
         """
         Get metadata for all tools, optionally filtered by phase.
@@ -161,8 +176,8 @@ def create_default_registry() -> ToolRegistry:
         Configured ToolRegistry instance
     """
     from app.agent.tools import (
-        EchoTool, 
-        CalculatorTool, 
+        ECHO_TOOL,
+        CALCULATOR_TOOL,
         QueryGraphTool, 
         WebSearchTool,
         NaabuTool,
@@ -181,12 +196,12 @@ def create_default_registry() -> ToolRegistry:
     
     # Development/testing tools (all phases)
     registry.register_tool(
-        EchoTool(),
+        ECHO_TOOL,
         allowed_phases=list(Phase)
     )
     
     registry.register_tool(
-        CalculatorTool(),
+        CALCULATOR_TOOL,
         allowed_phases=list(Phase)
     )
     
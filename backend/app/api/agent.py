@@ -6,12 +6,14 @@ Provides REST and WebSocket endpoints for agent interactions.
 
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Depends
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Any, Tuple
 import logging
 import uuid
 import json
+import orjson
 
 from ..agent import Agent, Phase
+from ..utils.ttl_cache import TTLCache
 from ..websocket.manager import get_connection_manager, ConnectionManager
 
 logger = logging.getLogger(__name__)
@@ -90,8 +92,37 @@ class ApproveResponse(BaseModel):
     status: str = Field(..., description="Approval status")
 
 
-# Global agent instances (keyed by thread_id)
-active_agents: Dict[str, Agent] = {}
+# Threads seen by this process (keyed by thread_id). Bounded LRU with an idle
+# TTL; evicted threads keep their state in the checkpointer and are simply
+# re-registered on their next message.
+ACTIVE_THREADS_MAX = 1024
+ACTIVE_THREADS_TTL_SECONDS = 1800
+active_agents: TTLCache[str, Agent] = TTLCache(
+    maxsize=ACTIVE_THREADS_MAX, ttl_seconds=ACTIVE_THREADS_TTL_SECONDS
+)
+
+# Shared agent instances (keyed by (model_provider, model_name)); conversation
+# state is isolated per thread by the graph checkpointer, not by the Agent.
+# The pair comes from the request, so the registry is bounded like the
+# compiled-graph cache behind it; an evicted pair is rebuilt on next use.
+AGENT_MODELS_MAX = 16
+_agents: TTLCache[Tuple[str, str], Agent] = TTLCache(
+    maxsize=AGENT_MODELS_MAX, ttl_seconds=ACTIVE_THREADS_TTL_SECONDS
+)
+
+
+def _get_agent(model_provider: str, model_name: str) -> Agent:
+    """Return the shared Agent for a provider/model pair, creating it once."""
+    key = (model_provider, model_name)
+    agent = _agents.get(key)
+    if agent is None:
+        agent = Agent(
+            model_provider=model_provider,
+            model_name=model_name,
+            enable_memory=True
+        )
+        _agents[key] = agent
+    return agent
 
 
 @router.get("/status", response_model=AgentStatus)
@@ -117,17 +148,11 @@ async def chat_with_agent(request: ChatRequest):
     For streaming responses, use the WebSocket endpoint.
     """
     try:
-        # Get or create agent for this thread
+        # Resolve thread and shared agent for the requested model
         thread_id = request.thread_id or str(uuid.uuid4())
         
-        if thread_id not in active_agents:
-            active_agents[thread_id] = Agent(
-                model_provider=request.model_provider,
-                model_name=request.model_name,
-                enable_memory=True
-            )
-        
-        agent = active_agents[thread_id]
+        agent = _get_agent(request.model_provider, request.model_name)
+        active_agents[thread_id] = agent
         
         # Chat with agent
         result = await agent.chat(
@@ -313,15 +338,9 @@ async def agent_websocket(
                 model_provider = data.get("model_provider", "openai")
                 model_name = data.get("model_name", "gpt-4")
                 
-                # Get or create agent
-                if thread_id not in active_agents:
-                    active_agents[thread_id] = Agent(
-                        model_provider=model_provider,
-                        model_name=model_name,
-                        enable_memory=True
-                    )
-                
-                agent = active_agents[thread_id]
+                # Get shared agent for this model
+                agent = _get_agent(model_provider, model_name)
+                active_agents[thread_id] = agent
                 
                 # Stream agent's response
                 try:
@@ -330,17 +349,15 @@ async def agent_websocket(
                         thread_id=thread_id
                     ):
                         # Send each state update to client
-                        await websocket.send_json({
+                        node, update = next(iter(chunk.items())) if chunk else ("unknown", {})
+                        await websocket.send_text(orjson.dumps({
                             "type": "agent_update",
                             "thread_id": thread_id,
                             "data": {
-                                "node": list(chunk.keys())[0] if chunk else "unknown",
-                                "state_update": {
-                                    k: str(v) if not isinstance(v, (dict, list, str, int, float, bool, type(None))) else v
-                                    for k, v in (list(chunk.values())[0] if chunk else {}).items()
-                                }
+                                "node": node,
+                                "state_update": update or {},
                             }
-                        })
+                        }, default=str).decode())
                     
                     # Send completion message
                     await websocket.send_json({
@@ -17,7 +17,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.core.audit import AuditAction, log_audit
-from app.core.security import decode_token
+from app.core.security import verify_token
 from app.db.prisma_client import get_prisma
 from app.schemas import Message, Token, UserCreate, UserLogin, UserResponse
 from app.services.auth_service import AuthService
@@ -49,7 +49,7 @@ async def get_current_user_id(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
 ) -> str:
     """Extract and validate the bearer token; return the subject (user_id)."""
-    payload = decode_token(credentials.credentials)
+    payload = verify_token(credentials.credentials)
     user_id: str | None = payload.get("sub")
     if not user_id:
         raise HTTPException(
@@ -9,34 +9,94 @@ REST API for web crawling and URL discovery:
 """
 from __future__ import annotations
 
+import asyncio
+import bisect
+import hashlib
 import logging
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import BaseModel, Field, TypeAdapter, computed_field
 
+from app.core import background, taskstore
 from app.core.security import get_current_user
+from app.recon.canonical_schemas import Endpoint
 from app.recon.resource_enum.katana_orchestrator import KatanaConfig, KatanaOrchestrator
 from app.recon.resource_enum.gau_orchestrator import GAUConfig, GAUOrchestrator
 from app.recon.resource_enum.kiterunner_orchestrator import KiterunnerConfig, KiterunnerOrchestrator
 from app.recon.resource_enum.url_merger import URLMerger
+from app.utils.etag import not_modified, not_modified_response, weak_etag
+from app.utils.timestamps import ms_to_iso, now_ms
+from app.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/discovery/urls", tags=["url-discovery"])
 
 # ---------------------------------------------------------------------------
-# In-memory task store
-# NOTE: This is a temporary in-process store for Phase A.
-# All task data is lost on application restart.
-# This will be replaced with a persistent database store in Phase B.
+# Task store keys
+# Task fields live in the hash ``disc:{id}``; merged endpoints are kept in the
+# list ``disc:{id}:result`` so status polls never load the result payload.
 # ---------------------------------------------------------------------------
-_tasks: Dict[str, Dict[str, Any]] = {}
-logger.warning(
-    "discovery_urls: using in-memory task store — all tasks will be lost on restart. "
-    "Replace with a persistent store before production deployment."
+
+def _task_key(task_id: str) -> str:
+    return f"disc:{task_id}"
+
+
+def _result_key(task_id: str) -> str:
+    return f"disc:{task_id}:result"
+
+
+# Task records and results expire this long after their last update
+DISCOVERY_TASK_TTL_SECONDS = 86400
+
+
+async def _finish(task_id: str, fields: Dict[str, Any]) -> None:
+    """Write a final status and start the record's (and results') TTL."""
+    key = _task_key(task_id)
+    await taskstore.hset_task(key, {**fields, "updated_at": now_ms()})
+    await taskstore.expire_task(key, DISCOVERY_TASK_TTL_SECONDS)
+    await taskstore.expire_task(_result_key(task_id), DISCOVERY_TASK_TTL_SECONDS)
+
+
+# Runs started by this process that may still be in flight, keyed by a hash
+# of (user, request); identical requests are coalesced onto the running task
+_inflight: Dict[str, str] = {}
+
+
+def _request_hash(user_id: Optional[str], req: URLDiscoveryCreateRequest) -> str:
+    payload = {"user_id": user_id, "request": req.model_dump(mode="json")}
+    return hashlib.blake2b(
+        orjson.dumps(payload, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+
+
+def _release_inflight(req_hash: str, task_id: str) -> None:
+    if _inflight.get(req_hash) == task_id:
+        del _inflight[req_hash]
+
+
+# Task fields returned by status polls (never the result index)
+_STATUS_FIELDS = (
+    "user_id", "status", "targets", "tools", "created_at", "updated_at", "errors", "stats",
+)
+
+
+# Encoded unfiltered result responses.  A completed task never changes, so
+# repeated polls for the full result set reuse the bytes instead of reloading
+# and re-encoding every endpoint.  Bounded by total bytes as well as entries;
+# a payload larger than the whole budget is simply not cached.
+RESULTS_CACHE_MAX = 64
+RESULTS_CACHE_MAX_BYTES = 32 * 1024 * 1024
+RESULTS_CACHE_TTL_SECONDS = 600
+_results_cache: TTLCache[str, bytes] = TTLCache(
+    maxsize=RESULTS_CACHE_MAX,
+    ttl_seconds=RESULTS_CACHE_TTL_SECONDS,
+    maxweight=RESULTS_CACHE_MAX_BYTES,
+    weigh=len,
 )
 
 
@@ -74,75 +134,162 @@ class URLDiscoveryCreateRequest(BaseModel):
     )
     kr_threads: int = Field(10, ge=1, le=50)
 
+    @computed_field
+    @cached_property
+    def enabled_tools(self) -> Tuple[str, ...]:
+        """Names of the selected tools, in run order."""
+        return tuple(
+            name
+            for name, on in (
+                ("katana", self.use_katana),
+                ("gau", self.use_gau),
+                ("kiterunner", self.use_kiterunner),
+            )
+            if on
+        )
+
+
+# ---------------------------------------------------------------------------
+# Result index
+# ---------------------------------------------------------------------------
+
+# One compiled serializer for the whole merged list instead of a
+# model_dump() call per endpoint
+_ENDPOINT_LIST_ADAPTER = TypeAdapter(List[Endpoint])
+
+
+def _build_result_index(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Index serialised endpoints by category, source and confidence.
+
+    Built once when a run completes so filtered result fetches only touch
+    the matching positions instead of rescanning every endpoint per poll.
+    Confidence entries are ``[confidence, position]`` pairs sorted ascending.
+    """
+    by_category: Dict[str, List[int]] = {}
+    by_source: Dict[str, List[int]] = {}
+    confidences: List[List[Any]] = []
+
+    for idx, r in enumerate(results):
+        extra = r.get("extra") or {}
+        category = extra.get("category")
+        if category is not None:
+            by_category.setdefault(category, []).append(idx)
+        for src in extra.get("sources") or []:
+            by_source.setdefault(src, []).append(idx)
+        confidences.append([r.get("confidence") or 0.0, idx])
+
+    confidences.sort()
+    return {"category": by_category, "source": by_source, "confidence": confidences}
+
+
+def _filter_positions(
+    index: Dict[str, Any],
+    category: Optional[str],
+    source: Optional[str],
+    min_confidence: float,
+) -> List[int]:
+    """Return result positions matching every given filter, in result order."""
+    candidates: List[set] = []
+    if category:
+        candidates.append(set(index["category"].get(category, ())))
+    if source:
+        candidates.append(set(index["source"].get(source, ())))
+    if min_confidence > 0.0:
+        confidences = index["confidence"]
+        start = bisect.bisect_left(confidences, min_confidence, key=lambda pair: pair[0])
+        candidates.append({idx for _, idx in confidences[start:]})
+
+    candidates.sort(key=len)
+    return sorted(set.intersection(*candidates)) if candidates else []
+
 
 # ---------------------------------------------------------------------------
 # Background worker
 # ---------------------------------------------------------------------------
 
+async def _run_katana(req: URLDiscoveryCreateRequest) -> List[Endpoint]:
+    cfg = KatanaConfig(
+        depth=req.katana_depth,
+        max_urls=req.katana_max_urls,
+        js_crawl=req.katana_js,
+        rate_limit=req.katana_rate_limit,
+    )
+    results = await KatanaOrchestrator.crawl_targets(req.targets, config=cfg)
+    return [ep for r in results for ep in r.endpoints]
+
+
+async def _run_gau(req: URLDiscoveryCreateRequest) -> List[Endpoint]:
+    cfg = GAUConfig(providers=req.gau_providers, max_urls=req.gau_max_urls)
+    results = await GAUOrchestrator.fetch_targets(req.targets, config=cfg)
+    return [ep for r in results for ep in r.endpoints]
+
+
+async def _run_kiterunner(req: URLDiscoveryCreateRequest) -> List[Endpoint]:
+    cfg = KiterunnerConfig(
+        wordlists=req.kr_wordlists,
+        threads=req.kr_threads,
+    )
+    results = await KiterunnerOrchestrator.scan_targets(req.targets, config=cfg)
+    return [ep for r in results for ep in r.endpoints]
+
+
 async def _run_discovery(task_id: str, req: URLDiscoveryCreateRequest) -> None:
-    _tasks[task_id]["status"] = "running"
-    _tasks[task_id]["updated_at"] = datetime.utcnow().isoformat()
+    key = _task_key(task_id)
+    await taskstore.hset_task(key, {
+        "status": "running",
+        "updated_at": now_ms(),
+    })
 
     merger = URLMerger()
     errors: List[str] = []
 
     try:
-        # Katana
-        if req.use_katana:
+        # The tools share no data, so run them concurrently
+        runners = {
+            "katana": ("Katana", _run_katana),
+            "gau": ("GAU", _run_gau),
+            "kiterunner": ("Kiterunner", _run_kiterunner),
+        }
+        enabled = [(name, *runners[name]) for name in req.enabled_tools]
+
+        async def _collect(name: str, label: str, runner) -> None:
+            # Fold each tool's output into the merger as soon as it finishes,
+            # so its raw endpoint list is released before the others complete
             try:
-                cfg = KatanaConfig(
-                    depth=req.katana_depth,
-                    max_urls=req.katana_max_urls,
-                    js_crawl=req.katana_js,
-                    rate_limit=req.katana_rate_limit,
-                )
-                results = await KatanaOrchestrator.crawl_targets(req.targets, config=cfg)
-                for r in results:
-                    merger.add(r.endpoints, source="katana")
+                endpoints = await runner(req)
             except Exception as exc:
-                logger.warning("Katana failed: %s", exc)
-                errors.append(f"katana: {exc}")
+                logger.warning("%s failed: %s", label, exc)
+                errors.append(f"{name}: {exc}")
+                return
+            merger.add(endpoints, source=name)
 
-        # GAU
-        if req.use_gau:
-            try:
-                cfg = GAUConfig(providers=req.gau_providers, max_urls=req.gau_max_urls)
-                results = await GAUOrchestrator.fetch_targets(req.targets, config=cfg)
-                for r in results:
-                    merger.add(r.endpoints, source="gau")
-            except Exception as exc:
-                logger.warning("GAU failed: %s", exc)
-                errors.append(f"gau: {exc}")
-
-        # Kiterunner
-        if req.use_kiterunner:
-            try:
-                cfg = KiterunnerConfig(
-                    wordlists=req.kr_wordlists,
-                    threads=req.kr_threads,
-                )
-                results = await KiterunnerOrchestrator.scan_targets(req.targets, config=cfg)
-                for r in results:
-                    merger.add(r.endpoints, source="kiterunner")
-            except Exception as exc:
-                logger.warning("Kiterunner failed: %s", exc)
-                errors.append(f"kiterunner: {exc}")
+        await asyncio.gather(*(_collect(*tool) for tool in enabled))
 
         merged = merger.merge()
         stats = merger.stats()
-        serialised = [ep.model_dump(mode="json") for ep in merged]
-
-        _tasks[task_id]["status"] = "completed"
-        _tasks[task_id]["result"] = serialised
-        _tasks[task_id]["stats"] = stats
-        _tasks[task_id]["errors"] = errors
+        serialised = _ENDPOINT_LIST_ADAPTER.dump_python(merged, mode="json")
+
+        # Results are written before the status flips to "completed", and each
+        # status change is one hset, so readers can branch on status alone
+        # without a lock around the multi-field update.
+        await taskstore.rpush_items(_result_key(task_id), serialised)
+        await _finish(task_id, {
+            "status": "completed",
+            "stats": stats,
+            "errors": errors,
+            "result_index": _build_result_index(serialised),
+        })
+
+    except asyncio.CancelledError:
+        # e.g. shutdown: never leave pollers waiting on a "running" record
+        logger.warning("URL discovery task %s interrupted", task_id)
+        await _finish(task_id, {"status": "failed", "error": "Task interrupted"})
+        raise
 
     except Exception as exc:
         logger.error("URL discovery task %s failed: %s", task_id, exc)
-        _tasks[task_id]["status"] = "failed"
-        _tasks[task_id]["error"] = str(exc)
-    finally:
-        _tasks[task_id]["updated_at"] = datetime.utcnow().isoformat()
+        await _finish(task_id, {"status": "failed", "error": str(exc)})
 
 
 # ---------------------------------------------------------------------------
@@ -152,31 +299,55 @@ async def _run_discovery(task_id: str, req: URLDiscoveryCreateRequest) -> None:
 @router.post("", response_model=Dict[str, Any], status_code=202)
 async def start_url_discovery(
     req: URLDiscoveryCreateRequest,
-    background_tasks: BackgroundTasks,
     current_user: dict = Depends(get_current_user),
 ) -> Dict[str, Any]:
     """
     Start a URL discovery run using the selected tools.
 
-    Returns a ``task_id`` for polling status and results.
+    Returns a ``task_id`` for polling status and results.  An identical
+    request from the same user that is still pending or running is not
+    started again; its existing ``task_id`` is returned instead.
     """
-    task_id = str(uuid.uuid4())
-    tools = [t for t, en in [("katana", req.use_katana), ("gau", req.use_gau), ("kiterunner", req.use_kiterunner)] if en]
+    user_id = current_user.get("sub")
+    tools = list(req.enabled_tools)
+
+    req_hash = _request_hash(user_id, req)
+    inflight_id = _inflight.get(req_hash)
+    if inflight_id is not None:
+        inflight = await taskstore.hmget_task(_task_key(inflight_id), ("status",))
+        # None: registered, but its pending record is still being written
+        status = inflight["status"] or "pending"
+        if status in ("pending", "running"):
+            return {
+                "task_id": inflight_id,
+                "status": status,
+                "tools": tools,
+                "message": "Identical URL discovery already in progress",
+            }
 
-    _tasks[task_id] = {
-        "task_id": task_id,
-        "user_id": current_user.get("sub"),
-        "status": "pending",
-        "targets": req.targets,
-        "tools": tools,
-        "result": None,
-        "stats": None,
-        "errors": [],
-        "created_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat(),
-    }
-
-    background_tasks.add_task(_run_discovery, task_id, req)
+    task_id = str(uuid.uuid4())
+    # Registered before the first await so a duplicate arriving meanwhile
+    # joins this task instead of starting its own
+    _inflight[req_hash] = task_id
+    try:
+        await taskstore.hset_task(_task_key(task_id), {
+            "task_id": task_id,
+            "user_id": user_id,
+            "status": "pending",
+            "targets": req.targets,
+            "tools": tools,
+            "stats": None,
+            "errors": [],
+            "created_at": now_ms(),
+            "updated_at": now_ms(),
+        })
+        await taskstore.expire_task(_task_key(task_id), DISCOVERY_TASK_TTL_SECONDS)
+    except BaseException:
+        _release_inflight(req_hash, task_id)
+        raise
+
+    job = background.spawn(_run_discovery(task_id, req), name=_task_key(task_id))
+    job.add_done_callback(lambda _: _release_inflight(req_hash, task_id))
 
     return {
         "task_id": task_id,
@@ -189,24 +360,36 @@ async def start_url_discovery(
 @router.get("/{task_id}", response_model=Dict[str, Any])
 async def get_discovery_status(
     task_id: str,
+    request: Request,
+    response: Response,
     current_user: dict = Depends(get_current_user),
 ) -> Dict[str, Any]:
-    """Get status of a URL discovery task."""
-    task = _tasks.get(task_id)
-    if not task:
+    """
+    Get status of a URL discovery task.
+
+    Responses carry a weak ETag of the task's status and ``updated_at``;
+    polls sending it back in ``If-None-Match`` get ``304 Not Modified``.
+    """
+    task = await taskstore.hmget_task(_task_key(task_id), _STATUS_FIELDS)
+    if task["status"] is None:
         raise HTTPException(status_code=404, detail="Task not found")
     if task["user_id"] != current_user.get("sub"):
         raise HTTPException(status_code=403, detail="Not authorised to access this task")
 
+    etag = weak_etag(task["status"], task["updated_at"])
+    if not_modified(request, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
+
     return {
         "task_id": task_id,
         "status": task["status"],
         "targets": task["targets"],
-        "tools": task.get("tools", []),
-        "created_at": task["created_at"],
-        "updated_at": task["updated_at"],
-        "errors": task.get("errors", []),
-        "stats": task.get("stats"),
+        "tools": task["tools"] or [],
+        "created_at": ms_to_iso(task["created_at"]),
+        "updated_at": ms_to_iso(task["updated_at"]),
+        "errors": task["errors"] or [],
+        "stats": task["stats"],
     }
 
 
@@ -217,14 +400,17 @@ async def get_discovery_results(
     category: Optional[str] = Query(None, description="Filter by URL category"),
     source: Optional[str] = Query(None, description="Filter by discovery source (katana/gau/kiterunner)"),
     min_confidence: float = Query(0.0, ge=0.0, le=1.0, description="Minimum confidence score"),
-) -> Dict[str, Any]:
+) -> Response:
     """
     Retrieve results for a completed URL discovery task.
 
     Supports optional filtering by category, source, and minimum confidence.
     """
-    task = _tasks.get(task_id)
-    if not task:
+    key = _task_key(task_id)
+    task = await taskstore.hmget_task(key, ("user_id", "status"))
+    if task["status"] is None:
+        # Deleted or expired from the store: drop any payload cached for it
+        _results_cache.pop(task_id)
         raise HTTPException(status_code=404, detail="Task not found")
     if task["user_id"] != current_user.get("sub"):
         raise HTTPException(status_code=403, detail="Not authorised to access this task")
@@ -235,22 +421,34 @@ async def get_discovery_results(
             detail=f"Task not yet completed (status: {task['status']})",
         )
 
-    results = task.get("result", []) or []
+    filtered = bool(category or source or min_confidence > 0.0)
+    if not filtered:
+        cached = _results_cache.get(task_id)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
 
-    # Apply filters
-    if category:
-        results = [r for r in results if r.get("extra", {}).get("category") == category]
-    if source:
-        results = [r for r in results if source in (r.get("extra", {}).get("sources") or [])]
-    if min_confidence > 0.0:
-        results = [r for r in results if (r.get("confidence") or 0.0) >= min_confidence]
+    fields = ("stats", "created_at", "updated_at") + (("result_index",) if filtered else ())
+    task.update(await taskstore.hmget_task(key, fields))
 
-    return {
+    # Apply filters through the result index; only matches are loaded
+    if filtered:
+        positions = _filter_positions(task["result_index"], category, source, min_confidence)
+        results = await taskstore.lindex_items(_result_key(task_id), positions)
+    else:
+        results = await taskstore.lrange_items(_result_key(task_id))
+
+    payload = {
         "task_id": task_id,
         "status": "completed",
         "total": len(results),
         "stats": task.get("stats"),
         "results": results,
-        "created_at": task["created_at"],
-        "updated_at": task["updated_at"],
+        "created_at": ms_to_iso(task["created_at"]),
+        "updated_at": ms_to_iso(task["updated_at"]),
     }
+    # Filtered and unfiltered responses are encoded the same way, so a cached
+    # body is byte-for-byte what a fresh request would return
+    body = orjson.dumps(payload)
+    if not filtered:
+        _results_cache[task_id] = body
+    return Response(content=body, media_type="application/json")
@@ -4,10 +4,15 @@ HTTP Probing API Endpoints - Month 5
 REST API for HTTP probing functionality.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, status
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 from datetime import datetime
+import asyncio
 import logging
+import uuid
+
+import httpx
 
 from ..recon.http_probing import (
     HttpProbeOrchestrator,
@@ -15,6 +20,8 @@ from ..recon.http_probing import (
     HttpProbeResult,
     ProbeMode
 )
+from app.core import background, taskstore
+from app.utils.etag import not_modified, not_modified_response, weak_etag
 from app.utils.job_tracker import JobTracker
 
 logger = logging.getLogger(__name__)
@@ -22,14 +29,46 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/http-probe", tags=["HTTP Probing"])
 
 
-# In-memory storage for probe results (replace with database in production)
-probe_results = {}
+# Probe task records live in the shared task store under this key prefix
+_KEY_PREFIX = "probe:"
+
+# Probe records expire this long after they finish (or are created)
+PROBE_TASK_TTL_SECONDS = 86400
+
+# Fields returned by the task listing (never the result payload)
+_SUMMARY_FIELDS = ("status", "started_at", "completed_at")
+
+
+def _task_key(task_id: str) -> str:
+    return f"{_KEY_PREFIX}{task_id}"
+
+
+# One connection pool shared by every probe in this process, so repeated
+# probes of the same hosts reuse keep-alive connections instead of paying
+# a fresh TCP/TLS handshake per request
+_HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide probe HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(limits=_HTTP_LIMITS)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared probe HTTP client (application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
 
 @router.post("/probe", status_code=status.HTTP_202_ACCEPTED)
 async def start_http_probe(
     request: HttpProbeRequest,
-    background_tasks: BackgroundTasks,
     # current_user: dict = Depends(get_current_user)  # Add auth when ready
 ):
     """
@@ -38,23 +77,21 @@ async def start_http_probe(
     Returns task ID for tracking progress.
     """
     try:
-        # Generate task ID
-        task_id = f"http_probe_{datetime.utcnow().timestamp()}"
+        # Generate task ID (random, so concurrent requests cannot collide)
+        task_id = f"http_probe_{uuid.uuid4().hex}"
         
         # Initialize result placeholder
-        probe_results[task_id] = {
+        await taskstore.hset_task(_task_key(task_id), {
+            "task_id": task_id,
             "status": "running",
-            "started_at": datetime.utcnow(),
+            "started_at": datetime.utcnow().isoformat(),
             "result": None,
             "error": None
-        }
+        })
+        await taskstore.expire_task(_task_key(task_id), PROBE_TASK_TTL_SECONDS)
         
-        # Start background task
-        background_tasks.add_task(
-            execute_http_probe,
-            task_id,
-            request
-        )
+        # Start background job (detached from this request)
+        background.spawn(execute_http_probe(task_id, request), name=task_id)
         
         return {
             "task_id": task_id,
@@ -70,22 +107,28 @@ async def start_http_probe(
         )
 
 
+async def _finish_probe(key: str, fields: dict) -> None:
+    """Write a probe's final status and restart its TTL."""
+    await taskstore.hset_task(key, {
+        **fields,
+        "completed_at": datetime.utcnow().isoformat(),
+    })
+    await taskstore.expire_task(key, PROBE_TASK_TTL_SECONDS)
+
+
 async def execute_http_probe(task_id: str, request: HttpProbeRequest):
     """Background task for HTTP probing"""
-    tracker = JobTracker(task_id, probe_results)
+    tracker = JobTracker(task_id)
+    key = _task_key(task_id)
     try:
         logger.info(f"Executing HTTP probe task {task_id}")
 
         # Run probe
-        orchestrator = HttpProbeOrchestrator(request)
+        orchestrator = HttpProbeOrchestrator(request, client=get_http_client())
         result = await orchestrator.run()
 
-        # Store result in in-memory dict (legacy callers read this directly)
-        probe_results[task_id].update({
-            "completed_at": datetime.utcnow(),
-            "result": result,
-        })
-        result_data = result.model_dump() if hasattr(result, "model_dump") else result
+        result_data = result.model_dump(mode="json") if hasattr(result, "model_dump") else result
+        await _finish_probe(key, {"status": "completed", "result": result_data})
         await tracker.complete(
             result_data,
             result_key="http_probe",
@@ -94,30 +137,47 @@ async def execute_http_probe(task_id: str, request: HttpProbeRequest):
 
         logger.info(f"HTTP probe task {task_id} completed successfully")
 
+    except asyncio.CancelledError:
+        # e.g. shutdown: never leave pollers waiting on a "running" record
+        logger.warning(f"HTTP probe task {task_id} interrupted")
+        await _finish_probe(key, {"status": "failed", "error": "Task interrupted"})
+        raise
+
     except Exception as e:
         logger.error(f"HTTP probe task {task_id} failed: {e}")
-        probe_results[task_id].update({
-            "completed_at": datetime.utcnow(),
-            "error": str(e),
-        })
+        await _finish_probe(key, {"status": "failed", "error": str(e)})
         await tracker.fail(str(e))
 
 
 @router.get("/results/{task_id}")
 async def get_probe_results(
     task_id: str,
+    request: Request,
+    response: Response,
     # current_user: dict = Depends(get_current_user)  # Add auth when ready
 ):
     """
     Get HTTP probe results by task ID.
+    
+    Responses carry a weak ETag of the task's status and completion time;
+    polls sending it back in ``If-None-Match`` get ``304 Not Modified``
+    without the result payload being loaded.
     """
-    if task_id not in probe_results:
+    key = _task_key(task_id)
+    task_data = await taskstore.hmget_task(key, _SUMMARY_FIELDS)
+    if task_data["status"] is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
     
-    task_data = probe_results[task_id]
+    etag = weak_etag(task_data["status"], task_data["completed_at"])
+    if not_modified(request, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
+    
+    if task_data["status"] != "running":
+        task_data.update(await taskstore.hmget_task(key, ("result", "error")))
     
     if task_data["status"] == "running":
         return {
@@ -146,27 +206,28 @@ async def get_probe_results(
         }
 
 
-@router.get("/tasks")
+@router.get("/tasks", response_class=ORJSONResponse)
 async def list_probe_tasks(
     # current_user: dict = Depends(get_current_user)  # Add auth when ready
 ):
     """
     List all HTTP probe tasks.
+    
+    Only the summary fields are read from the task store, and the response
+    is encoded directly with orjson.
     """
     tasks = []
     
-    for task_id, task_data in probe_results.items():
-        tasks.append({
-            "task_id": task_id,
-            "status": task_data["status"],
-            "started_at": task_data["started_at"],
-            "completed_at": task_data.get("completed_at"),
-        })
+    async for key in taskstore.scan_tasks(_KEY_PREFIX):
+        summary = await taskstore.hmget_task(key, _SUMMARY_FIELDS)
+        if summary["status"] is None:  # deleted while listing
+            continue
+        tasks.append({"task_id": key[len(_KEY_PREFIX):], **summary})
     
-    return {
+    return ORJSONResponse({
         "total": len(tasks),
         "tasks": tasks
-    }
+    })
 
 
 @router.delete("/results/{task_id}")
@@ -177,13 +238,14 @@ async def delete_probe_results(
     """
     Delete HTTP probe results.
     """
-    if task_id not in probe_results:
+    key = _task_key(task_id)
+    if not await taskstore.hgetall_task(key):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
     
-    del probe_results[task_id]
+    await taskstore.hdel_task(key)
     
     return {
         "message": "Results deleted successfully"
@@ -215,7 +277,7 @@ async def quick_probe(
         )
         
         # Execute probe
-        orchestrator = HttpProbeOrchestrator(request)
+        orchestrator = HttpProbeOrchestrator(request, client=get_http_client())
         result = await orchestrator.run()
         
         return result
@@ -9,6 +9,8 @@ import logging
 from datetime import datetime
 import uuid
 import asyncio
+from collections import defaultdict
+from itertools import islice
 
 from app.recon.port_scanning import (
     PortScanOrchestrator,
@@ -25,6 +27,9 @@ router = APIRouter(prefix="/api/port-scan", tags=["port-scanning"])
 
 # In-memory task storage (will be replaced with database in production)
 port_scan_tasks: Dict[str, Dict[str, Any]] = {}
+# Task IDs per user in creation order (dict used as an ordered set), so
+# listings only touch the caller's tasks
+port_scan_tasks_by_user: Dict[str, Dict[str, None]] = defaultdict(dict)
 
 
 async def execute_port_scan(task_id: str, request: PortScanRequest, user_id: str):
@@ -80,6 +85,7 @@ async def start_port_scan(
             "created_at": datetime.now().isoformat(),
             "updated_at": datetime.now().isoformat()
         }
+        port_scan_tasks_by_user[user_id][task_id] = None
         
         # Start background task
         background_tasks.add_task(execute_port_scan, task_id, request, user_id)
@@ -171,6 +177,7 @@ async def delete_scan_task(
         raise HTTPException(status_code=403, detail="Not authorized to delete this task")
     
     del port_scan_tasks[task_id]
+    port_scan_tasks_by_user[task["user_id"]].pop(task_id, None)
     
     return {"message": "Task deleted successfully"}
 
@@ -186,20 +193,17 @@ async def list_scan_tasks(
     """
     user_id = current_user.get("sub")
     
-    # Filter tasks by user
-    user_tasks = [
-        task for task in port_scan_tasks.values()
-        if task["user_id"] == user_id
-    ]
-    
-    # Sort by created_at descending
-    user_tasks.sort(key=lambda x: x["created_at"], reverse=True)
+    # The user's index is in creation order; walk it newest first
+    user_task_ids = port_scan_tasks_by_user.get(user_id, {})
     
     # Pagination
-    total = len(user_tasks)
+    total = len(user_task_ids)
     start = (page - 1) * per_page
     end = start + per_page
-    paginated_tasks = user_tasks[start:end]
+    paginated_tasks = [
+        port_scan_tasks[task_id]
+        for task_id in islice(reversed(user_task_ids), start, end)
+    ]
     
     return {
         "tasks": paginated_tasks,
@@ -12,13 +12,15 @@ Days 16-17 of YEAR_01_GAP_COVERAGE_PLAN:
 from __future__ import annotations
 
 import logging
-from typing import Annotated, Optional
+from typing import Annotated, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import TypeAdapter
 
 from app.core.audit import AuditAction, log_audit
-from app.core.security import decode_token
+from app.core.security import verify_token
 from app.db.prisma_client import get_prisma
 from app.schemas import (
     Message,
@@ -55,7 +57,7 @@ async def get_current_user_id(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
 ) -> str:
     """Extract and validate the bearer token; return the subject (user_id)."""
-    payload = decode_token(credentials.credentials)
+    payload = verify_token(credentials.credentials)
     user_id: str | None = payload.get("sub")
     if not user_id:
         raise HTTPException(
@@ -90,6 +92,10 @@ def _to_response(project) -> ProjectResponse:
     )
 
 
+# Validates Prisma rows by attribute and dumps them in one pydantic-core pass
+_PROJECT_LIST_ADAPTER = TypeAdapter(List[ProjectResponse])
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -134,12 +140,15 @@ async def list_projects(
         project_type=project_type,
         search=search,
     )
-    return ProjectListResponse(
-        projects=[_to_response(p) for p in result["projects"]],
-        total=result["total"],
-        page=result["page"],
-        page_size=result["page_size"],
-    )
+    projects = _PROJECT_LIST_ADAPTER.validate_python(result["projects"], from_attributes=True)
+    # Already validated against ProjectListResponse's item schema; skip the
+    # response_model round trip and encode directly
+    return ORJSONResponse({
+        "projects": _PROJECT_LIST_ADAPTER.dump_python(projects, mode="json"),
+        "total": result["total"],
+        "page": result["page"],
+        "page_size": result["page_size"],
+    })
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
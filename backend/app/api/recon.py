@@ -5,12 +5,13 @@ Provides REST API endpoints for domain discovery and reconnaissance operations.
 Integrates with WebSocket for real-time progress updates.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from typing import Optional, Dict, Any
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
+from typing import Optional, Dict, Any, Tuple
+import asyncio
+import hashlib
 import logging
-from datetime import datetime
 
-from app.recon.domain_discovery import DomainDiscovery
 from app.recon.schemas import (
     ReconTaskRequest,
     ReconTaskResponse,
@@ -18,29 +19,78 @@ from app.recon.schemas import (
     ReconTaskList,
     DomainDiscoveryResult
 )
+from app.core import background, taskstore
 from app.core.security import get_current_user
 from app.utils.job_tracker import JobTracker
+from app.utils.timestamps import ms_to_iso, now_ms
+from app.workers.recon_worker import enqueue_domain_discovery
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/recon", tags=["reconnaissance"])
 
 
-# In-memory task storage (will be replaced with database in production)
-recon_tasks: Dict[str, Dict[str, Any]] = {}
+# Task records live in the shared task store as ``recon:{id}`` hashes and
+# expire RECON_TASK_TTL_SECONDS after their last update.  Each user's task IDs
+# are indexed in ``recon:user:{uid}``, scored by creation time, so listings
+# page through one user's tasks instead of scanning everyone's.  The index
+# expires together with the user's most recently updated task.
+RECON_TASK_TTL_SECONDS = 86400
+
+# Last index score handed out; scores strictly increase so tasks created in
+# the same millisecond keep their creation order (ties would otherwise be
+# ordered by task ID, which is random)
+_last_index_score = 0
+
+# Fields read for listings (never the results payload)
+_LIST_FIELDS = ("task_id", "domain", "status", "progress", "message",
+                "created_at", "updated_at", "user_id")
+
+
+# Discovery runs in flight in this process, by domain, resolvers and API key
+# (see _discovery_key).  Tasks for a domain already being discovered await
+# the same run instead of repeating the WHOIS/CT/DNS work; each keeps its own
+# task record, so ownership checks are unaffected.
+_discovery_inflight: Dict[Tuple[str, Tuple[str, ...], Optional[str]], "asyncio.Future[Any]"] = {}
+
+
+def _task_key(task_id: str) -> str:
+    return f"recon:{task_id}"
+
+
+def _user_index_key(user_id: Optional[str]) -> str:
+    return f"recon:user:{user_id}"
+
+
+def _next_index_score(now: int) -> int:
+    """Return a creation-time index score greater than any handed out before."""
+    global _last_index_score
+    _last_index_score = max(now, _last_index_score + 1)
+    return _last_index_score
+
+
+async def _get_owned_task(task_id: str, user_id: Optional[str], action: str) -> Dict[str, Any]:
+    """Load a task record, raising 404 if missing and 403 if not *user_id*'s."""
+    task = await taskstore.hgetall_task(_task_key(task_id))
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    # Check if user owns this task
+    if task.get("user_id") != user_id:
+        raise HTTPException(status_code=403, detail=f"Not authorized to {action} this task")
+    return task
 
 
 @router.post("/discover", response_model=ReconTaskResponse)
 async def start_domain_discovery(
     request: ReconTaskRequest,
-    background_tasks: BackgroundTasks,
     current_user: dict = Depends(get_current_user)
 ):
     """
     Start domain discovery for a target domain.
     
-    This endpoint initiates a background task for comprehensive domain discovery
-    including WHOIS lookup, subdomain enumeration, and DNS resolution.
+    This endpoint queues a job for comprehensive domain discovery including
+    WHOIS lookup, subdomain enumeration, and DNS resolution.
     """
     try:
         import uuid
@@ -49,27 +99,43 @@ async def start_domain_discovery(
         logger.info(f"Starting domain discovery for {request.domain} (task: {task_id})")
         
         # Store task status
-        now = datetime.utcnow()
-        recon_tasks[task_id] = {
+        now = now_ms()
+        user_id = current_user.get("user_id")
+        key = _task_key(task_id)
+        await taskstore.hset_task(key, {
             "task_id": task_id,
             "status": "pending",
             "domain": request.domain,
-            "user_id": current_user.get("user_id"),
+            "user_id": user_id,
             "progress": 0,
             "message": "Task queued",
-            "created_at": now.isoformat(),
-            "updated_at": now.isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "results": None
-        }
+        })
+        await taskstore.expire_task(key, RECON_TASK_TTL_SECONDS)
+        index_key = _user_index_key(user_id)
+        await taskstore.zadd_index(index_key, task_id, _next_index_score(now))
+        await taskstore.expire_task(index_key, RECON_TASK_TTL_SECONDS)
         
-        # Start background task
-        background_tasks.add_task(
-            run_domain_discovery,
+        # Queue for the recon worker; without a worker queue configured the
+        # job runs in this process, detached from the request
+        queued = await enqueue_domain_discovery(
             task_id,
             request.domain,
             request.hackertarget_api_key,
             request.dns_nameservers
         )
+        if not queued:
+            background.spawn(
+                run_domain_discovery(
+                    task_id,
+                    request.domain,
+                    request.hackertarget_api_key,
+                    request.dns_nameservers
+                ),
+                name=_task_key(task_id)
+            )
         
         return ReconTaskResponse(
             status="success",
@@ -91,22 +157,17 @@ async def get_recon_status(
     Get the status of a reconnaissance task.
     
     Returns the current status, progress, and results (if completed).
+    Clients poll this endpoint, so the stored record is encoded directly
+    with orjson rather than revalidated against the response model.
     """
-    if task_id not in recon_tasks:
-        raise HTTPException(status_code=404, detail="Task not found")
+    task = await _get_owned_task(task_id, current_user.get("user_id"), "access")
     
-    task = recon_tasks[task_id]
-    
-    # Check if user owns this task
-    if task["user_id"] != current_user.get("user_id"):
-        raise HTTPException(status_code=403, detail="Not authorized to access this task")
-    
-    return ReconTaskResponse(
-        status=task["status"],
-        message=task.get("message", f"Task progress: {task['progress']}%"),
-        task_id=task_id,
-        data=task.get("results")
-    )
+    return ORJSONResponse({
+        "status": task["status"],
+        "message": task.get("message", f"Task progress: {task['progress']}%"),
+        "task_id": task_id,
+        "data": task.get("results")
+    })
 
 
 @router.get("/results/{task_id}", response_model=DomainDiscoveryResult)
@@ -117,14 +178,7 @@ async def get_recon_results(
     """
     Get the full results of a completed reconnaissance task.
     """
-    if task_id not in recon_tasks:
-        raise HTTPException(status_code=404, detail="Task not found")
-    
-    task = recon_tasks[task_id]
-    
-    # Check if user owns this task
-    if task["user_id"] != current_user.get("user_id"):
-        raise HTTPException(status_code=403, detail="Not authorized to access this task")
+    task = await _get_owned_task(task_id, current_user.get("user_id"), "access")
     
     if task["status"] != "completed":
         raise HTTPException(status_code=400, detail="Task not completed yet")
@@ -143,22 +197,22 @@ async def run_domain_discovery(
     
     Updates task status and stores results upon completion.
     """
-    tracker = JobTracker(task_id, recon_tasks)
+    key = _task_key(task_id)
+    owner = await taskstore.hmget_task(key, ["user_id"])
+    tracker = JobTracker(
+        task_id,
+        store_key=key,
+        store_ttl=RECON_TASK_TTL_SECONDS,
+        store_index_key=_user_index_key(owner["user_id"]),
+    )
     try:
         logger.info(f"Running domain discovery for {domain} (task: {task_id})")
 
         await tracker.start("Starting domain discovery")
 
-        # Initialize discovery
-        discovery = DomainDiscovery(
-            domain=domain,
-            hackertarget_api_key=hackertarget_api_key,
-            dns_nameservers=dns_nameservers
-        )
-
-        # Run discovery
+        # Run discovery (or join a run already in flight for this domain)
         await tracker.progress(25, "Running domain discovery")
-        results = await discovery.run()
+        results = await _discover(domain, hackertarget_api_key, dns_nameservers)
 
         # Store results
         await tracker.complete(results, result_key="domain_discovery", message="Discovery completed successfully")
@@ -170,6 +224,57 @@ async def run_domain_discovery(
         await tracker.fail(str(e))
 
 
+def _discovery_key(
+    domain: str,
+    hackertarget_api_key: Optional[str],
+    dns_nameservers: Optional[list],
+) -> Tuple[str, Tuple[str, ...], Optional[str]]:
+    """
+    Return the coalescing key for a discovery run.
+
+    Runs with different API keys return different results, so a digest of
+    the key (never the key itself) is part of it; domains compare
+    case-insensitively, as DNS does.
+    """
+    key_digest = (
+        hashlib.blake2b(hackertarget_api_key.encode(), digest_size=16).hexdigest()
+        if hackertarget_api_key
+        else None
+    )
+    return domain.lower(), tuple(dns_nameservers or ()), key_digest
+
+
+async def _discover(
+    domain: str,
+    hackertarget_api_key: Optional[str] = None,
+    dns_nameservers: Optional[list] = None
+) -> Dict[str, Any]:
+    """Run discovery for *domain*, sharing a run already in flight."""
+    key = _discovery_key(domain, hackertarget_api_key, dns_nameservers)
+    future = _discovery_inflight.get(key)
+    if future is None:
+        # Imported here so the API process only loads the discovery stack
+        # (DNS, WHOIS, HTTP clients) once a job actually runs
+        from app.recon.domain_discovery import DomainDiscovery
+
+        discovery = DomainDiscovery(
+            domain=domain,
+            hackertarget_api_key=hackertarget_api_key,
+            dns_nameservers=dns_nameservers
+        )
+        future = asyncio.ensure_future(discovery.run())
+        _discovery_inflight[key] = future
+
+        def _release(done: "asyncio.Future[Any]") -> None:
+            if _discovery_inflight.get(key) is done:
+                del _discovery_inflight[key]
+
+        future.add_done_callback(_release)
+    # Shielded, so one waiting task being cancelled does not cancel the
+    # run for the others
+    return await asyncio.shield(future)
+
+
 @router.delete("/tasks/{task_id}")
 async def delete_recon_task(
     task_id: str,
@@ -178,16 +283,11 @@ async def delete_recon_task(
     """
     Delete a reconnaissance task and its results.
     """
-    if task_id not in recon_tasks:
-        raise HTTPException(status_code=404, detail="Task not found")
-    
-    task = recon_tasks[task_id]
-    
-    # Check if user owns this task
-    if task["user_id"] != current_user.get("user_id"):
-        raise HTTPException(status_code=403, detail="Not authorized to delete this task")
+    user_id = current_user.get("user_id")
+    await _get_owned_task(task_id, user_id, "delete")
     
-    del recon_tasks[task_id]
+    await taskstore.hdel_task(_task_key(task_id))
+    await taskstore.zrem_index(_user_index_key(user_id), task_id)
     
     return {"status": "success", "message": "Task deleted"}
 
@@ -202,26 +302,30 @@ async def list_recon_tasks(
     List all reconnaissance tasks for the current user.
     """
     user_id = current_user.get("user_id")
-    user_tasks = [
-        ReconTaskStatus(
+    index_key = _user_index_key(user_id)
+    
+    # Page through the user's index; only the page's records are read
+    total = await taskstore.zcard_index(index_key)
+    start = (page - 1) * per_page
+    task_ids = await taskstore.zrange_index(index_key, start, start + per_page - 1)
+    
+    paginated_tasks = []
+    for task_id in task_ids:
+        task = await taskstore.hmget_task(_task_key(task_id), _LIST_FIELDS)
+        if task["task_id"] is None:  # record expired or deleted
+            await taskstore.zrem_index(index_key, task_id)
+            total -= 1
+            continue
+        paginated_tasks.append(ReconTaskStatus(
             task_id=task["task_id"],
             domain=task["domain"],
             status=task["status"],
             progress=task["progress"],
-            message=task.get("message"),
-            created_at=datetime.fromisoformat(task["created_at"]),
-            updated_at=datetime.fromisoformat(task["updated_at"]),
+            message=task["message"],
+            created_at=ms_to_iso(task["created_at"]),
+            updated_at=ms_to_iso(task["updated_at"]),
             user_id=task["user_id"]
-        )
-        for task in recon_tasks.values()
-        if task["user_id"] == user_id
-    ]
-    
-    # Simple pagination
-    total = len(user_tasks)
-    start = (page - 1) * per_page
-    end = start + per_page
-    paginated_tasks = user_tasks[start:end]
+        ))
     
     return ReconTaskList(
         tasks=paginated_tasks,
@@ -11,7 +11,6 @@ from __future__ import annotations
 
 import logging
 import uuid
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
@@ -22,6 +21,7 @@ from app.recon.vuln_scanning.nuclei_orchestrator import (
     NucleiOrchestratorConfig,
     NucleiOrchestrator,
 )
+from app.utils.timestamps import ms_to_iso, now_ms
 
 logger = logging.getLogger(__name__)
 
@@ -67,7 +67,7 @@ class NucleiScanCreateRequest(BaseModel):
 
 async def _run_scan(task_id: str, req: NucleiScanCreateRequest) -> None:
     _tasks[task_id]["status"] = "running"
-    _tasks[task_id]["updated_at"] = datetime.utcnow().isoformat()
+    _tasks[task_id]["updated_at"] = now_ms()
 
     cfg = NucleiOrchestratorConfig(
         severity_filter=req.severity_filter,
@@ -94,7 +94,7 @@ async def _run_scan(task_id: str, req: NucleiScanCreateRequest) -> None:
         _tasks[task_id]["status"] = "failed"
         _tasks[task_id]["error"] = str(exc)
     finally:
-        _tasks[task_id]["updated_at"] = datetime.utcnow().isoformat()
+        _tasks[task_id]["updated_at"] = now_ms()
 
 
 # ---------------------------------------------------------------------------
@@ -124,8 +124,8 @@ async def start_nuclei_scan(
         "result": None,
         "total_findings": 0,
         "error": None,
-        "created_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat(),
+        "created_at": now_ms(),
+        "updated_at": now_ms(),
     }
 
     background_tasks.add_task(_run_scan, task_id, req)
@@ -156,8 +156,8 @@ async def get_nuclei_scan_status(
         "targets": task["targets"],
         "severity_filter": task.get("severity_filter"),
         "total_findings": task.get("total_findings", 0),
-        "created_at": task["created_at"],
-        "updated_at": task["updated_at"],
+        "created_at": ms_to_iso(task["created_at"]),
+        "updated_at": ms_to_iso(task["updated_at"]),
         "error": task.get("error"),
     }
 
@@ -186,6 +186,6 @@ async def get_nuclei_scan_results(
         "status": "completed",
         "total_findings": task.get("total_findings", 0),
         "results": task["result"],
-        "created_at": task["created_at"],
-        "updated_at": task["updated_at"],
+        "created_at": ms_to_iso(task["created_at"]),
+        "updated_at": ms_to_iso(task["updated_at"]),
     }
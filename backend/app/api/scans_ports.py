@@ -11,7 +11,6 @@ from __future__ import annotations
 
 import logging
 import uuid
-from datetime import datetime
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
@@ -19,6 +18,7 @@ from pydantic import BaseModel, Field
 
 from app.core.security import get_current_user
 from app.recon.port_scanning.naabu_orchestrator import NaabuConfig, NaabuOrchestrator
+from app.utils.timestamps import ms_to_iso, now_ms
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +54,7 @@ class PortScanCreateRequest(BaseModel):
 async def _run_scan(task_id: str, req: PortScanCreateRequest) -> None:
     """Execute port scan and store result in ``_tasks``."""
     _tasks[task_id]["status"] = "running"
-    _tasks[task_id]["updated_at"] = datetime.utcnow().isoformat()
+    _tasks[task_id]["updated_at"] = now_ms()
 
     cfg = NaabuConfig(
         scan_type=req.scan_type,
@@ -76,7 +76,7 @@ async def _run_scan(task_id: str, req: PortScanCreateRequest) -> None:
         _tasks[task_id]["status"] = "failed"
         _tasks[task_id]["error"] = str(exc)
     finally:
-        _tasks[task_id]["updated_at"] = datetime.utcnow().isoformat()
+        _tasks[task_id]["updated_at"] = now_ms()
 
 
 # ---------------------------------------------------------------------------
@@ -104,8 +104,8 @@ async def start_scan(
         "targets": req.targets,
         "result": None,
         "error": None,
-        "created_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat(),
+        "created_at": now_ms(),
+        "updated_at": now_ms(),
     }
 
     background_tasks.add_task(_run_scan, task_id, req)
@@ -134,8 +134,8 @@ async def get_scan_status(
         "task_id": task_id,
         "status": task["status"],
         "targets": task["targets"],
-        "created_at": task["created_at"],
-        "updated_at": task["updated_at"],
+        "created_at": ms_to_iso(task["created_at"]),
+        "updated_at": ms_to_iso(task["updated_at"]),
         "error": task.get("error"),
     }
 
@@ -163,6 +163,6 @@ async def get_scan_results(
         "task_id": task_id,
         "status": "completed",
         "results": task["result"],
-        "created_at": task["created_at"],
-        "updated_at": task["updated_at"],
+        "created_at": ms_to_iso(task["created_at"]),
+        "updated_at": ms_to_iso(task["updated_at"]),
     }
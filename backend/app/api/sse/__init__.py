@@ -4,23 +4,219 @@ Provides one-way server-to-client streaming for logs and progress updates
 """
 from fastapi import APIRouter, Request, Depends
 from sse_starlette.sse import EventSourceResponse
-from typing import AsyncGenerator, Dict, Any
+from typing import AsyncGenerator, Dict, Any, Optional, Set
+from collections import Counter
 import asyncio
 import logging
+import time
 from datetime import datetime
-import json
+import orjson
+
+from app.core.config import settings
+from app.core.metrics import sse_events_dropped_total, sse_slow_clients_disconnected_total
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Events buffered per connected client before the oldest are dropped
+SSE_MAX_QUEUE_SIZE = 1000
+# Dropped events after which a client is treated as stalled and disconnected
+SSE_SLOW_CLIENT_DISCONNECT = 5000
+# Seconds between heartbeats on a scan stream
+SSE_HEARTBEAT_SECONDS = 30
+# Seconds a heartbeat payload is reused before its timestamp is refreshed
+SSE_HEARTBEAT_REFRESH_SECONDS = 1.0
+# Event data templates; only the project ID and timestamp vary
+_CONNECTED_TEMPLATE = (
+    '{"message":"Connected to %s for project %s","project_id":"%s","timestamp":"%s"}'
+)
+_HEARTBEAT_TEMPLATE = '{"timestamp":"%s"}'
+# Redis pub/sub channel prefix for scan updates, one channel per project
+SSE_CHANNEL_PREFIX = "sse:scan:"
+# Backoff, doubling up to the maximum, before a failed relay resubscribes
+SSE_RELAY_RETRY_SECONDS = 1.0
+SSE_RELAY_RETRY_MAX_SECONDS = 30.0
+
+
+# Queued by the heartbeat ticker in place of an encoded event
+_HEARTBEAT = object()
+
+
+def _encode(data: Dict[str, Any]) -> str:
+    """Encode event data once, with orjson, as the text sse-starlette writes."""
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class _ClientQueue(asyncio.Queue):
+    """Bounded per-client event queue that counts events it had to drop."""
+    
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize=maxsize)
+        self.dropped = 0
+
 
 class SSEManager:
-    """Manager for Server-Sent Events streams"""
+    """
+    Manager for Server-Sent Events streams
+    
+    With a ``redis_url``, scan updates are published on a Redis channel per
+    project and every worker process relays them to its own clients, so an
+    update reaches clients connected to any Uvicorn worker.  Without one,
+    updates only reach clients of this process.
+    """
+    
+    def __init__(
+        self,
+        max_queue_size: int = SSE_MAX_QUEUE_SIZE,
+        slow_client_disconnect: int = SSE_SLOW_CLIENT_DISCONNECT,
+        heartbeat_interval: float = SSE_HEARTBEAT_SECONDS,
+        redis_url: Optional[str] = None
+    ):
+        self.max_queue_size = max_queue_size
+        self.slow_client_disconnect = slow_client_disconnect
+        self.heartbeat_interval = heartbeat_interval
+        # Event queues of the connected scan-stream clients, by project.
+        # Only touched from synchronous code on the event loop thread, so no
+        # lock is needed: registration, release and fan-out never interleave.
+        self.active_streams: Dict[str, Set[_ClientQueue]] = {}
+        # Events dropped for slow clients, by project
+        self.dropped: Counter = Counter()
+        # Timestamp and heartbeat data shared by every stream, and when they
+        # were built
+        self._timestamp = ''
+        self._heartbeat_data = ''
+        self._clock_read_at = float('-inf')
+        self.redis_url = redis_url
+        self._redis = None
+        # Channel subscriptions of this process, one per project with clients
+        self._subscribers: Dict[str, asyncio.Task] = {}
+        # Single heartbeat ticker shared by every scan stream of this manager
+        self._ticker: Optional[asyncio.Task] = None
+    
+    def _get_redis(self):
+        """Return the Redis client used for pub/sub, creating it on first use."""
+        if self._redis is None:
+            import redis.asyncio as redis
+            self._redis = redis.Redis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+    
+    async def close(self) -> None:
+        """Stop the ticker and channel relays and close the Redis client (shutdown)."""
+        if self._ticker is not None:
+            self._ticker.cancel()
+            self._ticker = None
+        subscribers = list(self._subscribers.values())
+        self._subscribers.clear()
+        for subscriber in subscribers:
+            subscriber.cancel()
+        if subscribers:
+            await asyncio.gather(*subscribers, return_exceptions=True)
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+    
+    async def _relay_channel(self, project_id: str) -> None:
+        """
+        Forward a project's published updates to this process's clients.
+        
+        A Redis error or dropped connection resubscribes after a backoff for as long as the project
+        has clients; the task always unregisters itself on exit so the next
+        client starts a fresh relay.
+        """
+        delay = SSE_RELAY_RETRY_SECONDS
+        try:
+            while project_id in self.active_streams:
+                pubsub = self._get_redis().pubsub()
+                try:
+                    await pubsub.subscribe(f"{SSE_CHANNEL_PREFIX}{project_id}")
+                    delay = SSE_RELAY_RETRY_SECONDS
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._fan_out(project_id, message["data"])
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"SSE relay for project {project_id} failed: {e}")
+                finally:
+                    await pubsub.aclose()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, SSE_RELAY_RETRY_MAX_SECONDS)
+        finally:
+            if self._subscribers.get(project_id) is asyncio.current_task():
+                del self._subscribers[project_id]
+    
+    async def _run_ticker(self) -> None:
+        """
+        Queue a heartbeat for every idle scan stream each heartbeat_interval
+        
+        One timer serves all clients; a client with events already queued
+        needs no heartbeat.  The ticker is cancelled once no clients remain
+        and the next client starts a new one.
+        """
+        try:
+            while self.active_streams:
+                await asyncio.sleep(self.heartbeat_interval)
+                for queues in self.active_streams.values():
+                    for queue in queues:
+                        if queue.empty():
+                            queue.put_nowait(_HEARTBEAT)
+        finally:
+            if self._ticker is asyncio.current_task():
+                self._ticker = None
+    
+    def _refresh_clock(self) -> None:
+        """
+        Rebuild the shared timestamp and heartbeat data once they are
+        SSE_HEARTBEAT_REFRESH_SECONDS old
+        
+        Every stream reuses the same strings in between, instead of
+        formatting a timestamp per client per event.
+        """
+        now = time.monotonic()
+        if now - self._clock_read_at >= SSE_HEARTBEAT_REFRESH_SECONDS:
+            self._timestamp = datetime.utcnow().isoformat()
+            self._heartbeat_data = _HEARTBEAT_TEMPLATE % self._timestamp
+            self._clock_read_at = now
+    
+    def _heartbeat_event(self) -> Dict[str, Any]:
+        """Return a heartbeat event (shared data, see :meth:`_refresh_clock`)"""
+        self._refresh_clock()
+        return {'event': 'heartbeat', 'data': self._heartbeat_data}
+    
+    def _connected_event(self, stream: str, project_id: str) -> Dict[str, Any]:
+        """Return the event announcing a new *stream* connection"""
+        self._refresh_clock()
+        # JSON-escape the ID (it comes from the URL) without its quotes
+        escaped = orjson.dumps(project_id).decode()[1:-1]
+        return {
+            'event': 'connected',
+            'data': _CONNECTED_TEMPLATE % (stream, escaped, escaped, self._timestamp)
+        }
+    
+    def _get_scan_queue(self, project_id: str) -> _ClientQueue:
+        """Register and return a bounded event queue for a new client."""
+        queue = _ClientQueue(maxsize=self.max_queue_size)
+        if self.redis_url and project_id not in self._subscribers:
+            self._subscribers[project_id] = asyncio.create_task(
+                self._relay_channel(project_id)
+            )
+        self.active_streams.setdefault(project_id, set()).add(queue)
+        return queue
     
-    def __init__(self):
-        # Store active event generators by project
-        self.active_streams: Dict[str, list] = {}
+    def _release_scan_queue(self, project_id: str, queue: _ClientQueue) -> None:
+        """Unregister a client's event queue once its stream ends."""
+        queues = self.active_streams.get(project_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self.active_streams[project_id]
+                subscriber = self._subscribers.pop(project_id, None)
+                if subscriber is not None:
+                    subscriber.cancel()
+                if not self.active_streams and self._ticker is not None:
+                    self._ticker.cancel()
+                    self._ticker = None
     
     async def scan_event_generator(
         self,
@@ -37,16 +233,14 @@ class SSEManager:
         Yields:
             Event dictionaries with scan updates
         """
+        queue = self._get_scan_queue(project_id)
+        # Heartbeats arrive through the queue from the shared ticker, so a
+        # client waits on nothing but its queue
+        if self._ticker is None:
+            self._ticker = asyncio.create_task(self._run_ticker())
         try:
             # Send initial connection event
-            yield {
-                'event': 'connected',
-                'data': json.dumps({
-                    'message': f'Connected to scan updates for project {project_id}',
-                    'project_id': project_id,
-                    'timestamp': datetime.utcnow().isoformat()
-                })
-            }
+            yield self._connected_event('scan updates', project_id)
             
             # Keep connection alive and stream events
             while True:
@@ -55,17 +249,32 @@ class SSEManager:
                     logger.info(f"SSE client disconnected from project {project_id}")
                     break
                 
-                # Here you would fetch actual scan updates from your scan queue/database
-                # For now, send heartbeat
-                yield {
-                    'event': 'heartbeat',
-                    'data': json.dumps({
-                        'timestamp': datetime.utcnow().isoformat()
-                    })
-                }
+                # A client this far behind is not draining its stream
+                if queue.dropped >= self.slow_client_disconnect:
+                    logger.warning(
+                        f"SSE client for project {project_id} too slow "
+                        f"({queue.dropped} events dropped), disconnecting"
+                    )
+                    sse_slow_clients_disconnected_total.inc()
+                    yield {
+                        'event': 'error',
+                        'data': _encode({
+                            'error': 'Client too slow, events dropped',
+                            'dropped': queue.dropped,
+                            'timestamp': datetime.utcnow().isoformat()
+                        })
+                    }
+                    break
                 
-                # Wait before next update
-                await asyncio.sleep(30)  # Heartbeat every 30 seconds
+                payload = await queue.get()
+                if payload is _HEARTBEAT:
+                    yield self._heartbeat_event()
+                else:
+                    # Already encoded by publish_scan_update
+                    yield {
+                        'event': 'scan_update',
+                        'data': payload
+                    }
         
         except asyncio.CancelledError:
             logger.info(f"SSE stream cancelled for project {project_id}")
@@ -73,11 +282,13 @@ class SSEManager:
             logger.error(f"Error in SSE stream for project {project_id}: {e}")
             yield {
                 'event': 'error',
-                'data': json.dumps({
+                'data': _encode({
                     'error': str(e),
                     'timestamp': datetime.utcnow().isoformat()
                 })
             }
+        finally:
+            self._release_scan_queue(project_id, queue)
     
     async def log_event_generator(
         self,
@@ -96,14 +307,7 @@ class SSEManager:
         """
         try:
             # Send initial connection event
-            yield {
-                'event': 'connected',
-                'data': json.dumps({
-                    'message': f'Connected to logs for project {project_id}',
-                    'project_id': project_id,
-                    'timestamp': datetime.utcnow().isoformat()
-                })
-            }
+            yield self._connected_event('logs', project_id)
             
             # Stream log events
             while True:
@@ -114,12 +318,7 @@ class SSEManager:
                 
                 # Here you would fetch actual logs from your logging system
                 # For now, send heartbeat
-                yield {
-                    'event': 'heartbeat',
-                    'data': json.dumps({
-                        'timestamp': datetime.utcnow().isoformat()
-                    })
-                }
+                yield self._heartbeat_event()
                 
                 # Wait before next update
                 await asyncio.sleep(15)  # Heartbeat every 15 seconds
@@ -130,21 +329,25 @@ class SSEManager:
             logger.error(f"Error in log SSE stream for project {project_id}: {e}")
             yield {
                 'event': 'error',
-                'data': json.dumps({
+                'data': _encode({
                     'error': str(e),
                     'timestamp': datetime.utcnow().isoformat()
                 })
             }
     
-    async def send_scan_update(
+    def publish_scan_update(
         self,
         project_id: str,
         scan_type: str,
         status: str,
         data: Dict = None
-    ):
+    ) -> None:
         """
-        Send a scan update event
+        Send a scan update event to every client of this process streaming
+        the project
+        
+        Synchronous and never blocks.  Use :meth:`send_scan_update` to reach
+        clients of other worker processes as well.
         
         Args:
             project_id: Project identifier
@@ -152,13 +355,63 @@ class SSEManager:
             status: Scan status
             data: Additional data
         """
-        # This would integrate with your event queue system
-        # For now, it's a placeholder
-        pass
+        self._fan_out(project_id, _scan_update(project_id, scan_type, status, data))
+    
+    def _fan_out(self, project_id: str, payload: str) -> None:
+        """
+        Queue an encoded event for every local client of the project
+        
+        When a client's queue is full its oldest event is dropped to make
+        room, so a slow consumer costs bounded memory and cannot stall the
+        producer.  The same string is queued for every client.
+        """
+        for queue in self.active_streams.get(project_id, ()):
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                queue.put_nowait(payload)
+                queue.dropped += 1
+                self.dropped[project_id] += 1
+                sse_events_dropped_total.inc()
+    
+    async def send_scan_update(
+        self,
+        project_id: str,
+        scan_type: str,
+        status: str,
+        data: Dict = None
+    ):
+        """
+        Send a scan update event to every client streaming the project
+        
+        Published on the project's Redis channel when one is configured, so
+        clients of every worker process receive it; otherwise delivered to
+        this process's clients directly.
+        """
+        payload = _scan_update(project_id, scan_type, status, data)
+        if self.redis_url:
+            await self._get_redis().publish(f"{SSE_CHANNEL_PREFIX}{project_id}", payload)
+        else:
+            self._fan_out(project_id, payload)
+
+
+def _scan_update(project_id: str, scan_type: str, status: str, data: Optional[Dict]) -> str:
+    """Encode a scan update event."""
+    return _encode({
+        'project_id': project_id,
+        'scan_type': scan_type,
+        'status': status,
+        'data': data or {},
+        'timestamp': datetime.utcnow().isoformat()
+    })
 
 
 # Global SSE manager
-sse_manager = SSEManager()
+sse_manager = SSEManager(redis_url=settings.REDIS_URL)
 
 
 @router.get("/stream/scans/{project_id}")
@@ -0,0 +1,53 @@
+"""
+Detached background jobs for the long-running scan/discovery APIs.
+
+FastAPI ``BackgroundTasks`` run after the response is sent but still inside
+the request's middleware stack, so a multi-minute scan keeps its request
+(and the logging/metrics middleware wrapped around it) open until it ends.
+:func:`spawn` schedules the job directly on the event loop instead, so the
+request completes as soon as the handler returns.
+
+Usage::
+
+    from app.core import background
+
+    background.spawn(_run_discovery(task_id, req), name=f"disc:{task_id}")
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Coroutine, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# The event loop only keeps weak references to tasks; hold them here until done
+_running: Set[asyncio.Task] = set()
+
+
+def _on_done(task: asyncio.Task) -> None:
+    _running.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background job %s failed: %s", task.get_name(), task.exception())
+
+
+def spawn(coro: Coroutine[Any, Any, Any], name: Optional[str] = None) -> asyncio.Task:
+    """Run *coro* on the current event loop, detached from the request."""
+    task = asyncio.create_task(coro, name=name)
+    _running.add(task)
+    task.add_done_callback(_on_done)
+    return task
+
+
+def running_count() -> int:
+    """Return the number of background jobs still in flight."""
+    return len(_running)
+
+
+async def cancel_all() -> None:
+    """Cancel every in-flight job and wait for them to unwind (app shutdown)."""
+    tasks = list(_running)
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -15,6 +15,8 @@ class Settings(BaseSettings):
     VERSION: str = "0.1.0"
     DESCRIPTION: str = "AI-Powered Penetration Testing Framework"
     ENVIRONMENT: str = "development"
+    # Debug mode: unhandled exception messages go into 500 response bodies
+    DEBUG: bool = False
     
     # API Configuration
     API_HOST: str = "0.0.0.0"
@@ -50,12 +52,22 @@ class Settings(BaseSettings):
     def DATABASE_URL(self) -> str:
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
     
+    # Prisma query-engine connection pool per process; 0 = Prisma's default
+    # (2 * CPUs + 1).  Size it to about twice the concurrent workers.
+    DATABASE_POOL_SIZE: int = 0
+    
     # Database - Neo4j
     NEO4J_URI: str = "bolt://localhost:7687"
     NEO4J_USER: str = "neo4j"
     NEO4J_PASSWORD: str = "autopentestai_dev_password"
     NEO4J_DATABASE: str = "neo4j"
     
+    # Redis (background task state); empty = in-process store
+    REDIS_URL: str = ""
+    # Queue recon jobs for the arq worker (app.workers.recon_worker) instead
+    # of running them in the API process; requires REDIS_URL and arq
+    RECON_WORKER_ENABLED: bool = False
+    
     # AI Configuration
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = "gpt-4-turbo-preview"
@@ -65,6 +77,8 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"
     LOG_CORRELATION_ID_HEADER: str = "X-Request-ID"
+    # Report request processing time in a Server-Timing response header
+    SERVER_TIMING_ENABLED: bool = False
     
     class Config:
         env_file = ".env"
@@ -45,3 +45,13 @@ errors_total = Counter(
     "Total errors",
     ["error_type", "endpoint"]
 )
+
+# SSE metrics
+sse_events_dropped_total = Counter(
+    "sse_events_dropped_total",
+    "SSE events discarded because a client's queue was full"
+)
+sse_slow_clients_disconnected_total = Counter(
+    "sse_slow_clients_disconnected_total",
+    "SSE clients disconnected for falling too far behind"
+)
@@ -6,13 +6,24 @@ from typing import Optional, Dict, Any
 from jose import JWTError, jwt
 import hashlib
 import secrets
+import time
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.core.config import settings
+from app.utils.ttl_cache import TTLCache
 
 security = HTTPBearer()
 
+# Verified token payloads, so polling clients skip repeated JWT verification.
+# Entries are dropped after TOKEN_CACHE_TTL_SECONDS idle and never outlive
+# the token's own "exp" claim.
+TOKEN_CACHE_MAX = 8192
+TOKEN_CACHE_TTL_SECONDS = 60
+_token_cache: TTLCache[str, Dict[str, Any]] = TTLCache(
+    maxsize=TOKEN_CACHE_MAX, ttl_seconds=TOKEN_CACHE_TTL_SECONDS
+)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
@@ -20,7 +31,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     salt = hashed_password.split(':')[0]
     password_hash = hashed_password.split(':')[1]
     computed_hash = hashlib.sha256((salt + plain_password).encode()).hexdigest()
-    return computed_hash == password_hash
+    return secrets.compare_digest(computed_hash, password_hash)
 
 
 def get_password_hash(password: str) -> str:
@@ -97,6 +108,30 @@ def decode_token(token: str) -> Dict[str, Any]:
         ) from e
 
 
+def verify_token(token: str) -> Dict[str, Any]:
+    """
+    Decode and verify a JWT token, reusing a recent verification if cached
+    
+    Only tokens carrying an ``exp`` claim are cached, and a cached payload
+    is re-verified once that time has passed.
+    
+    Args:
+        token: JWT token to verify
+        
+    Returns:
+        Decoded token payload (a copy the caller may modify)
+        
+    Raises:
+        HTTPException: If token is invalid or expired
+    """
+    payload = _token_cache.get(token)
+    if payload is None or payload["exp"] <= time.time():
+        payload = decode_token(token)
+        if "exp" in payload:
+            _token_cache[token] = payload
+    return dict(payload)
+
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
     """
     Dependency to get current user from token
@@ -110,7 +145,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     Raises:
         HTTPException: If credentials are invalid
     """
-    token_data = decode_token(credentials.credentials)
+    token_data = verify_token(credentials.credentials)
     user_id = token_data.get("sub")
     
     if not user_id:
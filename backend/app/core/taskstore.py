@@ -0,0 +1,295 @@
+"""
+Background task state store shared by the long-running scan/discovery APIs.
+
+Task records are hashes (one field per attribute) and bulky results are
+lists, so status polls never touch the result payload.  Keys may be given a
+TTL so finished tasks expire, and per-owner indexes (sorted by score, e.g.
+creation time) give paginated listings without scanning every task.  When ``REDIS_URL``
+is configured the store lives in Redis and is shared by every uvicorn
+worker; otherwise an in-process backend with the same interface is used,
+which keeps single-worker development and the test-suite dependency free.
+
+Usage::
+
+    from app.core import taskstore
+
+    await taskstore.hset_task("disc:123", {"status": "running"})
+    task = await taskstore.hgetall_task("disc:123")   # {} if missing
+    await taskstore.rpush_items("disc:123:result", [{"url": "..."}])
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence
+
+import orjson
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Redis connection pool size per worker process
+REDIS_MAX_CONNECTIONS = 32
+
+# HSET only when the hash still exists, atomically (so a deleted task stays deleted)
+_HSET_IF_EXISTS_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV))
+return 1
+"""
+
+
+class InMemoryTaskStore:
+    """Process-local backend; state is lost on restart and not shared."""
+
+    def __init__(self) -> None:
+        self._hashes: Dict[str, Dict[str, Any]] = {}
+        self._lists: Dict[str, List[Any]] = {}
+        self._indexes: Dict[str, Dict[str, float]] = {}
+        self._expiry: Dict[str, float] = {}  # key -> monotonic deadline
+
+    def _purge(self, key: str) -> None:
+        """Drop *key* if its TTL has passed (expiry is applied lazily on access)."""
+        deadline = self._expiry.get(key)
+        if deadline is not None and time.monotonic() >= deadline:
+            self._delete(key)
+
+    def _delete(self, key: str) -> None:
+        self._hashes.pop(key, None)
+        self._lists.pop(key, None)
+        self._indexes.pop(key, None)
+        self._expiry.pop(key, None)
+
+    async def hset_task(self, key: str, mapping: Mapping[str, Any]) -> None:
+        self._purge(key)
+        self._hashes.setdefault(key, {}).update(mapping)
+
+    async def hset_task_if_exists(self, key: str, mapping: Mapping[str, Any]) -> bool:
+        self._purge(key)
+        task = self._hashes.get(key)
+        if task is None:
+            return False
+        task.update(mapping)
+        return True
+
+    async def hgetall_task(self, key: str) -> Dict[str, Any]:
+        self._purge(key)
+        return dict(self._hashes.get(key, {}))
+
+    async def hmget_task(self, key: str, fields: Sequence[str]) -> Dict[str, Any]:
+        self._purge(key)
+        task = self._hashes.get(key, {})
+        return {field: task.get(field) for field in fields}
+
+    async def hdel_task(self, key: str) -> None:
+        self._delete(key)
+
+    async def expire_task(self, key: str, seconds: int) -> None:
+        self._purge(key)
+        if key in self._hashes or key in self._lists or key in self._indexes:
+            self._expiry[key] = time.monotonic() + seconds
+
+    async def rpush_items(self, key: str, items: Sequence[Any]) -> None:
+        self._purge(key)
+        if items:
+            self._lists.setdefault(key, []).extend(items)
+
+    async def lrange_items(self, key: str, start: int = 0, end: int = -1) -> List[Any]:
+        self._purge(key)
+        items = self._lists.get(key, [])
+        return items[start:] if end == -1 else items[start:end + 1]
+
+    async def lindex_items(self, key: str, indices: Sequence[int]) -> List[Any]:
+        self._purge(key)
+        items = self._lists.get(key, [])
+        # Positions past the end are skipped, as LINDEX returns nil for them
+        return [items[i] for i in indices if -len(items) <= i < len(items)]
+
+    async def zadd_index(self, key: str, member: str, score: float) -> None:
+        self._purge(key)
+        self._indexes.setdefault(key, {})[member] = score
+
+    async def zrem_index(self, key: str, member: str) -> None:
+        self._purge(key)
+        self._indexes.get(key, {}).pop(member, None)
+
+    async def zcard_index(self, key: str) -> int:
+        self._purge(key)
+        return len(self._indexes.get(key, {}))
+
+    async def zrange_index(self, key: str, start: int = 0, end: int = -1) -> List[str]:
+        self._purge(key)
+        index = self._indexes.get(key, {})
+        members = sorted(index, key=lambda m: (index[m], m))
+        return members[start:] if end == -1 else members[start:end + 1]
+
+    async def scan_tasks(self, prefix: str) -> AsyncIterator[str]:
+        for key in list(self._hashes):
+            self._purge(key)
+            if key in self._hashes and key.startswith(prefix):
+                yield key
+
+
+class RedisTaskStore:
+    """Redis backend; hash fields and list items are orjson-encoded."""
+
+    def __init__(self, url: str) -> None:
+        import redis.asyncio as redis
+
+        self._redis = redis.Redis.from_url(
+            url, max_connections=REDIS_MAX_CONNECTIONS, decode_responses=True
+        )
+        self._hset_if_exists = self._redis.register_script(_HSET_IF_EXISTS_LUA)
+
+    async def hset_task(self, key: str, mapping: Mapping[str, Any]) -> None:
+        await self._redis.hset(
+            key, mapping={field: orjson.dumps(value) for field, value in mapping.items()}
+        )
+
+    async def hset_task_if_exists(self, key: str, mapping: Mapping[str, Any]) -> bool:
+        args: List[Any] = []
+        for field, value in mapping.items():
+            args += (field, orjson.dumps(value))
+        return bool(await self._hset_if_exists(keys=[key], args=args))
+
+    async def hgetall_task(self, key: str) -> Dict[str, Any]:
+        raw = await self._redis.hgetall(key)
+        return {field: orjson.loads(value) for field, value in raw.items()}
+
+    async def hmget_task(self, key: str, fields: Sequence[str]) -> Dict[str, Any]:
+        raw = await self._redis.hmget(key, fields)
+        return {
+            field: None if value is None else orjson.loads(value)
+            for field, value in zip(fields, raw)
+        }
+
+    async def hdel_task(self, key: str) -> None:
+        await self._redis.delete(key)
+
+    async def expire_task(self, key: str, seconds: int) -> None:
+        await self._redis.expire(key, seconds)
+
+    async def rpush_items(self, key: str, items: Sequence[Any]) -> None:
+        if items:
+            await self._redis.rpush(key, *(orjson.dumps(item) for item in items))
+
+    async def lrange_items(self, key: str, start: int = 0, end: int = -1) -> List[Any]:
+        return [orjson.loads(item) for item in await self._redis.lrange(key, start, end)]
+
+    async def lindex_items(self, key: str, indices: Sequence[int]) -> List[Any]:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for i in indices:
+                pipe.lindex(key, i)
+            raw = await pipe.execute()
+        return [orjson.loads(item) for item in raw if item is not None]
+
+    async def zadd_index(self, key: str, member: str, score: float) -> None:
+        await self._redis.zadd(key, {member: score})
+
+    async def zrem_index(self, key: str, member: str) -> None:
+        await self._redis.zrem(key, member)
+
+    async def zcard_index(self, key: str) -> int:
+        return await self._redis.zcard(key)
+
+    async def zrange_index(self, key: str, start: int = 0, end: int = -1) -> List[str]:
+        return await self._redis.zrange(key, start, end)
+
+    async def scan_tasks(self, prefix: str) -> AsyncIterator[str]:
+        async for key in self._redis.scan_iter(match=f"{prefix}*", _type="hash"):
+            yield key
+
+
+_store: Optional[InMemoryTaskStore | RedisTaskStore] = None
+
+
+def get_task_store() -> InMemoryTaskStore | RedisTaskStore:
+    """Return the process-wide task store, creating it on first use."""
+    global _store
+    if _store is None:
+        if settings.REDIS_URL:
+            _store = RedisTaskStore(settings.REDIS_URL)
+        else:
+            logger.warning(
+                "taskstore: REDIS_URL not set — using in-process task store; "
+                "task state is per-worker and lost on restart."
+            )
+            _store = InMemoryTaskStore()
+    return _store
+
+
+async def hset_task(key: str, mapping: Mapping[str, Any]) -> None:
+    """Set (merge) fields of the task hash at *key*."""
+    await get_task_store().hset_task(key, mapping)
+
+
+async def hset_task_if_exists(key: str, mapping: Mapping[str, Any]) -> bool:
+    """Set fields of the task hash at *key* only if it exists; returns whether it did."""
+    return await get_task_store().hset_task_if_exists(key, mapping)
+
+
+async def hgetall_task(key: str) -> Dict[str, Any]:
+    """Return all fields of the task hash at *key* (empty dict if missing)."""
+    return await get_task_store().hgetall_task(key)
+
+
+async def hmget_task(key: str, fields: Sequence[str]) -> Dict[str, Any]:
+    """Return only *fields* of the task hash at *key* (``None`` when absent)."""
+    return await get_task_store().hmget_task(key, fields)
+
+
+async def hdel_task(key: str) -> None:
+    """Delete the task hash or list at *key*."""
+    await get_task_store().hdel_task(key)
+
+
+async def expire_task(key: str, seconds: int) -> None:
+    """Expire the hash, list or index at *key* after *seconds*."""
+    await get_task_store().expire_task(key, seconds)
+
+
+async def rpush_items(key: str, items: Sequence[Any]) -> None:
+    """Append *items* to the list at *key*."""
+    await get_task_store().rpush_items(key, items)
+
+
+async def lrange_items(key: str, start: int = 0, end: int = -1) -> List[Any]:
+    """Return items ``start..end`` (inclusive, Redis semantics) of the list at *key*."""
+    return await get_task_store().lrange_items(key, start, end)
+
+
+async def lindex_items(key: str, indices: Sequence[int]) -> List[Any]:
+    """
+    Return the items at *indices* of the list at *key*, in the given order.
+
+    Positions missing from the list (e.g. once it has expired) are skipped.
+    """
+    return await get_task_store().lindex_items(key, indices)
+
+
+async def zadd_index(key: str, member: str, score: float) -> None:
+    """Add (or re-score) *member* in the sorted index at *key*."""
+    await get_task_store().zadd_index(key, member, score)
+
+
+async def zrem_index(key: str, member: str) -> None:
+    """Remove *member* from the sorted index at *key*."""
+    await get_task_store().zrem_index(key, member)
+
+
+async def zcard_index(key: str) -> int:
+    """Return the number of members in the sorted index at *key*."""
+    return await get_task_store().zcard_index(key)
+
+
+async def zrange_index(key: str, start: int = 0, end: int = -1) -> List[str]:
+    """Return members ``start..end`` (inclusive) of the index at *key*, lowest score first."""
+    return await get_task_store().zrange_index(key, start, end)
+
+
+def scan_tasks(prefix: str) -> AsyncIterator[str]:
+    """Iterate over task hash keys starting with *prefix*."""
+    return get_task_store().scan_tasks(prefix)
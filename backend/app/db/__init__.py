@@ -1,13 +1,27 @@
 """
 Database clients and utilities
 """
-from app.db.neo4j_client import Neo4jClient, neo4j_client, get_neo4j_client
+import importlib
+
 from app.db.prisma_client import get_prisma, disconnect_prisma
 
+# The Neo4j client (and its driver) is imported on first access (PEP 562),
+# so code that only needs Prisma or the repositories does not load it.
+# The shared instance is imported from ``app.db.neo4j_client`` itself: once
+# loaded lazily, that name on this package is the submodule.
+_NEO4J_EXPORTS = ('Neo4jClient', 'get_neo4j_client')
+
 __all__ = [
     'Neo4jClient',
-    'neo4j_client',
     'get_neo4j_client',
     'get_prisma',
     'disconnect_prisma',
 ]
+
+
+def __getattr__(name):
+    if name in _NEO4J_EXPORTS:
+        value = getattr(importlib.import_module('app.db.neo4j_client'), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,13 +3,33 @@ Async Prisma Client Singleton
 Manages the shared Prisma client instance with connection pooling
 """
 import logging
+import os
 from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 logger = logging.getLogger(__name__)
 
 _prisma_client = None
 
 
+def _pooled_url(url: str, pool_size: int) -> str:
+    """Return *url* with Prisma's ``connection_limit`` set to *pool_size*."""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k != "connection_limit"]
+    query.append(("connection_limit", str(pool_size)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _client_kwargs() -> dict:
+    """Prisma() arguments applying ``DATABASE_POOL_SIZE``, if configured."""
+    from app.core.config import settings
+
+    if settings.DATABASE_POOL_SIZE <= 0:
+        return {}
+    url = os.environ.get("DATABASE_URL") or settings.DATABASE_URL
+    return {"datasource": {"url": _pooled_url(url, settings.DATABASE_POOL_SIZE)}}
+
+
 async def get_prisma():
     """
     Return the global Prisma client, connecting on first call.
@@ -23,7 +43,7 @@ async def get_prisma():
     global _prisma_client
     if _prisma_client is None:
         from prisma import Prisma  # lazy – only needs generated client at call time
-        _prisma_client = Prisma()
+        _prisma_client = Prisma(**_client_kwargs())
         await _prisma_client.connect()
         logger.info("Prisma client connected")
     return _prisma_client
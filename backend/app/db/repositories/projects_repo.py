@@ -4,6 +4,7 @@ Handles all database operations for the Project model.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
@@ -142,18 +143,24 @@ class ProjectsRepository(BaseRepository):
         if project_type:
             where["project_type"] = project_type
         if search:
+            # Prisma compiles these to ILIKE '%term%' on Postgres; the
+            # pg_trgm GIN indexes on name and target serve both arms
             where["OR"] = [
                 {"name": {"contains": search, "mode": "insensitive"}},
                 {"target": {"contains": search, "mode": "insensitive"}},
             ]
 
-        projects = await self.db.project.find_many(
-            where=where,
-            skip=skip,
-            take=take,
-            order={"created_at": "desc"},
+        # Independent reads: issue both at once so the page costs one round
+        # trip of latency rather than two (Prisma's batch_ only takes writes)
+        projects, total = await asyncio.gather(
+            self.db.project.find_many(
+                where=where,
+                skip=skip,
+                take=take,
+                order={"created_at": "desc"},
+            ),
+            self.db.project.count(where=where),
         )
-        total = await self.db.project.count(where=where)
         return {"projects": projects, "total": total}
 
     # ------------------------------------------------------------------
@@ -175,19 +182,22 @@ class ProjectsRepository(BaseRepository):
         Only non-None values are written.
 
         Returns:
-            Updated Project record, or *None* if not found.
+            Updated Project record, or *None* if not found or if every field
+            is *None* (nothing is sent to the database).
         """
-        data = self._strip_none(
-            {
-                "name": name,
-                "description": description,
-                "status": status,
-                "started_at": started_at,
-                "completed_at": completed_at,
-            }
-        )
+        data: Dict[str, Any] = {}
+        if name is not None:
+            data["name"] = name
+        if description is not None:
+            data["description"] = description
+        if status is not None:
+            data["status"] = status
+        if started_at is not None:
+            data["started_at"] = started_at
+        if completed_at is not None:
+            data["completed_at"] = completed_at
         if not data:
-            return await self.get_by_id(project_id)
+            return None
         return await self.db.project.update(where={"id": project_id}, data=data)
 
     async def update_status(self, project_id: str, status: str) -> Optional[Project]:
@@ -4,6 +4,7 @@ Handles all database operations for the Session model (JWT refresh tokens).
 """
 from __future__ import annotations
 
+import hashlib
 import logging
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, List, Optional
@@ -16,6 +17,20 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Rows removed per delete statement by cleanup_expired
+CLEANUP_BATCH_SIZE = 5000
+
+
+def hash_token(token: str) -> str:
+    """
+    Return the value stored for *token* in ``sessions.token_hash``.
+
+    Only this BLAKE2b-256 digest is persisted, so the unique index holds
+    64-character keys instead of whole JWTs and a database leak exposes no
+    usable refresh tokens.
+    """
+    return hashlib.blake2b(token.encode(), digest_size=32).hexdigest()
+
 
 class SessionsRepository(BaseRepository):
     """Repository for Session CRUD, token validation, and cleanup."""
@@ -36,7 +51,7 @@ class SessionsRepository(BaseRepository):
 
         Args:
             user_id: Owner of the session.
-            token: The raw JWT refresh token string.
+            token: The raw JWT refresh token string (stored hashed).
 
         Returns:
             The created Session record.
@@ -45,7 +60,7 @@ class SessionsRepository(BaseRepository):
         session = await self.db.session.create(
             data={
                 "user_id": user_id,
-                "token": token,
+                "token_hash": hash_token(token),
                 "expires_at": expires_at,
             }
         )
@@ -58,16 +73,15 @@ class SessionsRepository(BaseRepository):
 
     async def get_by_token(self, token: str) -> Optional[Session]:
         """Return a Session by its raw token value, or *None*."""
-        return await self.db.session.find_unique(where={"token": token})
+        return await self.db.session.find_unique(where={"token_hash": hash_token(token)})
 
     async def get_active_sessions(self, user_id: str) -> List[Session]:
         """Return all non-revoked, non-expired sessions for a user."""
-        now = datetime.utcnow()
         return await self.db.session.find_many(
             where={
                 "user_id": user_id,
                 "is_revoked": False,
-                "expires_at": {"gt": now},
+                "expires_at": {"gt": datetime.utcnow()},
             }
         )
 
@@ -79,6 +93,9 @@ class SessionsRepository(BaseRepository):
         """
         Return *True* if the token exists, is not revoked, and has not
         expired.
+
+        Not cached: a refresh token is rotated right after it validates, so a
+        replayed token must see the revocation at once, in every worker.
         """
         session = await self.get_by_token(token)
         if session is None:
@@ -97,17 +114,18 @@ class SessionsRepository(BaseRepository):
         """
         Mark a session as revoked.
 
+        A single ``update`` round trip: Prisma returns *None* for a token
+        with no matching row, so no prior lookup is needed.
+
         Returns:
             The updated Session, or *None* if the token was not found.
         """
-        session = await self.get_by_token(token)
-        if session is None:
-            return None
         updated = await self.db.session.update(
-            where={"token": token},
+            where={"token_hash": hash_token(token)},
             data={"is_revoked": True},
         )
-        logger.info("Revoked session %s", session.id)
+        if updated is not None:
+            logger.info("Revoked session %s", updated.id)
         return updated
 
     async def revoke_all_user_sessions(self, user_id: str) -> int:
@@ -132,17 +150,30 @@ class SessionsRepository(BaseRepository):
         """
         Delete all expired or revoked sessions from the database.
 
+        Each predicate is deleted separately (an ``OR`` of the two defeats
+        their indexes) in batches of ``CLEANUP_BATCH_SIZE`` rows, so a large
+        backlog never becomes one long lock-holding delete.
+
         Returns:
             Number of sessions deleted.
         """
         now = datetime.utcnow()
-        count = await self.db.session.delete_many(
-            where={
-                "OR": [
-                    {"expires_at": {"lt": now}},
-                    {"is_revoked": True},
-                ]
-            }
-        )
+        count = 0
+        for where in ({"expires_at": {"lt": now}}, {"is_revoked": True}):
+            count += await self._delete_in_batches(where)
         logger.info("Cleaned up %d expired/revoked sessions", count)
         return count
+
+    async def _delete_in_batches(self, where: dict) -> int:
+        deleted = 0
+        while True:
+            batch = await self.db.session.find_many(
+                where=where, take=CLEANUP_BATCH_SIZE
+            )
+            if not batch:
+                return deleted
+            deleted += await self.db.session.delete_many(
+                where={"id": {"in": [s.id for s in batch]}}
+            )
+            if len(batch) < CLEANUP_BATCH_SIZE:
+                return deleted
@@ -6,9 +6,10 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from app.db.repositories.base import BaseRepository
+from app.utils.dataloader import DataLoader
 
 if TYPE_CHECKING:
     from prisma.models import Task, TaskLog, TaskMetrics, TaskResult
@@ -21,6 +22,16 @@ class TasksRepository(BaseRepository):
 
     def __init__(self, db: Any) -> None:
         super().__init__(db)
+        # Plain lookups by ID, batched per event-loop tick
+        self._loader = DataLoader(self._load_by_ids)
+
+    async def _load_by_ids(self, task_ids: List[str]) -> List[Optional[Task]]:
+        """Fetch tasks (without relations) in the order of *task_ids*."""
+        if len(task_ids) == 1:
+            return [await self.db.task.find_unique(where={"id": task_ids[0]})]
+        tasks = await self.db.task.find_many(where={"id": {"in": task_ids}})
+        by_id = {task.id: task for task in tasks}
+        return [by_id.get(task_id) for task_id in task_ids]
 
     # ------------------------------------------------------------------
     # Create
@@ -60,38 +71,42 @@ class TasksRepository(BaseRepository):
 
     async def get_by_id(self, task_id: str, include_relations: bool = False) -> Optional[Task]:
         """Return a task by primary key."""
-        include: Dict[str, Any] = {}
-        if include_relations:
-            include = {
-                "results": True,
-                "logs": True,
-                "metrics": True,
-                "recon_task": True,
-                "port_scan_task": True,
-                "http_probe_task": True,
-            }
-        return await self.db.task.find_unique(where={"id": task_id}, include=include or None)
+        if not include_relations:
+            return await self._loader.load(task_id)
+        include = {
+            "results": True,
+            "logs": True,
+            "metrics": True,
+            "recon_task": True,
+            "port_scan_task": True,
+            "http_probe_task": True,
+        }
+        return await self.db.task.find_unique(where={"id": task_id}, include=include)
 
     async def get_by_project(
         self,
         project_id: str,
-        skip: int = 0,
+        cursor: Optional[str] = None,
         take: int = 50,
         status: Optional[str] = None,
         task_type: Optional[str] = None,
-    ) -> List[Task]:
+    ) -> Tuple[List[Task], Optional[str]]:
         """
-        Return tasks for a project, newest first, with optional filters.
+        Return a page of tasks for a project, newest first, with optional filters.
+
+        Pages are keyset-based: pass the previous page's ``next_cursor`` to
+        continue after its last task, so late pages cost the same as the
+        first one (served by the ``(project_id, created_at, id)`` index).
 
         Args:
             project_id: Filter by project.
-            skip: Pagination offset.
+            cursor: ID of the last task of the previous page.
             take: Page size.
             status: Optional status filter.
             task_type: Optional type filter.
 
         Returns:
-            List of Task records.
+            Tuple of (Task records, cursor for the next page or *None*).
         """
         where: Dict[str, Any] = {"project_id": project_id}
         if status:
@@ -99,12 +114,25 @@ class TasksRepository(BaseRepository):
         if task_type:
             where["type"] = task_type
 
-        return await self.db.task.find_many(
+        tasks = await self.db.task.find_many(
             where=where,
-            skip=skip,
             take=take,
-            order={"created_at": "desc"},
+            order=[{"created_at": "desc"}, {"id": "desc"}],
+            **self._cursor_args(cursor),
         )
+        return tasks, self._next_cursor(tasks, take)
+
+    @staticmethod
+    def _cursor_args(cursor: Optional[str]) -> Dict[str, Any]:
+        """Return the ``find_many`` arguments that resume after *cursor*."""
+        if cursor is None:
+            return {}
+        return {"cursor": {"id": cursor}, "skip": 1}
+
+    @staticmethod
+    def _next_cursor(rows: List[Any], take: int) -> Optional[str]:
+        """Return the cursor for the page after *rows*, or *None* on the last page."""
+        return rows[-1].id if rows and len(rows) == take else None
 
     async def count_by_project(
         self, project_id: str, status: Optional[str] = None
@@ -142,20 +170,70 @@ class TasksRepository(BaseRepository):
         Returns:
             Updated Task record.
         """
-        now = datetime.utcnow()
+        data = self._status_data(status, started_at, completed_at)
+        return await self.db.task.update(where={"id": task_id}, data=data)
+
+    @staticmethod
+    def _status_data(
+        status: str,
+        started_at: Optional[datetime] = None,
+        completed_at: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Build the Task update for a status transition (see ``update_status``)."""
         data: Dict[str, Any] = {"status": status}
 
-        if status == "running" and started_at is None:
-            data["started_at"] = now
-        elif started_at is not None:
+        if started_at is None and status == "running":
+            started_at = datetime.utcnow()
+        if started_at is not None:
             data["started_at"] = started_at
 
-        if status in ("completed", "failed", "cancelled") and completed_at is None:
-            data["completed_at"] = now
-        elif completed_at is not None:
+        if completed_at is None and status in ("completed", "failed", "cancelled"):
+            completed_at = datetime.utcnow()
+        if completed_at is not None:
             data["completed_at"] = completed_at
 
-        return await self.db.task.update(where={"id": task_id}, data=data)
+        return data
+
+    async def finalize_task(
+        self,
+        task_id: str,
+        status: str,
+        metrics: Optional[Dict[str, Any]] = None,
+        log_msg: Optional[str] = None,
+        log_level: str = "info",
+        completed_at: Optional[datetime] = None,
+    ) -> Optional[Task]:
+        """
+        Finish a task in one interactive transaction.
+
+        Applies the status transition, upserts the metrics record and
+        appends the closing log entry atomically, so readers never see a
+        finished task with half-written metrics. Each statement is still its
+        own round trip (between BEGIN and COMMIT); only atomicity is gained.
+
+        Args:
+            task_id: Task primary key.
+            status: Final status value (``completed``, ``failed``, ...).
+            metrics: Optional ``upsert_metrics`` keyword arguments.
+            log_msg: Optional log message to append.
+            log_level: Level of the appended log entry.
+            completed_at: Override completion timestamp.
+
+        Returns:
+            Updated Task record.
+        """
+        async with self.db.tx() as tx:
+            task = await tx.task.update(
+                where={"id": task_id},
+                data=self._status_data(status, completed_at=completed_at),
+            )
+            if metrics is not None:
+                await tx.taskmetrics.upsert(**self._metrics_upsert(task_id, **metrics))
+            if log_msg:
+                await tx.tasklog.create(
+                    data={"task_id": task_id, "level": log_level, "message": log_msg}
+                )
+        return task
 
     # ------------------------------------------------------------------
     # Task Results
@@ -193,6 +271,22 @@ class TasksRepository(BaseRepository):
             order={"created_at": "asc"},
         )
 
+    async def iter_results(self, task_id: str, page_size: int = 100) -> AsyncIterator[TaskResult]:
+        """Yield a task's result records, oldest first, one keyset page at a time."""
+        cursor: Optional[str] = None
+        while True:
+            results = await self.db.taskresult.find_many(
+                where={"task_id": task_id},
+                take=page_size,
+                order=[{"created_at": "asc"}, {"id": "asc"}],
+                **self._cursor_args(cursor),
+            )
+            for result in results:
+                yield result
+            cursor = self._next_cursor(results, page_size)
+            if cursor is None:
+                return
+
     # ------------------------------------------------------------------
     # Task Logs
     # ------------------------------------------------------------------
@@ -229,19 +323,41 @@ class TasksRepository(BaseRepository):
         self,
         task_id: str,
         level: Optional[str] = None,
-        skip: int = 0,
+        cursor: Optional[str] = None,
         take: int = 200,
-    ) -> List[TaskLog]:
-        """Return paginated log entries for a task."""
+    ) -> Tuple[List[TaskLog], Optional[str]]:
+        """
+        Return a keyset-paginated page of log entries for a task, oldest first.
+
+        Returns:
+            Tuple of (TaskLog records, cursor for the next page or *None*).
+        """
         where: Dict[str, Any] = {"task_id": task_id}
         if level:
             where["level"] = level
-        return await self.db.tasklog.find_many(
+        logs = await self.db.tasklog.find_many(
             where=where,
-            skip=skip,
             take=take,
-            order={"created_at": "asc"},
+            order=[{"created_at": "asc"}, {"id": "asc"}],
+            **self._cursor_args(cursor),
         )
+        return logs, self._next_cursor(logs, take)
+
+    async def iter_logs(
+        self, task_id: str, level: Optional[str] = None, page_size: int = 500
+    ) -> AsyncIterator[TaskLog]:
+        """
+        Yield every log entry for a task, oldest first, one keyset page at a
+        time, so memory stays bounded by *page_size* and callers can start
+        writing out entries before the last page is fetched.
+        """
+        cursor: Optional[str] = None
+        while True:
+            logs, cursor = await self.get_logs(task_id, level=level, cursor=cursor, take=page_size)
+            for log in logs:
+                yield log
+            if cursor is None:
+                return
 
     # ------------------------------------------------------------------
     # Task Metrics
@@ -262,6 +378,27 @@ class TasksRepository(BaseRepository):
         Returns:
             The TaskMetrics record.
         """
+        return await self.db.taskmetrics.upsert(
+            **self._metrics_upsert(
+                task_id,
+                duration_seconds=duration_seconds,
+                memory_mb=memory_mb,
+                cpu_percent=cpu_percent,
+                items_processed=items_processed,
+                error_count=error_count,
+            )
+        )
+
+    @staticmethod
+    def _metrics_upsert(
+        task_id: str,
+        duration_seconds: Optional[float] = None,
+        memory_mb: Optional[float] = None,
+        cpu_percent: Optional[float] = None,
+        items_processed: int = 0,
+        error_count: int = 0,
+    ) -> Dict[str, Any]:
+        """Build the ``taskmetrics.upsert`` arguments (see ``upsert_metrics``)."""
         data: Dict[str, Any] = {
             "items_processed": items_processed,
             "error_count": error_count,
@@ -273,13 +410,13 @@ class TasksRepository(BaseRepository):
         if cpu_percent is not None:
             data["cpu_percent"] = cpu_percent
 
-        return await self.db.taskmetrics.upsert(
-            where={"task_id": task_id},
-            data={
+        return {
+            "where": {"task_id": task_id},
+            "data": {
                 "create": {"task_id": task_id, **data},
                 "update": data,
             },
-        )
+        }
 
     # ------------------------------------------------------------------
     # Delete
@@ -5,22 +5,57 @@ Handles all database operations for the User model.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from app.core.security import get_password_hash, verify_password
 from app.db.repositories.base import BaseRepository
+from app.utils.dataloader import DataLoader
+from app.utils.ttl_cache import TTLCache
 
 if TYPE_CHECKING:
     from prisma.models import User
 
 logger = logging.getLogger(__name__)
 
+# Checked against when the username is unknown, so a miss costs the same
+# password verification as a hit and response times don't reveal which
+# usernames exist.
+_DUMMY_HASH = get_password_hash("!invalid_placeholder!")
+
+# Recently looked-up users, so repeated logins skip the database.  Keyed by
+# ("username", value) and ("email", value).  Entries expire a fixed
+# USER_CACHE_TTL_SECONDS after they were loaded (reads do not extend them), so
+# another worker serves a stale record for at most that long; writes in this
+# process evict a user at once, through the user ID -> cache keys index.
+USER_CACHE_MAX = 4096
+USER_CACHE_TTL_SECONDS = 5
+_user_cache: TTLCache[Tuple[str, str], User] = TTLCache(
+    maxsize=USER_CACHE_MAX, ttl_seconds=USER_CACHE_TTL_SECONDS, refresh_on_access=False
+)
+_user_cache_keys: TTLCache[str, Tuple[Tuple[str, str], ...]] = TTLCache(
+    maxsize=USER_CACHE_MAX, ttl_seconds=USER_CACHE_TTL_SECONDS, refresh_on_access=False
+)
+
 
 class UsersRepository(BaseRepository):
     """Repository for User CRUD operations."""
 
     def __init__(self, db: Any) -> None:
         super().__init__(db)
+        # Lookups by each unique field, batched per event-loop tick.  A
+        # repository lives for one request, and so do its loaders.
+        self._loaders = {
+            field: DataLoader(lambda values, field=field: self._load_by(field, values))
+            for field in ("id", "email", "username")
+        }
+
+    async def _load_by(self, field: str, values: List[str]) -> List[Optional[User]]:
+        """Fetch users by a unique *field*, in the order of *values*."""
+        if len(values) == 1:
+            return [await self.db.user.find_unique(where={field: values[0]})]
+        users = await self.db.user.find_many(where={field: {"in": values}})
+        by_value = {getattr(user, field): user for user in users}
+        return [by_value.get(value) for value in values]
 
     # ------------------------------------------------------------------
     # Create
@@ -66,15 +101,33 @@ class UsersRepository(BaseRepository):
 
     async def get_by_id(self, user_id: str) -> Optional[User]:
         """Return a user by primary key, or *None* if not found."""
-        return await self.db.user.find_unique(where={"id": user_id})
+        return await self._loaders["id"].load(user_id)
 
     async def get_by_email(self, email: str) -> Optional[User]:
         """Return a user by e-mail address, or *None* if not found."""
-        return await self.db.user.find_unique(where={"email": email})
+        return await self._cached_load("email", email)
 
     async def get_by_username(self, username: str) -> Optional[User]:
         """Return a user by username, or *None* if not found."""
-        return await self.db.user.find_unique(where={"username": username})
+        return await self._cached_load("username", username)
+
+    async def _cached_load(self, field: str, value: str) -> Optional[User]:
+        """Look a user up by *field* through the short-lived user cache."""
+        user = _user_cache.get((field, value))
+        if user is None:
+            user = await self._loaders[field].load(value)
+            if user is not None:
+                keys = (("username", user.username), ("email", user.email))
+                for key in keys:
+                    _user_cache[key] = user
+                _user_cache_keys[user.id] = keys
+        return user
+
+    @staticmethod
+    def _evict(user_id: str) -> None:
+        """Drop every cached entry for *user_id*."""
+        for key in _user_cache_keys.pop(user_id, ()):
+            _user_cache.pop(key)
 
     async def list_users(self, skip: int = 0, take: int = 50) -> List[User]:
         """Return a paginated list of all users."""
@@ -98,27 +151,33 @@ class UsersRepository(BaseRepository):
         Only the supplied (non-None) fields are written.
 
         Returns:
-            Updated User record, or *None* if the user does not exist.
+            Updated User record, or *None* if the user does not exist or if
+            every field is *None* (nothing is sent to the database).
         """
-        data = self._strip_none(
-            {
-                "email": email,
-                "full_name": full_name,
-                "is_active": is_active,
-                "is_admin": is_admin,
-            }
-        )
+        data: Dict[str, Any] = {}
+        if email is not None:
+            data["email"] = email
+        if full_name is not None:
+            data["full_name"] = full_name
+        if is_active is not None:
+            data["is_active"] = is_active
+        if is_admin is not None:
+            data["is_admin"] = is_admin
         if not data:
-            return await self.get_by_id(user_id)
-        return await self.db.user.update(where={"id": user_id}, data=data)
+            return None
+        user = await self.db.user.update(where={"id": user_id}, data=data)
+        self._evict(user_id)
+        return user
 
     async def update_password(self, user_id: str, new_password: str) -> Optional[User]:
         """Replace a user's hashed password."""
         hashed = get_password_hash(new_password)
-        return await self.db.user.update(
+        user = await self.db.user.update(
             where={"id": user_id},
             data={"hashed_password": hashed},
         )
+        self._evict(user_id)
+        return user
 
     # ------------------------------------------------------------------
     # Delete
@@ -137,6 +196,8 @@ class UsersRepository(BaseRepository):
             return user
         except Exception:
             return None
+        finally:
+            self._evict(user_id)
 
     # ------------------------------------------------------------------
     # Auth helper
@@ -150,8 +211,7 @@ class UsersRepository(BaseRepository):
         wrong.
         """
         user = await self.get_by_username(username)
-        if user is None:
-            return None
-        if not verify_password(password, user.hashed_password):
+        password_hash = user.hashed_password if user is not None else _DUMMY_HASH
+        if not verify_password(password, password_hash) or user is None:
             return None
         return user
@@ -3,11 +3,12 @@ AutoPenTest AI - Main Application Entry Point
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import asyncio
 import logging
 from datetime import datetime
 
+from app.core import background
 from app.core.config import settings
 from app.api import auth, projects, graph, agent
 from app.api import recon as recon_api
@@ -18,10 +19,10 @@ from app.api import scans_nuclei as scans_nuclei_api
 from app.api import discovery_urls as discovery_urls_api
 from app.api import cve_enrichment as cve_enrichment_api
 from app.api import enrichment_api as enrichment_cwe_api
-from app.api.sse import router as sse_router
+from app.api.sse import router as sse_router, sse_manager
 from app.api.metrics import router as metrics_router
 from app.websocket import router as ws_router
-from app.db import neo4j_client
+from app.db.neo4j_client import neo4j_client
 from app.db.prisma_client import get_prisma, disconnect_prisma
 from app.middleware import setup_middleware
 from app.core.logging import configure_logging
@@ -43,7 +44,9 @@ app = FastAPI(
     description=settings.DESCRIPTION,
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    # orjson encodes the large endpoint/result payloads several times faster
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -265,6 +268,15 @@ async def shutdown_event():
     except Exception as e:
         logger.error(f"Error closing Neo4j connection: {e}")
 
+    # Stop in-flight discovery/probe jobs
+    await background.cancel_all()
+
+    # Close the shared HTTP probe connection pool
+    await http_probe_api.close_http_client()
+
+    # Stop SSE channel relays
+    await sse_manager.close()
+
     # Disconnect Prisma client
     try:
         await disconnect_prisma()
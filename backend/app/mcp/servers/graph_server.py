@@ -33,11 +33,13 @@ class GraphQueryServer(MCPServer):
         self._neo4j_uri = neo4j_uri
         self._neo4j_user = neo4j_user
         self._neo4j_password = neo4j_password
+        self._driver = None
         super().__init__(
             name="GraphQuery",
             description="Neo4j attack-surface graph query server",
             port=8004,
         )
+        self.app.add_event_handler("shutdown", self.close)
 
     # ------------------------------------------------------------------
     # Tool definitions
@@ -161,15 +163,29 @@ class GraphQueryServer(MCPServer):
     # ------------------------------------------------------------------
 
     def _get_driver(self):
-        """Return a Neo4j AsyncDriver (lazy init)."""
-        try:
-            from neo4j import AsyncGraphDatabase
-            return AsyncGraphDatabase.driver(
+        """
+        Return the server's Neo4j AsyncDriver (lazy init).
+
+        The driver pools bolt connections and is safe to share between
+        concurrent sessions, so it is created once and reused by every
+        query instead of paying the connect/auth handshake per call.
+        """
+        if self._driver is None:
+            try:
+                from neo4j import AsyncGraphDatabase
+            except ImportError:
+                raise RuntimeError("neo4j package is not installed")
+            self._driver = AsyncGraphDatabase.driver(
                 self._neo4j_uri,
                 auth=(self._neo4j_user, self._neo4j_password),
             )
-        except ImportError:
-            raise RuntimeError("neo4j package is not installed")
+        return self._driver
+
+    async def close(self) -> None:
+        """Close the shared Neo4j driver, if one was opened."""
+        if self._driver is not None:
+            await self._driver.close()
+            self._driver = None
 
     def _tenant_filter(self, user_id: str, project_id: str) -> str:
         """Return a Cypher WHERE clause fragment for tenant isolation."""
@@ -212,7 +228,6 @@ class GraphQueryServer(MCPServer):
                     cypher + f" LIMIT {limit}",
                 )
                 records = [dict(r) for r in await result.data()]
-                await driver.close()
             return {"success": True, "rows": records, "count": len(records)}
         except Exception as exc:
             logger.error("Cypher query failed: %s", exc)
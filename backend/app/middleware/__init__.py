@@ -7,17 +7,39 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 from starlette.middleware.gzip import GZipMiddleware
+from starlette.datastructures import Headers, MutableHeaders
 import time
-import uuid
 import logging
-from typing import Callable
-from collections import defaultdict
-from datetime import datetime, timedelta
+from os import urandom
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from collections import deque
+from datetime import datetime
+
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 # Health/noise endpoints to skip logging
 _SKIP_LOG_PATHS = frozenset(["/health", "/readiness", "/"])
+# Endpoints exempt from rate limiting
+_RATE_LIMIT_EXEMPT_PATHS = frozenset(["/health", "/", "/docs", "/redoc", "/openapi.json"])
+# Unhandled exception messages go into 500 bodies only in debug mode
+_EXPOSE_EXC = settings.DEBUG
+# Security headers added to every response, pre-encoded as raw ASGI headers
+_SECURITY_HEADERS: List[Tuple[bytes, bytes]] = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"content-security-policy", b"default-src 'self'"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+]
+
+
+def _new_request_id() -> str:
+    """Return a random 128-bit request ID as 32 hex characters."""
+    return urandom(16).hex()
 
 
 class CorrelationIDMiddleware(BaseHTTPMiddleware):
@@ -30,7 +52,7 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
         self.header_name = header_name
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        correlation_id = request.headers.get(self.header_name) or str(uuid.uuid4())
+        correlation_id = request.headers.get(self.header_name) or _new_request_id()
         request.state.correlation_id = correlation_id
         # Ensure request_id is also set for compatibility
         if not hasattr(request.state, "request_id"):
@@ -53,7 +75,7 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         ``request_id`` is already present when this class executes.
     """
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        request_id = getattr(request.state, "request_id", None) or str(uuid.uuid4())
+        request_id = getattr(request.state, "request_id", None) or _new_request_id()
         request.state.request_id = request_id
 
         # Add request ID to response headers
@@ -77,27 +99,24 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         correlation_id = getattr(request.state, "correlation_id", "unknown")
         request_id = getattr(request.state, "request_id", "unknown")
 
-        # Approximate request size from content-length header
-        req_size = int(request.headers.get("content-length", 0))
-
         response = await call_next(request)
 
         duration_ms = (time.time() - start_time) * 1000
-        resp_size = int(response.headers.get("content-length", 0))
-
-        logger.info(
-            "HTTP request",
-            extra={
-                "correlation_id": correlation_id,
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "duration_ms": round(duration_ms, 2),
-                "request_size_bytes": req_size,
-                "response_size_bytes": resp_size,
-            },
-        )
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "HTTP request",
+                extra={
+                    "correlation_id": correlation_id,
+                    "request_id": request_id,
+                    "method": request.method,
+                    "path": request.url.path,
+                    "status_code": response.status_code,
+                    "duration_ms": round(duration_ms, 2),
+                    "request_size_bytes": int(request.headers.get("content-length", 0)),
+                    "response_size_bytes": int(response.headers.get("content-length", 0)),
+                },
+            )
 
         response.headers["X-Process-Time"] = f"{duration_ms / 1000:.3f}"
         return response
@@ -117,7 +136,7 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             
             # Log the error
             logger.error(
-                f"Unhandled exception in request {request_id}: {exc}",
+                "Unhandled exception in request %s: %s", request_id, exc,
                 exc_info=True
             )
             
@@ -126,13 +145,75 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
                 status_code=500,
                 content={
                     "error": "Internal Server Error",
-                    "message": str(exc) if logger.level == logging.DEBUG else "An unexpected error occurred",
+                    "message": str(exc) if _EXPOSE_EXC else "An unexpected error occurred",
                     "request_id": request_id,
                     "timestamp": datetime.utcnow().isoformat()
                 }
             )
 
 
+class _RequestWindows:
+    """
+    Per-IP sliding windows of request times for rate limiting.
+
+    Each IP keeps a deque of monotonic request times (ns), oldest first; at
+    most ``calls`` are ever needed.  Clients with no request inside the
+    window are dropped once per period, so the table cannot grow without
+    bound (no sweeper task needed).
+    """
+
+    def __init__(self, calls: int, period: int):
+        self.calls = calls
+        self.period = period
+        self._period_ns = period * 1_000_000_000
+        self.clients: Dict[str, Deque[int]] = {}
+        self._next_sweep_ns = time.monotonic_ns() + self._period_ns
+
+    def _sweep(self, cutoff: int) -> None:
+        """Forget clients with no request inside the window."""
+        idle = [ip for ip, times in self.clients.items() if not times or times[-1] <= cutoff]
+        for ip in idle:
+            del self.clients[ip]
+
+    def hit(self, client_ip: str) -> Optional[int]:
+        """
+        Record a request from *client_ip*.
+
+        Returns:
+            Requests left in the window, or *None* (request not recorded) if
+            the client is over the limit.
+        """
+        now = time.monotonic_ns()
+        cutoff = now - self._period_ns
+        if now >= self._next_sweep_ns:
+            self._sweep(cutoff)
+            self._next_sweep_ns = now + self._period_ns
+
+        # Slide the window: expired requests are at the left end
+        times = self.clients.get(client_ip)
+        if times is None:
+            times = self.clients[client_ip] = deque(maxlen=self.calls)
+        while times and times[0] <= cutoff:
+            times.popleft()
+
+        if len(times) >= self.calls:
+            return None
+        times.append(now)
+        return self.calls - len(times)
+
+    def too_many_requests(self) -> JSONResponse:
+        """Return the 429 response for a client over the limit."""
+        return JSONResponse(
+            status_code=429,
+            content={
+                "error": "Too Many Requests",
+                "message": f"Rate limit exceeded. Maximum {self.calls} requests per {self.period} seconds.",
+                "retry_after": self.period
+            },
+            headers={"Retry-After": str(self.period)}
+        )
+
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Simple rate limiting middleware
@@ -150,47 +231,28 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         super().__init__(app)
         self.calls = calls
         self.period = period
-        self.clients = defaultdict(list)
+        self.windows = _RequestWindows(calls, period)
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/", "/docs", "/redoc", "/openapi.json"]:
+        if request.url.path in _RATE_LIMIT_EXEMPT_PATHS:
             return await call_next(request)
         
         # Get client IP
         client_ip = request.client.host
-        now = datetime.now()
-        
-        # Clean old requests
-        self.clients[client_ip] = [
-            req_time for req_time in self.clients[client_ip]
-            if now - req_time < timedelta(seconds=self.period)
-        ]
         
         # Check rate limit
-        if len(self.clients[client_ip]) >= self.calls:
-            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-            return JSONResponse(
-                status_code=429,
-                content={
-                    "error": "Too Many Requests",
-                    "message": f"Rate limit exceeded. Maximum {self.calls} requests per {self.period} seconds.",
-                    "retry_after": self.period
-                },
-                headers={"Retry-After": str(self.period)}
-            )
-        
-        # Add current request
-        self.clients[client_ip].append(now)
+        remaining = self.windows.hit(client_ip)
+        if remaining is None:
+            logger.warning("Rate limit exceeded for IP: %s", client_ip)
+            return self.windows.too_many_requests()
         
         # Process request
         response = await call_next(request)
         
         # Add rate limit headers
         response.headers["X-RateLimit-Limit"] = str(self.calls)
-        response.headers["X-RateLimit-Remaining"] = str(
-            self.calls - len(self.clients[client_ip])
-        )
+        response.headers["X-RateLimit-Remaining"] = str(remaining)
         response.headers["X-RateLimit-Reset"] = str(self.period)
         
         return response
@@ -204,13 +266,7 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         response = await call_next(request)
         
         # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        response.headers["Content-Security-Policy"] = "default-src 'self'"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
+        response.raw_headers.extend(_SECURITY_HEADERS)
         
         return response
 
@@ -248,6 +304,136 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class CompositeMiddleware:
+    """
+    Request ID, logging, error handling, rate limiting, metrics and security
+    headers in a single pure ASGI middleware.
+
+    Every ``BaseHTTPMiddleware`` runs the rest of the stack in its own task
+    group and relays the response through a memory stream, so stacking one
+    per concern paid that cost six times per request.  This class does the
+    same work in one ``__call__``, adding its headers to the
+    ``http.response.start`` message as it passes through.  The individual
+    middleware classes above remain available for standalone use.
+
+    With ``server_timing`` enabled, each response also carries the app's
+    processing time as a standard ``Server-Timing: app;dur=<ms>`` header.
+    """
+
+    def __init__(
+        self,
+        app,
+        calls: int = 100,
+        period: int = 60,
+        header_name: str = "X-Request-ID",
+        server_timing: bool = False,
+    ):
+        self.app = app
+        self.header_name = header_name
+        self.server_timing = server_timing
+        self.windows = _RequestWindows(calls, period)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        request_headers = Headers(scope=scope)
+        request_id = request_headers.get(self.header_name) or _new_request_id()
+        state = scope.setdefault("state", {})
+        state["correlation_id"] = request_id
+        state["request_id"] = request_id
+        start_time = time.perf_counter()
+
+        response_headers: Dict[str, str] = {}
+        status_code = 500
+        response_size = 0
+        response_started = False
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code, response_size, response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                response_size = int(headers.get("content-length", 0))
+                for name, value in response_headers.items():
+                    headers[name] = value
+                headers[self.header_name] = request_id
+                raw_headers = message["headers"]
+                raw_headers.extend(_SECURITY_HEADERS)
+                if self.server_timing:
+                    duration_ms = (time.perf_counter() - start_time) * 1000
+                    raw_headers.append((b"server-timing", f"app;dur={duration_ms:.2f}".encode("ascii")))
+            await send(message)
+
+        try:
+            if path in _RATE_LIMIT_EXEMPT_PATHS:
+                await self.app(scope, receive, send_wrapper)
+            else:
+                client = scope.get("client")
+                client_ip = client[0] if client else "unknown"
+                remaining = self.windows.hit(client_ip)
+                if remaining is None:
+                    logger.warning("Rate limit exceeded for IP: %s", client_ip)
+                    await self.windows.too_many_requests()(scope, receive, send_wrapper)
+                else:
+                    response_headers["X-RateLimit-Limit"] = str(self.windows.calls)
+                    response_headers["X-RateLimit-Remaining"] = str(remaining)
+                    response_headers["X-RateLimit-Reset"] = str(self.windows.period)
+                    await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            logger.error(
+                "Unhandled exception in request %s: %s", request_id, exc,
+                exc_info=True
+            )
+            if response_started:
+                raise
+            await JSONResponse(
+                status_code=500,
+                content={
+                    "error": "Internal Server Error",
+                    "message": str(exc) if _EXPOSE_EXC else "An unexpected error occurred",
+                    "request_id": request_id,
+                    "timestamp": datetime.utcnow().isoformat()
+                }
+            )(scope, receive, send_wrapper)
+
+        duration = time.perf_counter() - start_time
+        method = scope["method"]
+
+        if path not in _SKIP_LOG_PATHS and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "HTTP request",
+                extra={
+                    "correlation_id": request_id,
+                    "request_id": request_id,
+                    "method": method,
+                    "path": path,
+                    "status_code": status_code,
+                    "duration_ms": round(duration * 1000, 2),
+                    "request_size_bytes": int(request_headers.get("content-length", 0)),
+                    "response_size_bytes": response_size,
+                },
+            )
+
+        if path != "/metrics":
+            try:
+                from app.core.metrics import http_requests_total, http_request_duration_seconds
+                http_requests_total.labels(
+                    method=method,
+                    endpoint=path,
+                    status_code=str(status_code),
+                ).inc()
+                http_request_duration_seconds.labels(
+                    method=method,
+                    endpoint=path,
+                ).observe(duration)
+            except Exception:
+                pass  # metrics not available – don't crash the request
+
+
 def setup_middleware(app):
     """
     Set up all middleware for the FastAPI application
@@ -260,25 +446,13 @@ def setup_middleware(app):
     # Compression
     app.add_middleware(GZipMiddleware, minimum_size=1000)
 
-    # Security headers
-    app.add_middleware(SecurityHeadersMiddleware)
-
-    # Prometheus metrics
-    app.add_middleware(MetricsMiddleware)
-
-    # Rate limiting (100 requests per minute by default)
-    app.add_middleware(RateLimitMiddleware, calls=100, period=60)
-
-    # Error handling
-    app.add_middleware(ErrorHandlingMiddleware)
-
-    # Request logging
-    app.add_middleware(RequestLoggingMiddleware)
-
-    # Correlation ID propagation
-    app.add_middleware(CorrelationIDMiddleware)
-
-    # Request ID tracking
-    app.add_middleware(RequestIDMiddleware)
+    # Request ID, logging, error handling, rate limiting (100 requests per
+    # minute by default), metrics and security headers
+    app.add_middleware(
+        CompositeMiddleware,
+        calls=100,
+        period=60,
+        server_timing=settings.SERVER_TIMING_ENABLED,
+    )
 
     logger.info("Middleware setup complete")
@@ -6,11 +6,16 @@ including WHOIS lookup, Certificate Transparency, passive subdomain discovery,
 and comprehensive DNS resolution.
 """
 
-from .domain_discovery import DomainDiscovery
-from .whois_recon import WhoisRecon
-from .ct_logs import CertificateTransparency
-from .dns_resolver import DNSResolver
-from .subdomain_merger import SubdomainMerger
+from ._lazy import make_lazy_getattr
+
+# Exports are imported on first access (see make_lazy_getattr)
+_EXPORTS = {
+    "DomainDiscovery": ".domain_discovery",
+    "WhoisRecon": ".whois_recon",
+    "CertificateTransparency": ".ct_logs",
+    "DNSResolver": ".dns_resolver",
+    "SubdomainMerger": ".subdomain_merger",
+}
 
 __all__ = [
     "DomainDiscovery",
@@ -19,3 +24,6 @@ __all__ = [
     "DNSResolver",
     "SubdomainMerger",
 ]
+
+
+__getattr__ = make_lazy_getattr(__name__, _EXPORTS)
@@ -0,0 +1,37 @@
+"""
+Lazy package exports (PEP 562).
+
+Recon packages re-export many tool wrappers whose modules pull in heavy
+dependencies (DNS, WHOIS and HTTP client stacks, subprocess wrappers).
+Resolving each export on first access means importing one light submodule,
+such as a package's schemas, does not load everything else in the package.
+"""
+import importlib
+import sys
+from typing import Any, Callable, Mapping
+
+
+def make_lazy_getattr(module_name: str, exports: Mapping[str, str]) -> Callable[[str], Any]:
+    """
+    Return a module ``__getattr__`` that imports exports on first access.
+
+    Args:
+        module_name: ``__name__`` of the package defining the exports
+        exports: Export name -> relative submodule that defines it
+
+    Usage::
+
+        _EXPORTS = {"DNSResolver": ".dns_resolver"}
+        __getattr__ = make_lazy_getattr(__name__, _EXPORTS)
+    """
+
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(submodule, module_name), name)
+        # Cache on the package so later lookups bypass __getattr__
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
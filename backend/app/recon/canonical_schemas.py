@@ -18,9 +18,9 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 # ---------------------------------------------------------------------------
@@ -146,6 +146,17 @@ class Finding(BaseModel):
     extra: Dict[str, Any] = Field(default_factory=dict)
 
 
+# ---------------------------------------------------------------------------
+# Bulk validators
+# ---------------------------------------------------------------------------
+
+# Validate a whole list of tool-output rows (dicts) in one pydantic-core call
+# instead of constructing one model per row from Python.
+ENDPOINT_LIST = TypeAdapter(List[Endpoint])
+TECHNOLOGY_LIST = TypeAdapter(List[Technology])
+FINDING_LIST = TypeAdapter(List[Finding])
+
+
 # ---------------------------------------------------------------------------
 # Top-level ReconResult envelope
 # ---------------------------------------------------------------------------
@@ -191,22 +202,35 @@ class ReconResult(BaseModel):
 
     @property
     def critical_count(self) -> int:
-        return sum(1 for f in self.findings if f.severity == Severity.CRITICAL)
+        return self._severity_counts()[0]
 
     @property
     def high_count(self) -> int:
-        return sum(1 for f in self.findings if f.severity == Severity.HIGH)
+        return self._severity_counts()[1]
+
+    def _severity_counts(self) -> Tuple[int, int]:
+        """Count critical and high findings in a single pass."""
+        # Not cached: orchestrators keep appending to ``findings``
+        critical = high = 0
+        for finding in self.findings:
+            severity = finding.severity
+            if severity == Severity.CRITICAL:
+                critical += 1
+            elif severity == Severity.HIGH:
+                high += 1
+        return critical, high
 
     def summary(self) -> Dict[str, Any]:
         """Return a human-readable summary dict."""
+        critical, high = self._severity_counts()
         return {
             "tool": self.tool_name,
             "target": self.target,
             "endpoints": self.endpoint_count,
             "technologies": self.technology_count,
             "findings": self.finding_count,
-            "critical": self.critical_count,
-            "high": self.high_count,
+            "critical": critical,
+            "high": high,
             "success": self.success,
             "duration_seconds": self.duration_seconds,
         }
@@ -7,8 +7,16 @@ Parses CT log responses and extracts unique subdomains.
 
 import asyncio
 import logging
-from typing import List, Set
+from typing import Iterator, List, Set
 import httpx
+import orjson
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -48,22 +56,7 @@ class CertificateTransparency:
             }
 
             async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(self.ct_url, params=params)
-                response.raise_for_status()
-
-                ct_data = response.json()
-                logger.info(f"Retrieved {len(ct_data)} certificate entries for {domain}")
-
-                # Extract subdomains from certificates
-                for entry in ct_data:
-                    if "name_value" in entry:
-                        names = entry["name_value"].split("\n")
-                        for name in names:
-                            name = name.strip().lower()
-                            
-                            # Filter out wildcards and invalid entries
-                            if name and not name.startswith("*") and name.endswith(domain):
-                                subdomains.add(name)
+                subdomains = await self._fetch_subdomains(client, params, domain)
 
                 logger.info(f"Discovered {len(subdomains)} unique subdomains from CT logs")
 
@@ -76,6 +69,64 @@ class CertificateTransparency:
 
         return subdomains
 
+    async def _fetch_subdomains(
+        self,
+        client: httpx.AsyncClient,
+        params: dict,
+        domain: str,
+        include_wildcards: bool = False,
+    ) -> Set[str]:
+        """
+        Query crt.sh and return the subdomains of *domain* it lists.
+
+        Streams the response through ijson when it is installed, otherwise
+        parses the whole body with orjson.
+        """
+        if IJSON_AVAILABLE:
+            return await self._stream_subdomains(client, params, domain, include_wildcards)
+
+        response = await client.get(self.ct_url, params=params)
+        response.raise_for_status()
+
+        ct_data = orjson.loads(response.content)
+        logger.info(f"Retrieved {len(ct_data)} certificate entries for {domain}")
+
+        return {
+            name
+            for entry in ct_data
+            if "name_value" in entry
+            for name in _select_names(entry["name_value"], domain, include_wildcards)
+        }
+
+    async def _stream_subdomains(
+        self,
+        client: httpx.AsyncClient,
+        params: dict,
+        domain: str,
+        include_wildcards: bool = False,
+    ) -> Set[str]:
+        """
+        Stream the crt.sh response through ijson, one ``name_value`` at a time.
+
+        Popular domains return hundreds of MB of JSON; parsing the chunks as
+        they arrive keeps memory bounded by the subdomain set rather than
+        the response size.
+        """
+        subdomains: Set[str] = set()
+        name_values = ijson.sendable_list()
+        parser = ijson.items_coro(name_values, "item.name_value")
+
+        async with client.stream("GET", self.ct_url, params=params) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                for name_value in name_values:
+                    subdomains.update(_select_names(name_value, domain, include_wildcards))
+                del name_values[:]
+        parser.close()
+
+        return subdomains
+
     async def discover_with_wildcard_filter(self, domain: str, include_wildcards: bool = False) -> Set[str]:
         """
         Discover subdomains with optional wildcard inclusion.
@@ -98,29 +149,9 @@ class CertificateTransparency:
             }
 
             async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(self.ct_url, params=params)
-                response.raise_for_status()
-
-                ct_data = response.json()
-
-                for entry in ct_data:
-                    if "name_value" in entry:
-                        names = entry["name_value"].split("\n")
-                        for name in names:
-                            name = name.strip().lower()
-                            
-                            if include_wildcards:
-                                # Include wildcards but process them
-                                if name.startswith("*."):
-                                    name = name[2:]  # Remove *.
-                                    
-                            else:
-                                # Skip wildcards
-                                if name.startswith("*"):
-                                    continue
-                            
-                            if name and name.endswith(domain):
-                                subdomains.add(name)
+                subdomains = await self._fetch_subdomains(
+                    client, params, domain, include_wildcards
+                )
 
                 logger.info(f"Discovered {len(subdomains)} subdomains from CT logs")
 
@@ -128,3 +159,25 @@ class CertificateTransparency:
             logger.error(f"Error in CT log discovery for {domain}: {str(e)}")
 
         return subdomains
+
+
+def _split_names(name_value: str) -> List[str]:
+    """Split a certificate ``name_value`` into its non-empty, lower-cased names."""
+    return [name for name in (line.strip().lower() for line in name_value.split("\n")) if name]
+
+
+def _select_names(name_value: str, domain: str, include_wildcards: bool = False) -> Iterator[str]:
+    """
+    Yield the names of a ``name_value`` that belong to *domain*.
+
+    Wildcard names are skipped, or with *include_wildcards* kept without
+    their leading ``*.``.
+    """
+    for name in _split_names(name_value):
+        if name.startswith("*"):
+            if not include_wildcards:
+                continue
+            if name.startswith("*."):
+                name = name[2:]
+        if name and name.endswith(domain):
+            yield name
@@ -4,7 +4,7 @@ Deduplication Pipeline (Day 25)
 Provides three complementary strategies for de-duplicating recon results
 produced by different tools:
 
-  1. **Hash-based deduplication** – exact URL/ID normalisation + SHA-256 hash
+  1. **Hash-based deduplication** – exact URL/ID normalisation, dict-keyed
   2. **Fuzzy matching**           – Levenshtein distance for near-duplicate URLs
   3. **Confidence scoring**       – prefer higher-confidence items when merging
 
@@ -13,14 +13,44 @@ canonical schema.
 """
 from __future__ import annotations
 
-import hashlib
+import math
 import re
+import sys
 import unicodedata
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
 from typing import Dict, List, Optional, Sequence, Tuple
-from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+from urllib.parse import parse_qs, quote_plus, urlencode, urlparse, urlunparse
 
 from app.recon.canonical_schemas import Endpoint, Finding, Technology
 
+# rapidfuzz computes edit distances in C (bit-parallel); fall back to the
+# pure-Python implementation below when it is not installed.
+try:
+    from rapidfuzz.distance import Levenshtein as _RFLevenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    _RFLevenshtein = None
+    RAPIDFUZZ_AVAILABLE = False
+
+# rapidfuzz's cdist (which returns numpy arrays) scores one URL against many
+# in a single C call.
+try:
+    import numpy as _np
+    from rapidfuzz.process import cdist as _rf_cdist
+except ImportError:
+    _np = None
+    _rf_cdist = None
+
+# Without rapidfuzz, numba can JIT-compile the Wagner-Fischer loop instead.
+try:
+    import numpy as _np
+    from numba import njit as _njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    _njit = None
+    NUMBA_AVAILABLE = False
+
 
 # ---------------------------------------------------------------------------
 # URL normalisation helpers
@@ -36,6 +66,9 @@ def _normalise_url(url: str) -> str:
     - Strip trailing slashes from paths (except for "/")
     - Remove URL fragment
     """
+    fast = _fast_normalise(url)
+    if fast is not None:
+        return fast
     try:
         p = urlparse(url.strip())
         scheme = p.scheme.lower()
@@ -54,20 +87,113 @@ def _normalise_url(url: str) -> str:
         return url.strip().lower()
 
 
-def _sha256(text: str) -> str:
-    return hashlib.sha256(text.encode()).hexdigest()
+# Characters that need the full urlparse/parse_qs treatment: percent and plus
+# decoding, userinfo, IPv6 literals, path parameters, backslashes, and the
+# whitespace/control characters urlparse strips
+_SLOW_PATH_CHARS = re.compile(r"[%+@\[\];\\\x00-\x20\x7f]")
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def _fast_normalise(url: str) -> Optional[str]:
+    """
+    ``_normalise_url`` for plain ASCII http(s) URLs using only string splits.
+
+    Produces exactly what the urlparse path would, including its query
+    encoding (``parse_qs`` drops blank values and ``urlencode`` quotes each
+    key's value list).  Returns *None* for anything else, so the caller falls
+    back to the full parser.
+    """
+    url = url.strip()
+    if not url.isascii() or _SLOW_PATH_CHARS.search(url):
+        return None
+    scheme, sep, rest = url.partition("://")
+    scheme = scheme.lower()
+    if not sep or scheme not in _DEFAULT_PORTS:
+        return None
+
+    rest = rest.partition("#")[0]
+    rest, _, query = rest.partition("?")
+    netloc, slash, path = rest.partition("/")
+    host, colon, port = netloc.partition(":")
+    if not host:
+        return None
+    host = host.lower()
+    if colon:
+        if port and not (port.isdigit() and int(port) <= 65535):
+            return None
+        port = str(int(port)) if port else ""
+        if port == _DEFAULT_PORTS[scheme]:
+            port = ""
+    netloc = f"{host}:{port}" if port else host
+    path = (slash + path).rstrip("/") or "/"
+
+    if not query:
+        return f"{scheme}://{netloc}{path}"
+    values: Dict[str, List[str]] = {}
+    for pair in query.split("&"):
+        name, eq, value = pair.partition("=")
+        if value:
+            values.setdefault(name, []).append(value)
+    if not values:
+        return f"{scheme}://{netloc}{path}"
+    encoded = "&".join(
+        f"{quote_plus(name)}={quote_plus(str(vals))}" for name, vals in sorted(values.items())
+    )
+    return f"{scheme}://{netloc}{path}?{encoded}"
+
+
+def _host_of(normalised: str) -> str:
+    """Return the netloc of a ``_normalise_url`` result without re-parsing it."""
+    if "://" in normalised:
+        return normalised.split("/", 3)[2]
+    return urlparse(normalised).netloc
 
 
 # ---------------------------------------------------------------------------
-# Levenshtein distance (fast iterative)
+# Levenshtein distance (rapidfuzz, or fast iterative fallback)
 # ---------------------------------------------------------------------------
 
+if NUMBA_AVAILABLE and not RAPIDFUZZ_AVAILABLE:
+    @_njit(cache=True, boundscheck=False)
+    def _lev_core(a, b):  # pragma: no cover - compiled by numba
+        """Wagner-Fischer over code-point arrays, *b* no longer than *a*."""
+        n = b.shape[0]
+        row = _np.empty(n + 1, dtype=_np.int32)
+        for j in range(n + 1):
+            row[j] = j
+        for i in range(a.shape[0]):
+            diag = row[0]
+            row[0] = i + 1
+            ca = a[i]
+            for j in range(n):
+                up = row[j + 1]
+                best = diag if ca == b[j] else diag + 1
+                if up + 1 < best:
+                    best = up + 1
+                if row[j] + 1 < best:
+                    best = row[j] + 1
+                diag = up
+                row[j + 1] = best
+        return row[n]
+else:
+    _lev_core = None
+
+
+def _codepoints(s: str):
+    """Return *s* as a ``uint32`` array of code points (for ``_lev_core``)."""
+    return _np.frombuffer(s.encode("utf-32-le"), dtype=_np.uint32)
+
+
 def levenshtein(a: str, b: str) -> int:
     """Return the Levenshtein edit distance between *a* and *b*."""
+    if _RFLevenshtein is not None:
+        return _RFLevenshtein.distance(a, b)
     if a == b:
         return 0
     if len(a) < len(b):
         a, b = b, a
+    if _lev_core is not None:
+        return int(_lev_core(_codepoints(a), _codepoints(b)))
     prev = list(range(len(b) + 1))
     for i, ca in enumerate(a):
         curr = [i + 1]
@@ -83,6 +209,8 @@ def similarity(a: str, b: str) -> float:
 
     1.0 means identical, 0.0 means completely different.
     """
+    if _RFLevenshtein is not None:
+        return _RFLevenshtein.normalized_similarity(a, b)
     if not a and not b:
         return 1.0
     max_len = max(len(a), len(b))
@@ -91,6 +219,31 @@ def similarity(a: str, b: str) -> float:
     return 1.0 - levenshtein(a, b) / max_len
 
 
+def _first_match(url: str, others: Sequence[str], score_cutoff: float) -> Optional[int]:
+    """
+    Return the index of the first of *others* whose ``similarity`` to *url*
+    is at least *score_cutoff*, or *None*.
+
+    With cdist the row is scored in one call, so memory stays O(len(others));
+    otherwise pairs are scored in order until the first match.
+    """
+    if _rf_cdist is not None and len(others) > 1:
+        # No score_cutoff: rapidfuzz's own cutoff test can round a pair
+        # sitting exactly on the threshold down to 0, so compare here instead
+        row = _rf_cdist(
+            [url],
+            others,
+            scorer=_RFLevenshtein.normalized_similarity,
+            dtype=_np.float64,  # float32 would blur scores at the threshold
+        )[0]
+        hits = _np.flatnonzero(row >= score_cutoff)
+        return int(hits[0]) if hits.size else None
+    for k, other in enumerate(others):
+        if similarity(url, other) >= score_cutoff:
+            return k
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Endpoint deduplication
 # ---------------------------------------------------------------------------
@@ -118,10 +271,12 @@ class EndpointDeduplicator:
         Return a deduplicated list.  Order is preserved (first occurrence wins
         unless a later item has higher confidence).
         """
-        # --- Pass 1: exact hash ---
+        # --- Pass 1: exact match on the normalised URL ---
+        # Each URL is normalised once; the normalised form keys this pass and
+        # is reused for host bucketing and fuzzy scoring below.
         seen: Dict[str, Endpoint] = {}
         for ep in endpoints:
-            key = _sha256(_normalise_url(ep.url))
+            key = _normalise_url(ep.url)
             if key not in seen:
                 seen[key] = ep
             else:
@@ -133,34 +288,48 @@ class EndpointDeduplicator:
                     1.0, seen[key].confidence + 0.05
                 )
 
-        unique = list(seen.values())
-
         # --- Pass 2: fuzzy matching (group by host to keep O(k²) per host) ---
-        # Bucket items by host so we only compare within the same host.
-        from collections import defaultdict
-
-        by_host: dict = defaultdict(list)
-        for ep in unique:
-            host = urlparse(_normalise_url(ep.url)).netloc
-            by_host[host].append(ep)
+        # Bucket normalised URLs by host so we only compare within the same host.
+        by_host: Dict[str, List[str]] = defaultdict(list)
+        for norm in seen:
+            by_host[_host_of(norm)].append(norm)
 
         result: List[Endpoint] = []
-        for host_eps in by_host.values():
+        threshold = self.fuzzy_threshold
+        for norms in by_host.values():
+            host_eps = [seen[norm] for norm in norms]
+            # Surviving items, and the index in host_eps each one came from
             deduped: List[Endpoint] = []
-            for candidate in host_eps:
-                norm_c = _normalise_url(candidate.url)
-                merged = False
-                for i, existing in enumerate(deduped):
-                    if similarity(norm_c, _normalise_url(existing.url)) >= self.fuzzy_threshold:
-                        if candidate.confidence > existing.confidence:
-                            deduped[i] = candidate
-                        deduped[i] = deduped[i].model_copy(
-                            update={"confidence": min(1.0, deduped[i].confidence + 0.03)}
-                        )
-                        merged = True
-                        break
-                if not merged:
+            origins: List[int] = []
+            # (URL length, survivor index), sorted.  similarity(a, b) can be
+            # at most min(len) / max(len), so only survivors in the
+            # candidate's length window are scored, by cdist or otherwise.
+            by_length: List[Tuple[int, int]] = []
+            for c, candidate in enumerate(host_eps):
+                length = len(norms[c])
+                if threshold > 0:
+                    lo = bisect_left(by_length, (math.floor(length * threshold), -1))
+                    hi = bisect_right(by_length, (math.ceil(length / threshold), len(deduped)))
+                    window = sorted(i for _, i in by_length[lo:hi])
+                else:
+                    window = range(len(deduped))
+                # Each candidate is scored against the surviving items only,
+                # one row at a time
+                k = _first_match(norms[c], [norms[origins[i]] for i in window], threshold)
+                if k is None:
+                    insort(by_length, (length, len(deduped)))
                     deduped.append(candidate)
+                    origins.append(c)
+                    continue
+                i = window[k]
+                if candidate.confidence > deduped[i].confidence:
+                    by_length.remove((len(norms[origins[i]]), i))
+                    insort(by_length, (length, i))
+                    deduped[i] = candidate
+                    origins[i] = c
+                deduped[i] = deduped[i].model_copy(
+                    update={"confidence": min(1.0, deduped[i].confidence + 0.03)}
+                )
             result.extend(deduped)
 
         return result
@@ -218,9 +387,10 @@ class FindingDeduplicator:
             if finding.id in by_id:
                 continue
 
-            # Dedup by (name, url, severity)
+            # Dedup by (name, url, severity); the same few finding names recur
+            # across many URLs, so every stored key shares one interned copy
             composite = (
-                finding.name.lower(),
+                sys.intern(finding.name.lower()),
                 (finding.url or "").lower(),
                 finding.severity,
             )
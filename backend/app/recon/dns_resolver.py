@@ -8,7 +8,9 @@ Implements timeout handling, error recovery, and IP organization.
 
 import asyncio
 import logging
+import sys
 from typing import Dict, List, Set, Optional, Any
+import dns.asyncresolver
 import dns.resolver
 import dns.exception
 from collections import defaultdict
@@ -22,7 +24,13 @@ class DNSResolver:
     # DNS record types to query
     RECORD_TYPES = ["A", "AAAA", "MX", "NS", "TXT", "CNAME", "SOA"]
 
-    def __init__(self, timeout: float = 5.0, retries: int = 2, nameservers: List[str] = None):
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        retries: int = 2,
+        nameservers: List[str] = None,
+        max_concurrent_queries: int = 500,
+    ):
         """
         Initialize DNS resolver.
 
@@ -30,16 +38,19 @@ class DNSResolver:
             timeout: DNS query timeout in seconds
             retries: Number of retry attempts
             nameservers: Optional list of DNS nameservers to use
+            max_concurrent_queries: Cap on in-flight queries (one socket each)
         """
         self.timeout = timeout
         self.retries = retries
-        self.resolver = dns.resolver.Resolver()
+        self.resolver = dns.asyncresolver.Resolver()
         self.resolver.timeout = timeout
         self.resolver.lifetime = timeout * (retries + 1)
         
         if nameservers:
             self.resolver.nameservers = nameservers
 
+        self._query_slots = asyncio.Semaphore(max_concurrent_queries)
+
     async def resolve_all(self, domain: str) -> Dict[str, Any]:
         """
         Resolve all DNS record types for a domain.
@@ -100,13 +111,7 @@ class DNSResolver:
             List of record values or None if failed
         """
         try:
-            loop = asyncio.get_event_loop()
-            answers = await loop.run_in_executor(
-                None,
-                self._query_dns,
-                domain,
-                record_type
-            )
+            answers = await self._query_dns(domain, record_type)
 
             if answers:
                 records = self._parse_records(answers, record_type)
@@ -125,9 +130,9 @@ class DNSResolver:
 
         return None
 
-    def _query_dns(self, domain: str, record_type: str):
+    async def _query_dns(self, domain: str, record_type: str):
         """
-        Perform DNS query (blocking operation).
+        Perform DNS query on the event loop (no executor threads).
 
         Args:
             domain: Domain name
@@ -136,7 +141,8 @@ class DNSResolver:
         Returns:
             DNS answer object
         """
-        return self.resolver.resolve(domain, record_type)
+        async with self._query_slots:
+            return await self.resolver.resolve(domain, record_type)
 
     def _parse_records(self, answers, record_type: str) -> List[str]:
         """
@@ -152,11 +158,13 @@ class DNSResolver:
         records = []
 
         try:
+            # Shared hosting puts one address behind many subdomains; interning
+            # keeps a single copy and lets organize_ips match keys by identity
             if record_type == "A":
-                records = [str(rdata) for rdata in answers]
+                records = [sys.intern(str(rdata)) for rdata in answers]
             
             elif record_type == "AAAA":
-                records = [str(rdata) for rdata in answers]
+                records = [sys.intern(str(rdata)) for rdata in answers]
             
             elif record_type == "MX":
                 records = [f"{rdata.preference} {rdata.exchange}" for rdata in answers]
@@ -193,31 +201,23 @@ class DNSResolver:
         logger.info(f"Resolving DNS for {len(subdomains)} subdomains")
 
         results = {}
-        tasks = []
         subdomain_list = list(subdomains)
 
-        # Create tasks for all subdomains
-        for subdomain in subdomain_list:
-            task = self.resolve_all(subdomain)
-            tasks.append(task)
-
-        # Resolve concurrently with progress logging
-        batch_size = 50
-        for i in range(0, len(tasks), batch_size):
-            batch = tasks[i:i + batch_size]
-            batch_subdomains = subdomain_list[i:i + batch_size]
-            
-            batch_results = await asyncio.gather(*batch, return_exceptions=True)
-            
-            for subdomain, result in zip(batch_subdomains, batch_results):
-                if isinstance(result, Exception):
-                    logger.error(f"Error resolving {subdomain}: {str(result)}")
-                    results[subdomain] = {"error": str(result)}
-                else:
-                    results[subdomain] = result
-            
-            logger.info(f"Resolved {min(i + batch_size, len(tasks))}/{len(tasks)} subdomains")
-
+        # Every record query is in flight at once, bounded only by the
+        # resolver's query slots
+        resolved = await asyncio.gather(
+            *(self.resolve_all(subdomain) for subdomain in subdomain_list),
+            return_exceptions=True,
+        )
+
+        for subdomain, result in zip(subdomain_list, resolved):
+            if isinstance(result, Exception):
+                logger.error(f"Error resolving {subdomain}: {str(result)}")
+                results[subdomain] = {"error": str(result)}
+            else:
+                results[subdomain] = result
+
+        logger.info(f"Resolved {len(subdomain_list)} subdomains")
         return results
 
     def organize_ips(self, dns_results: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
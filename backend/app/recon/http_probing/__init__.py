@@ -11,22 +11,26 @@ This module provides comprehensive HTTP/HTTPS probing capabilities including:
 - Content analysis
 """
 
-from .http_probe import HttpProbe
-from .tls_inspector import TLSInspector
-from .tech_detector import TechDetector
-from .wappalyzer_wrapper import WappalyzerWrapper
-from .wappalyzer_orchestrator import WappalyzerOrchestrator, WappalyzerOrchestratorConfig
-from .favicon_hasher import FaviconHasher
-from .http_orchestrator import HttpProbeOrchestrator
-from .schemas import (
-    HttpProbeRequest,
-    HttpProbeResult,
-    TLSCertInfo,
-    TechnologyInfo,
-    SecurityHeaders,
-    BaseURLInfo,
-    ProbeMode
-)
+from .._lazy import make_lazy_getattr
+
+# Exports are imported on first access (see make_lazy_getattr)
+_EXPORTS = {
+    'HttpProbe': '.http_probe',
+    'TLSInspector': '.tls_inspector',
+    'TechDetector': '.tech_detector',
+    'WappalyzerWrapper': '.wappalyzer_wrapper',
+    'WappalyzerOrchestrator': '.wappalyzer_orchestrator',
+    'WappalyzerOrchestratorConfig': '.wappalyzer_orchestrator',
+    'FaviconHasher': '.favicon_hasher',
+    'HttpProbeOrchestrator': '.http_orchestrator',
+    'HttpProbeRequest': '.schemas',
+    'HttpProbeResult': '.schemas',
+    'TLSCertInfo': '.schemas',
+    'TechnologyInfo': '.schemas',
+    'SecurityHeaders': '.schemas',
+    'BaseURLInfo': '.schemas',
+    'ProbeMode': '.schemas',
+}
 
 __all__ = [
     'HttpProbe',
@@ -45,3 +49,6 @@ __all__ = [
     'BaseURLInfo',
     'ProbeMode',
 ]
+
+
+__getattr__ = make_lazy_getattr(__name__, _EXPORTS)
@@ -36,14 +36,17 @@ class FaviconHasher:
     - MurmurHash3: Compatible with Shodan favicon search
     """
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, client: Optional[httpx.AsyncClient] = None):
         """
         Initialize favicon hasher.
         
         Args:
             timeout: Download timeout in seconds
+            client: Shared HTTP client to reuse pooled connections; when
+                omitted, one client is opened per hashed site
         """
         self.timeout = timeout
+        self.client = client
     
     async def hash_favicon(self, url: str) -> Optional[FaviconInfo]:
         """
@@ -56,17 +59,14 @@ class FaviconHasher:
             FaviconInfo with hash values
         """
         try:
-            # Try common favicon locations
+            # Try common favicon locations; all candidates share one
+            # connection pool so the site is only connected to once
             favicon_urls = self._get_favicon_urls(url)
             
-            for favicon_url in favicon_urls:
-                favicon_data = await self._download_favicon(favicon_url)
-                
-                if favicon_data:
-                    return self._generate_hashes(favicon_url, favicon_data)
-            
-            logger.debug(f"No favicon found for {url}")
-            return None
+            if self.client is not None:
+                return await self._hash_first_favicon(url, favicon_urls, self.client)
+            async with httpx.AsyncClient() as client:
+                return await self._hash_first_favicon(url, favicon_urls, client)
             
         except Exception as e:
             logger.error(f"Favicon hashing failed for {url}: {e}")
@@ -92,30 +92,43 @@ class FaviconHasher:
             urljoin(base, '/apple-touch-icon-precomposed.png'),
         ]
     
-    async def _download_favicon(self, url: str) -> Optional[bytes]:
+    async def _hash_first_favicon(
+        self, url: str, favicon_urls: list, client: httpx.AsyncClient
+    ) -> Optional[FaviconInfo]:
+        """Hash the first favicon candidate that downloads successfully."""
+        for favicon_url in favicon_urls:
+            favicon_data = await self._download_favicon(favicon_url, client)
+            
+            if favicon_data:
+                return self._generate_hashes(favicon_url, favicon_data)
+        
+        logger.debug(f"No favicon found for {url}")
+        return None
+    
+    async def _download_favicon(self, url: str, client: httpx.AsyncClient) -> Optional[bytes]:
         """
         Download favicon from URL.
         
         Args:
             url: Favicon URL
+            client: HTTP client to issue the request with
             
         Returns:
             Favicon binary data or None
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                response = await client.get(url)
-                
-                # Check for successful response
-                if response.status_code == 200:
-                    content_type = response.headers.get('content-type', '')
-                    
-                    # Verify it's an image
-                    if 'image' in content_type or url.endswith(('.ico', '.png', '.jpg', '.jpeg', '.gif')):
-                        return response.content
-                
-                return None
+            response = await client.get(url, timeout=self.timeout, follow_redirects=True)
+            
+            # Check for successful response
+            if response.status_code == 200:
+                content_type = response.headers.get('content-type', '')
                 
+                # Verify it's an image
+                if 'image' in content_type or url.endswith(('.ico', '.png', '.jpg', '.jpeg', '.gif')):
+                    return response.content
+            
+            return None
+            
         except Exception as e:
             logger.debug(f"Failed to download favicon from {url}: {e}")
             return None
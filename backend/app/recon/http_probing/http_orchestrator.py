@@ -10,10 +10,12 @@ Coordinates HTTP probing workflow:
 """
 
 import asyncio
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 import logging
 
+import httpx
+
 from .http_probe import HttpProbe
 from .tls_inspector import TLSInspector
 from .tech_detector import TechDetector
@@ -41,12 +43,14 @@ class HttpProbeOrchestrator:
     - Security header analysis
     """
     
-    def __init__(self, request: HttpProbeRequest):
+    def __init__(self, request: HttpProbeRequest, client: Optional[httpx.AsyncClient] = None):
         """
         Initialize orchestrator.
         
         Args:
             request: HTTP probe request configuration
+            client: Shared HTTP client whose connection pool is reused for
+                in-process requests (favicon downloads)
         """
         self.request = request
         
@@ -61,7 +65,7 @@ class HttpProbeOrchestrator:
         self.tls_inspector = TLSInspector(timeout=request.timeout)
         self.tech_detector = TechDetector()
         self.wappalyzer = WappalyzerWrapper(timeout=request.timeout)
-        self.favicon_hasher = FaviconHasher(timeout=request.timeout)
+        self.favicon_hasher = FaviconHasher(timeout=request.timeout, client=client)
     
     async def run(self) -> HttpProbeResult:
         """
@@ -20,7 +20,7 @@ import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
-from app.recon.canonical_schemas import ReconResult, Technology
+from app.recon.canonical_schemas import TECHNOLOGY_LIST, ReconResult, Technology
 from app.recon.orchestrators.base import BaseOrchestrator
 
 logger = logging.getLogger(__name__)
@@ -199,12 +199,12 @@ class WappalyzerOrchestrator(BaseOrchestrator):
             self._logger.debug("Wappalyzer CLI unavailable: %s", exc)
             return []
 
-        techs: List[Technology] = []
+        rows: List[Dict[str, Any]] = []
         for url_data in data.get("urls", {}).values():
             for tech in url_data.get("technologies", []):
                 cats = tech.get("categories", [])
                 category = cats[0]["name"] if cats else "Unknown"
-                techs.append(Technology(
+                rows.append(dict(
                     name=tech.get("name", "Unknown"),
                     version=tech.get("version") or None,
                     category=category,
@@ -213,7 +213,7 @@ class WappalyzerOrchestrator(BaseOrchestrator):
                     cpe=tech.get("cpe"),
                     extra={"source": "wappalyzer-cli"},
                 ))
-        return techs
+        return TECHNOLOGY_LIST.validate_python(rows)
 
     # ------------------------------------------------------------------
     # httpx header fingerprinting
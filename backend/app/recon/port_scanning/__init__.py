@@ -9,24 +9,30 @@ This module provides comprehensive port scanning capabilities including:
 - Passive intelligence via Shodan
 """
 
-from .port_scan import PortScanner
-from .service_detection import ServiceDetector
-from .banner_grabber import BannerGrabber
-from .cdn_detector import CDNDetector
-from .shodan_integration import ShodanScanner
-from .port_orchestrator import PortScanOrchestrator
-from .naabu_orchestrator import NaabuOrchestrator, NaabuConfig
-from .nmap_orchestrator import NmapOrchestrator, NmapConfig
-from .shodan_orchestrator import ShodanOrchestrator, ShodanOrchestratorConfig
-from .schemas import (
-    PortScanRequest,
-    PortScanResult,
-    ServiceInfo,
-    CDNInfo,
-    ScanMode,
-    PortInfo,
-    IPPortScan,
-)
+from .._lazy import make_lazy_getattr
+
+# Exports are imported on first access (see make_lazy_getattr)
+_EXPORTS = {
+    "PortScanner": ".port_scan",
+    "ServiceDetector": ".service_detection",
+    "BannerGrabber": ".banner_grabber",
+    "CDNDetector": ".cdn_detector",
+    "ShodanScanner": ".shodan_integration",
+    "PortScanOrchestrator": ".port_orchestrator",
+    "NaabuOrchestrator": ".naabu_orchestrator",
+    "NaabuConfig": ".naabu_orchestrator",
+    "NmapOrchestrator": ".nmap_orchestrator",
+    "NmapConfig": ".nmap_orchestrator",
+    "ShodanOrchestrator": ".shodan_orchestrator",
+    "ShodanOrchestratorConfig": ".shodan_orchestrator",
+    "PortScanRequest": ".schemas",
+    "PortScanResult": ".schemas",
+    "ServiceInfo": ".schemas",
+    "CDNInfo": ".schemas",
+    "ScanMode": ".schemas",
+    "PortInfo": ".schemas",
+    "IPPortScan": ".schemas",
+}
 
 __all__ = [
     "PortScanner",
@@ -49,3 +55,6 @@ __all__ = [
     "PortInfo",
     "IPPortScan",
 ]
+
+
+__getattr__ = make_lazy_getattr(__name__, _EXPORTS)
@@ -9,25 +9,34 @@ Supervisor: Sir Galib
 FYP: AutoPenTest AI - Month 6
 """
 
-from .schemas import (
-    ResourceEnumRequest,
-    EndpointInfo,
-    ParameterInfo,
-    FormInfo,
-    ResourceEnumResult,
-    ResourceEnumStats,
-    EnumMode,
-    EndpointCategory,
-    ParameterType,
-)
-from .katana_wrapper import KatanaWrapper
-from .gau_wrapper import GAUWrapper
-from .kiterunner_wrapper import KiterunnerWrapper
-from .resource_orchestrator import ResourceOrchestrator
-from .katana_orchestrator import KatanaOrchestrator, KatanaConfig
-from .gau_orchestrator import GAUOrchestrator, GAUConfig
-from .kiterunner_orchestrator import KiterunnerOrchestrator, KiterunnerConfig
-from .url_merger import URLMerger, URLCategory, normalise_url, categorise_url
+from .._lazy import make_lazy_getattr
+
+# Exports are imported on first access (see make_lazy_getattr)
+_EXPORTS = {
+    "ResourceEnumRequest": ".schemas",
+    "EndpointInfo": ".schemas",
+    "ParameterInfo": ".schemas",
+    "FormInfo": ".schemas",
+    "ResourceEnumResult": ".schemas",
+    "ResourceEnumStats": ".schemas",
+    "EnumMode": ".schemas",
+    "EndpointCategory": ".schemas",
+    "ParameterType": ".schemas",
+    "KatanaWrapper": ".katana_wrapper",
+    "GAUWrapper": ".gau_wrapper",
+    "KiterunnerWrapper": ".kiterunner_wrapper",
+    "ResourceOrchestrator": ".resource_orchestrator",
+    "KatanaOrchestrator": ".katana_orchestrator",
+    "KatanaConfig": ".katana_orchestrator",
+    "GAUOrchestrator": ".gau_orchestrator",
+    "GAUConfig": ".gau_orchestrator",
+    "KiterunnerOrchestrator": ".kiterunner_orchestrator",
+    "KiterunnerConfig": ".kiterunner_orchestrator",
+    "URLMerger": ".url_merger",
+    "URLCategory": ".url_merger",
+    "normalise_url": ".url_merger",
+    "categorise_url": ".url_merger",
+}
 
 __all__ = [
     "ResourceEnumRequest",
@@ -57,3 +66,6 @@ __all__ = [
 
 __version__ = "1.0.0"
 __author__ = "Muhammad Adeel Haider"
+
+
+__getattr__ = make_lazy_getattr(__name__, _EXPORTS)
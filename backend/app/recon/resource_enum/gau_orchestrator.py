@@ -17,7 +17,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse, parse_qs
 
-from app.recon.canonical_schemas import Endpoint, EndpointMethod, ReconResult
+from app.recon.canonical_schemas import ENDPOINT_LIST, EndpointMethod, ReconResult
 from app.recon.orchestrators.base import BaseOrchestrator
 
 logger = logging.getLogger(__name__)
@@ -177,7 +177,7 @@ class GAUOrchestrator(BaseOrchestrator):
         only historical GET URLs).  Query parameter names are extracted and
         stored in both ``parameters`` and ``extra["parameters"]``.
         """
-        endpoints: List[Endpoint] = []
+        rows: List[Dict[str, Any]] = []
         seen: set = set()
 
         for url in (raw or []):
@@ -186,7 +186,7 @@ class GAUOrchestrator(BaseOrchestrator):
             seen.add(url)
 
             params = self._extract_parameters(url)
-            ep = Endpoint(
+            rows.append(dict(
                 url=url,
                 method=EndpointMethod.GET,
                 is_live=False,       # historical URL, liveness unknown
@@ -198,10 +198,9 @@ class GAUOrchestrator(BaseOrchestrator):
                     "parameters": params,
                     "provider": "gau",      # refined by sub-queries if needed
                 },
-            )
-            endpoints.append(ep)
+            ))
 
-        return self._make_result(endpoints=endpoints)
+        return self._make_result(endpoints=ENDPOINT_LIST.validate_python(rows))
 
     # ------------------------------------------------------------------
     # Convenience: fetch URLs for multiple targets
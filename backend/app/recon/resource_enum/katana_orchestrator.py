@@ -24,7 +24,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse, parse_qs
 
-from app.recon.canonical_schemas import Endpoint, EndpointMethod, ReconResult
+from app.recon.canonical_schemas import ENDPOINT_LIST, EndpointMethod, ReconResult
 from app.recon.orchestrators.base import BaseOrchestrator
 
 logger = logging.getLogger(__name__)
@@ -207,7 +207,7 @@ class KatanaOrchestrator(BaseOrchestrator):
         extracted and stored in ``extra["parameters"]``.  Form metadata
         is preserved in ``extra["forms"]``.
         """
-        endpoints: List[Endpoint] = []
+        rows: List[Dict[str, Any]] = []
 
         for record in (raw or []):
             url = (
@@ -235,7 +235,7 @@ class KatanaOrchestrator(BaseOrchestrator):
 
             form_data = record.get("response", {}).get("forms") or []
 
-            ep = Endpoint(
+            rows.append(dict(
                 url=url,
                 method=method,
                 status_code=record.get("response", {}).get("status_code"),
@@ -249,10 +249,9 @@ class KatanaOrchestrator(BaseOrchestrator):
                     "forms": form_data,
                     "depth": record.get("depth"),
                 },
-            )
-            endpoints.append(ep)
+            ))
 
-        return self._make_result(endpoints=endpoints)
+        return self._make_result(endpoints=ENDPOINT_LIST.validate_python(rows))
 
     # ------------------------------------------------------------------
     # Convenience: scan multiple targets concurrently
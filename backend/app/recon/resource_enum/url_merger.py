@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 from urllib.parse import urlparse, urlunparse
 
 from app.recon.canonical_schemas import Endpoint
@@ -226,21 +226,29 @@ class URLMerger:
     # Ingestion
     # ------------------------------------------------------------------
 
-    def add(self, endpoints: List[Endpoint], source: str) -> None:
+    def add(self, endpoints: Iterable[Endpoint], source: str) -> None:
         """
         Add endpoints from one tool.
 
+        Deduplication, categorisation and scoring happen here, one endpoint
+        at a time, so *endpoints* may be any iterable (e.g. a generator over
+        a tool's output) and never needs to be materialised alongside the
+        merged records.
+
         Args:
-            endpoints: List of canonical :class:`Endpoint` objects.
+            endpoints: Iterable of canonical :class:`Endpoint` objects.
             source:    Tool label (e.g. ``"katana"``, ``"gau"``).
         """
+        records = self._records
         for ep in endpoints:
             norm = normalise_url(ep.url)
-            if norm in self._records:
-                incoming = self._endpoint_to_record(ep, source)
-                self._records[norm].merge_from(incoming)
+            record = records.get(norm)
+            if record is None:
+                record = records[norm] = self._endpoint_to_record(ep, source)
             else:
-                self._records[norm] = self._endpoint_to_record(ep, source)
+                record.merge_from(self._endpoint_to_record(ep, source))
+            record.category = categorise_url(record.url, record.parameters)
+            record.confidence = compute_confidence(record)
 
     # ------------------------------------------------------------------
     # Merge pipeline
@@ -248,23 +256,13 @@ class URLMerger:
 
     def merge(self) -> List[Endpoint]:
         """
-        Execute the merge pipeline and return deduplicated, classified
-        :class:`Endpoint` objects sorted by descending confidence.
-
-        Steps:
-        1. Categorise each URL
-        2. Compute confidence scores
-        3. Convert to canonical Endpoint objects
-        4. Sort by confidence (descending)
-        """
-        results: List[URLRecord] = []
+        Return the deduplicated, classified :class:`Endpoint` objects sorted
+        by descending confidence.
 
-        for record in self._records.values():
-            record.category = categorise_url(record.url, record.parameters)
-            record.confidence = compute_confidence(record)
-            results.append(record)
-
-        results.sort(key=lambda r: r.confidence, reverse=True)
+        Records are already categorised and scored by :meth:`add`, so this
+        only sorts and converts them.
+        """
+        results = sorted(self._records.values(), key=lambda r: r.confidence, reverse=True)
         return [r.to_endpoint() for r in results]
 
     def clear(self) -> None:
@@ -280,8 +278,7 @@ class URLMerger:
         cats: Dict[str, int] = {}
         src_counts: Dict[str, int] = {}
         for record in self._records.values():
-            cat = categorise_url(record.url, record.parameters)
-            cats[cat] = cats.get(cat, 0) + 1
+            cats[record.category] = cats.get(record.category, 0) + 1
             for s in record.sources:
                 src_counts[s] = src_counts.get(s, 0) + 1
 
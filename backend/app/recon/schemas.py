@@ -5,7 +5,7 @@ Defines data models for API requests/responses and internal data structures.
 """
 
 from typing import List, Dict, Optional, Any
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime
 
 
@@ -73,6 +73,8 @@ class DomainDiscoveryResult(BaseModel):
 
 class ReconTaskRequest(BaseModel):
     """Request to start a reconnaissance task."""
+    model_config = ConfigDict(extra="forbid")
+
     domain: str = Field(..., min_length=3, max_length=253, description="Target domain name")
     hackertarget_api_key: Optional[str] = Field(None, description="HackerTarget API key")
     dns_nameservers: Optional[List[str]] = Field(None, description="Custom DNS nameservers")
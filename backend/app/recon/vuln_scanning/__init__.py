@@ -8,25 +8,31 @@ Supervisor: Sir Galib
 FYP: AutoPenTest AI - Month 7
 """
 
-from .schemas import (
-    ScanMode,
-    VulnSeverity,
-    VulnCategory,
-    VulnerabilityInfo,
-    VulnScanRequest,
-    VulnScanResult,
-    VulnScanStats,
-    CVEInfo,
-    CWEInfo,
-    CAPECInfo,
-    MITREData,
-    NucleiConfig,
-    CVEEnrichmentConfig,
-    MITREConfig,
-)
-from .nuclei_orchestrator import NucleiOrchestrator, NucleiOrchestratorConfig
-from .template_updater import NucleiTemplateUpdater, TemplateVersionInfo
-from .interactsh_client import InteractshClient, OOBInteraction
+from .._lazy import make_lazy_getattr
+
+# Exports are imported on first access (see make_lazy_getattr)
+_EXPORTS = {
+    "ScanMode": ".schemas",
+    "VulnSeverity": ".schemas",
+    "VulnCategory": ".schemas",
+    "VulnerabilityInfo": ".schemas",
+    "VulnScanRequest": ".schemas",
+    "VulnScanResult": ".schemas",
+    "VulnScanStats": ".schemas",
+    "CVEInfo": ".schemas",
+    "CWEInfo": ".schemas",
+    "CAPECInfo": ".schemas",
+    "MITREData": ".schemas",
+    "NucleiConfig": ".schemas",
+    "CVEEnrichmentConfig": ".schemas",
+    "MITREConfig": ".schemas",
+    "NucleiOrchestrator": ".nuclei_orchestrator",
+    "NucleiOrchestratorConfig": ".nuclei_orchestrator",
+    "NucleiTemplateUpdater": ".template_updater",
+    "TemplateVersionInfo": ".template_updater",
+    "InteractshClient": ".interactsh_client",
+    "OOBInteraction": ".interactsh_client",
+}
 
 __all__ = [
     "ScanMode",
@@ -50,3 +56,6 @@ __all__ = [
     "InteractshClient",
     "OOBInteraction",
 ]
+
+
+__getattr__ = make_lazy_getattr(__name__, _EXPORTS)
@@ -31,7 +31,7 @@ import os
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
-from app.recon.canonical_schemas import Finding, ReconResult, Severity
+from app.recon.canonical_schemas import FINDING_LIST, ReconResult, Severity
 from app.recon.orchestrators.base import BaseOrchestrator
 
 logger = logging.getLogger(__name__)
@@ -267,7 +267,7 @@ class NucleiOrchestrator(BaseOrchestrator):
         - ``evidence``    = matched-at + curl-command snippet
         - ``tags``        = info.tags
         """
-        findings: List[Finding] = []
+        rows: List[Dict[str, Any]] = []
 
         for record in (raw or []):
             info = record.get("info", {})
@@ -287,7 +287,7 @@ class NucleiOrchestrator(BaseOrchestrator):
             cve_ids = _extract_cves(record)
             cwe_ids = _extract_cwes(record)
 
-            finding = Finding(
+            rows.append(dict(
                 id=f"nuclei-{template_id}",
                 name=info.get("name", template_id),
                 description=info.get("description", ""),
@@ -306,10 +306,9 @@ class NucleiOrchestrator(BaseOrchestrator):
                     "http_method": record.get("type", "").upper() or None,
                     "matcher_name": record.get("matcher-name"),
                 },
-            )
-            findings.append(finding)
+            ))
 
-        return self._make_result(findings=findings)
+        return self._make_result(findings=FINDING_LIST.validate_python(rows))
 
     # ------------------------------------------------------------------
     # Convenience: scan multiple targets concurrently
@@ -124,12 +124,14 @@ class ProjectService:
             return None
 
         status_val = update_data.status.value if update_data.status else None
-        return await self.projects.update(
+        updated = await self.projects.update(
             project_id,
             name=update_data.name,
             description=update_data.description,
             status=status_val,
         )
+        # An empty update writes nothing; the project is unchanged
+        return updated if updated is not None else project
 
     async def delete_project(self, project_id: str, user_id: str) -> bool:
         """
@@ -0,0 +1,76 @@
+"""
+Same-Tick Batch Loader
+
+Coalesces lookups issued in the same event-loop iteration into one call of a
+batch function, in the spirit of Prisma's built-in dataloader: concurrent
+``get_by_id`` calls on the same loader become a single
+``find_many({"id": {"in": [...]}})`` instead of one ``find_unique`` round
+trip each.  Repositories own their loaders and live for one request, so
+only lookups within a request (e.g. an ``asyncio.gather``) are batched;
+separate requests never share a batch.
+
+Results are not cached between batches, so a lookup issued after a write
+always sees it.
+
+Usage::
+
+    loader = DataLoader(batch_load)          # batch_load(keys) -> values
+    a, b = await asyncio.gather(loader.load("u1"), loader.load("u2"))
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Set, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Batch ``load(key)`` calls made in the same loop iteration.
+
+    ``batch_load_fn`` receives the distinct keys in first-requested order and
+    must return one value (or *None*) per key, in the same order.
+    """
+
+    def __init__(self, batch_load_fn: Callable[[List[K]], Awaitable[List[Optional[V]]]]) -> None:
+        self._batch_load_fn = batch_load_fn
+        # Keys waiting for the next dispatch -> their shared future
+        self._pending: Dict[K, "asyncio.Future[Optional[V]]"] = {}
+        # Dispatched batches; the loop only keeps weak references to tasks
+        self._batches: Set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        """Return the value for *key*, batched with this tick's other loads."""
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = loop.create_future()
+            self._pending[key] = future
+        return await future
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._run(pending))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _run(self, pending: Dict[K, "asyncio.Future[Optional[V]]"]) -> None:
+        try:
+            values = await self._batch_load_fn(list(pending))
+        except BaseException as exc:
+            # Waiters must never hang: a cancelled batch cancels them too
+            cancelled = isinstance(exc, asyncio.CancelledError)
+            for future in pending.values():
+                if not future.done():
+                    if cancelled:
+                        future.cancel()
+                    else:
+                        future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+        for future, value in zip(pending.values(), values):
+            if not future.done():
+                future.set_result(value)
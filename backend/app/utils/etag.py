@@ -0,0 +1,28 @@
+"""
+Conditional GET Helpers
+
+Polled status endpoints tag each response with a weak ETag derived from the
+task's state; a client that sends it back in ``If-None-Match`` gets a bodiless
+``304 Not Modified`` until the task changes.
+"""
+from typing import Any
+
+from fastapi import Request, Response
+
+
+def weak_etag(*parts: Any) -> str:
+    """Build a weak ETag from the given state components."""
+    return 'W/"' + "-".join(str(p) for p in parts) + '"'
+
+
+def not_modified(request: Request, etag: str) -> bool:
+    """Return True if the request's ``If-None-Match`` already matches *etag*."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in (tag.strip() for tag in header.split(","))
+
+
+def not_modified_response(etag: str) -> Response:
+    """Return an empty ``304 Not Modified`` response carrying *etag*."""
+    return Response(status_code=304, headers={"ETag": etag})
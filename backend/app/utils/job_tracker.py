@@ -5,6 +5,8 @@ Provides a unified interface for tracking background task status.
 When a Prisma client is available the status updates are persisted to the
 ``tasks`` table; otherwise they fall through to the supplied in-memory dict
 so that the existing API endpoints continue to work without a live database.
+Endpoints that keep their task records in the shared task store pass the
+record's key instead, and the tracker patches that hash.
 """
 import logging
 from datetime import datetime
@@ -16,11 +18,13 @@ logger = logging.getLogger(__name__)
 class JobTracker:
     """
     Thin wrapper that writes task status to the database *and* to an
-    optional in-memory fallback dict.
+    optional in-memory fallback dict or task store hash.
 
     Usage inside a background task::
 
         tracker = JobTracker(task_id, in_memory_store)
+        # or, for task store records expiring a day after their last update
+        tracker = JobTracker(task_id, store_key=f"recon:{task_id}", store_ttl=86400)
         await tracker.start()
         ...
         await tracker.complete({"subdomains": [...]})
@@ -32,9 +36,15 @@ class JobTracker:
         self,
         task_id: str,
         in_memory: Optional[Dict[str, Any]] = None,
+        store_key: Optional[str] = None,
+        store_ttl: Optional[int] = None,
+        store_index_key: Optional[str] = None,
     ) -> None:
         self.task_id = task_id
         self._mem = in_memory  # reference to the module-level dict, may be None
+        self._store_key = store_key  # task store hash key, may be None
+        self._store_ttl = store_ttl
+        self._store_index_key = store_index_key  # index listing the task, may be None
 
     # ------------------------------------------------------------------
     # Private helpers
@@ -47,6 +57,23 @@ class JobTracker:
                 {**kwargs, "updated_at": datetime.utcnow().isoformat()}
             )
 
+    async def _update_store(self, **kwargs: Any) -> None:
+        """Patch the task store record if a key was provided and it still exists."""
+        if self._store_key is None:
+            return
+        from app.core import taskstore
+        from app.utils.timestamps import now_ms
+
+        # A deleted task must not be recreated as a partial record
+        if not await taskstore.hset_task_if_exists(
+            self._store_key, {**kwargs, "updated_at": now_ms()}
+        ):
+            return
+        if self._store_ttl is not None:
+            await taskstore.expire_task(self._store_key, self._store_ttl)
+            if self._store_index_key is not None:
+                await taskstore.expire_task(self._store_index_key, self._store_ttl)
+
     async def _db_update_status(
         self,
         status: str,
@@ -69,6 +96,23 @@ class JobTracker:
         except Exception as exc:
             logger.warning("DB task status update skipped (%s): %s", self.task_id, exc)
 
+    async def _db_finalize(self, status: str, message: str, level: str = "info") -> None:
+        """Best-effort final status update and log append in one transaction – never raises."""
+        try:
+            from app.db.prisma_client import get_prisma
+            from app.db.repositories.tasks_repo import TasksRepository
+
+            db = await get_prisma()
+            repo = TasksRepository(db)
+            await repo.finalize_task(
+                self.task_id,
+                status,
+                log_msg=message,
+                log_level=level,
+            )
+        except Exception as exc:
+            logger.warning("DB task finalize skipped (%s): %s", self.task_id, exc)
+
     async def _db_store_result(self, result_key: str, data: Any) -> None:
         """Best-effort database result storage – never raises."""
         try:
@@ -100,12 +144,14 @@ class JobTracker:
     async def start(self, message: str = "Task started") -> None:
         """Mark the task as *running*."""
         self._update_mem(status="running", message=message, progress=10)
-        await self._db_update_status("running", started_at=datetime.utcnow())
+        await self._update_store(status="running", message=message, progress=10)
+        await self._db_update_status("running")
         await self._db_add_log(message)
 
     async def progress(self, percent: int, message: str = "") -> None:
-        """Update the progress percentage (in-memory only)."""
+        """Update the progress percentage (not persisted to the database)."""
         self._update_mem(progress=percent, message=message)
+        await self._update_store(progress=percent, message=message)
         if message:
             await self._db_add_log(message)
 
@@ -117,13 +163,13 @@ class JobTracker:
     ) -> None:
         """Mark the task as *completed* and optionally store results."""
         self._update_mem(status="completed", progress=100, message=message, results=results)
-        await self._db_update_status("completed", completed_at=datetime.utcnow())
-        await self._db_add_log(message)
+        await self._update_store(status="completed", progress=100, message=message, results=results)
+        await self._db_finalize("completed", message)
         if results is not None:
             await self._db_store_result(result_key, results)
 
     async def fail(self, error: str) -> None:
         """Mark the task as *failed* with an error message."""
         self._update_mem(status="failed", message=f"Task failed: {error}", error=error)
-        await self._db_update_status("failed", completed_at=datetime.utcnow())
-        await self._db_add_log(f"Task failed: {error}", level="error")
+        await self._update_store(status="failed", message=f"Task failed: {error}", error=error)
+        await self._db_finalize("failed", f"Task failed: {error}", level="error")
@@ -0,0 +1,22 @@
+"""
+Cheap Task Timestamps
+
+Background task records are stamped on every state transition, so they store
+integer epoch milliseconds and only format to ISO-8601 when a response is
+built, instead of allocating and formatting a ``datetime`` per update.
+"""
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+
+def now_ms() -> int:
+    """Return the current UTC wall-clock time in epoch milliseconds."""
+    return time.time_ns() // 1_000_000
+
+
+def ms_to_iso(ms: Optional[int]) -> Optional[str]:
+    """Format epoch milliseconds as a naive UTC ISO-8601 string (``None`` passes through)."""
+    if ms is None:
+        return None
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).replace(tzinfo=None).isoformat()
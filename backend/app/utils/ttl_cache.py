@@ -0,0 +1,152 @@
+"""
+Bounded LRU Cache with Idle TTL
+
+Small in-process mapping used for per-process registries (e.g. active agent
+threads) that must not grow without bound on long-running servers.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, Iterator, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    LRU mapping whose entries also expire after ``ttl_seconds`` without access.
+
+    With ``refresh_on_access=False`` reads leave the timestamp alone, so an
+    entry expires ``ttl_seconds`` after it was stored however often it is
+    read – the behaviour wanted for caches of data that may go stale.
+
+    With ``maxweight`` the least recently used entries are also dropped while
+    the summed ``weigh(value)`` exceeds it (e.g. ``weigh=len`` bounds a cache
+    of encoded payloads by bytes); a single value heavier than ``maxweight``
+    is never kept.
+
+    Entries are kept in access order, so expiry only ever inspects the
+    oldest entries and eviction on insert is O(1) amortised – no background
+    sweeper task is needed to keep memory bounded.
+
+    Usage::
+
+        threads = TTLCache(maxsize=1024, ttl_seconds=1800)
+        threads["t1"] = agent
+        if "t1" in threads:
+            agent = threads["t1"]
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl_seconds: float = 1800,
+        refresh_on_access: bool = True,
+        maxweight: Optional[int] = None,
+        weigh: Optional[Callable[[V], int]] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.refresh_on_access = refresh_on_access
+        self.maxweight = maxweight
+        self._weigh = weigh
+        self.weight = 0
+        # key -> (value, last access, or insert, monotonic timestamp)
+        self._data: "OrderedDict[K, Tuple[V, float]]" = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _is_expired(self, stamp: float, now: float) -> bool:
+        return now - stamp > self.ttl_seconds
+
+    def _remove(self, key: K) -> V:
+        value, _ = self._data.pop(key)
+        if self._weigh is not None:
+            self.weight -= self._weigh(value)
+        return value
+
+    def _over_bounds(self) -> bool:
+        if len(self._data) > self.maxsize:
+            return True
+        return self.maxweight is not None and self.weight > self.maxweight
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def expire(self) -> int:
+        """Drop entries idle longer than the TTL. Returns number removed."""
+        now = time.monotonic()
+        removed = 0
+        while self._data:
+            key, (_, stamp) = next(iter(self._data.items()))
+            if not self._is_expired(stamp, now):
+                break
+            self._remove(key)
+            removed += 1
+        return removed
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Return the value for *key* and refresh its recency, or *default*."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        now = time.monotonic()
+        if self._is_expired(entry[1], now):
+            self._remove(key)
+            return default
+        if self.refresh_on_access:
+            self._data[key] = (entry[0], now)
+            self._data.move_to_end(key)
+        return entry[0]
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Remove *key* and return its value, or *default*."""
+        if key not in self._data:
+            return default
+        return self._remove(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.weight = 0
+
+    def __setitem__(self, key: K, value: V) -> None:
+        if key in self._data:
+            self._remove(key)
+        weight = 0 if self._weigh is None else self._weigh(value)
+        if self.maxweight is not None and weight > self.maxweight:
+            return
+        self._data[key] = (value, time.monotonic())
+        self.weight += weight
+        self.expire()
+        while self._data and self._over_bounds():
+            self._remove(next(iter(self._data)))
+
+    def __getitem__(self, key: K) -> V:
+        sentinel: Any = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            raise KeyError(key)
+        return value
+
+    def __delitem__(self, key: K) -> None:
+        if key not in self._data:
+            raise KeyError(key)
+        self._remove(key)
+
+    def __contains__(self, key: object) -> bool:
+        entry = self._data.get(key)  # type: ignore[arg-type]
+        if entry is None:
+            return False
+        if self._is_expired(entry[1], time.monotonic()):
+            self._remove(key)  # type: ignore[arg-type]
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._data))
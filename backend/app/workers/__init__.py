@@ -0,0 +1,3 @@
+"""
+Out-of-process job workers.
+"""
@@ -0,0 +1,152 @@
+"""
+Reconnaissance arq Worker
+
+Runs domain discovery jobs outside the API process, so WHOIS/DNS work and
+bursts of discovery requests never stall request handling, and queued jobs
+survive an API worker restart.  Jobs are queued on Redis by
+:func:`enqueue_domain_discovery` when ``RECON_WORKER_ENABLED`` is set; progress
+is written to the shared task store, so status polls work from any API worker.
+The worker also purges expired sessions hourly, off the request path.
+
+A caller's HackerTarget API key never goes into the job arguments (arq keeps
+those in Redis with the job result).  It is stored separately, encrypted with
+a key derived from ``SECRET_KEY``, for at most ``RECON_SECRET_TTL_SECONDS``
+and deleted once the job has run; the job finds it by task ID.
+
+Run the worker with::
+
+    arq app.workers.recon_worker.WorkerSettings
+"""
+import base64
+import hashlib
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from app.core import taskstore
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# arq is only needed where the worker queue is enabled
+try:
+    from arq import create_pool, cron
+    from arq.connections import ArqRedis, RedisSettings
+    ARQ_AVAILABLE = True
+except ImportError:
+    ARQ_AVAILABLE = False
+
+# Maximum concurrent discovery jobs per worker process
+RECON_WORKER_MAX_JOBS = 10
+# Upper bound on a single discovery run, in seconds
+RECON_JOB_TIMEOUT_SECONDS = 1800
+# How long a queued job's API key is kept (covers queueing plus the run)
+RECON_SECRET_TTL_SECONDS = 2 * RECON_JOB_TIMEOUT_SECONDS
+
+_pool: Optional["ArqRedis"] = None
+
+
+def worker_enabled() -> bool:
+    """Return True if recon jobs should be queued for the arq worker."""
+    return bool(settings.RECON_WORKER_ENABLED and settings.REDIS_URL and ARQ_AVAILABLE)
+
+
+async def get_pool() -> "ArqRedis":
+    """Return the process-wide arq Redis pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
+    return _pool
+
+
+def _secret_key(task_id: str) -> str:
+    return f"recon:{task_id}:secret"
+
+
+@lru_cache(maxsize=1)
+def _fernet() -> Fernet:
+    """Return the cipher for stashed job secrets, keyed from ``SECRET_KEY``."""
+    digest = hashlib.sha256(settings.SECRET_KEY.encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(digest))
+
+
+async def _stash_api_key(task_id: str, api_key: str) -> None:
+    """Store *api_key* encrypted and short-lived for the job of *task_id*."""
+    key = _secret_key(task_id)
+    token = _fernet().encrypt(api_key.encode()).decode()
+    await taskstore.hset_task(key, {"hackertarget_api_key": token})
+    await taskstore.expire_task(key, RECON_SECRET_TTL_SECONDS)
+
+
+async def _load_api_key(task_id: str) -> Optional[str]:
+    """Return the API key stashed for *task_id*, or None."""
+    stored = await taskstore.hmget_task(_secret_key(task_id), ["hackertarget_api_key"])
+    token = stored["hackertarget_api_key"]
+    if token is None:
+        return None
+    try:
+        return _fernet().decrypt(token.encode()).decode()
+    except InvalidToken:
+        logger.warning("Discarding undecryptable API key for recon task %s", task_id)
+        return None
+
+
+async def enqueue_domain_discovery(
+    task_id: str,
+    domain: str,
+    api_key: Optional[str] = None,
+    nameservers: Optional[List[str]] = None,
+) -> bool:
+    """
+    Queue a domain discovery job for the worker.
+
+    Returns False (nothing queued) when the worker queue is not enabled, in
+    which case the caller runs the job in-process.
+    """
+    if not worker_enabled():
+        return False
+    if api_key:
+        await _stash_api_key(task_id, api_key)
+    pool = await get_pool()
+    # The task ID doubles as the arq job ID, so a job is never queued twice
+    await pool.enqueue_job(
+        "run_domain_discovery_task", task_id, domain, nameservers, _job_id=task_id
+    )
+    return True
+
+
+async def run_domain_discovery_task(
+    ctx: Dict[str, Any],
+    task_id: str,
+    domain: str,
+    nameservers: Optional[List[str]] = None,
+) -> None:
+    """arq job: run domain discovery and record progress in the task store."""
+    from app.api.recon import run_domain_discovery
+
+    api_key = await _load_api_key(task_id)
+    try:
+        await run_domain_discovery(task_id, domain, api_key, nameservers)
+    finally:
+        await taskstore.hdel_task(_secret_key(task_id))
+
+
+async def cleanup_expired_sessions(ctx: Dict[str, Any]) -> int:
+    """arq cron job: purge expired and revoked refresh-token sessions."""
+    from app.db.prisma_client import get_prisma
+    from app.db.repositories.sessions_repo import SessionsRepository
+
+    return await SessionsRepository(await get_prisma()).cleanup_expired()
+
+
+if ARQ_AVAILABLE:
+    class WorkerSettings:
+        """arq worker configuration for reconnaissance jobs."""
+
+        functions = [run_domain_discovery_task]
+        cron_jobs = [cron(cleanup_expired_sessions, minute=30)]
+        redis_settings = RedisSettings.from_dsn(settings.REDIS_URL or "redis://localhost:6379")
+        max_jobs = RECON_WORKER_MAX_JOBS
+        job_timeout = RECON_JOB_TIMEOUT_SECONDS
@@ -2,6 +2,8 @@
 
 import pytest
 
+from app.agent.core.graph import _build_graph
+
 
 # Override the reset_databases fixture from parent conftest
 @pytest.fixture
@@ -15,3 +17,11 @@ def setup_agent_tests():
     """Setup for agent tests without database dependencies"""
     # No database setup needed for agent tests
     yield
+
+
+@pytest.fixture(autouse=True)
+def clear_graph_cache():
+    """Drop cached compiled graphs so patched ReActNodes never leak across tests"""
+    _build_graph.cache_clear()
+    yield
+    _build_graph.cache_clear()
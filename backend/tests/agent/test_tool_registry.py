@@ -61,6 +61,20 @@ class TestToolRegistry:
         assert "calculator" in exploit_tools
         assert "echo" not in exploit_tools
     
+    def test_get_tools_for_phase_cached_until_mutation(self):
+        """Per-phase tool mapping is reused and rebuilt after registration"""
+        registry = ToolRegistry()
+        registry.register_tool(EchoTool(), allowed_phases=[Phase.INFORMATIONAL])
+        
+        info_tools = registry.get_tools_for_phase(Phase.INFORMATIONAL)
+        assert registry.get_tools_for_phase(Phase.INFORMATIONAL) is info_tools
+        
+        registry.register_tool(CalculatorTool(), allowed_phases=[Phase.INFORMATIONAL])
+        assert "calculator" in registry.get_tools_for_phase(Phase.INFORMATIONAL)
+        
+        registry.unregister_tool("echo")
+        assert "echo" not in registry.get_tools_for_phase(Phase.INFORMATIONAL)
+    
     def test_get_tool_metadata(self):
         """Test getting tool metadata"""
         registry = ToolRegistry()
@@ -6,28 +6,32 @@ Covers:
   Day 87: System prompts — per-phase content, get_system_prompt()
   Day 88: MemorySaver — enable/disable flag wired through create_agent_graph
   Day 89: Tool interface framework — BaseTool, ToolMetadata, MockTool
-  Day 90: ReAct pattern — _parse_llm_response multi-line, think/act/observe
+  Day 90: ReAct pattern — _parse_llm_response multi-line, think/act
   Day 91: Agent configuration — AgentConfig, PhaseConfig, AgentConfigManager
   Day 92: Agent testing framework — MockLLM, MockTool, state builders,
           assertion helpers, AgentTestScenario
 """
 
 import json
+import uuid
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from langchain_core.messages import HumanMessage, AIMessage
+from langgraph.checkpoint.base import empty_checkpoint
 
 from app.agent.state.agent_state import AgentState, Phase
 from app.agent.prompts.system_prompts import (
     get_system_prompt,
+    get_system_message,
     INFORMATIONAL_PHASE_PROMPT,
     EXPLOITATION_PHASE_PROMPT,
     POST_EXPLOITATION_PHASE_PROMPT,
     COMPLETE_PHASE_PROMPT,
 )
 from app.agent.core.react_nodes import ReActNodes
+from app.agent.core.checkpointer import DeferredMemorySaver, ExpiringMemorySaver
 from app.agent.core.graph import should_continue, create_agent_graph, approval_gate
-from app.agent.tools.base_tool import BaseTool, ToolMetadata
+from app.agent.tools.base_tool import BaseTool, ToolMetadata, ToolProtocol
 from app.agent.tools.tool_registry import ToolRegistry
 from app.agent.config import (
     AgentConfig, PhaseConfig, AgentConfigManager, DEFAULT_CONFIG,
@@ -77,9 +81,10 @@ class TestLangGraphSetup:
         minimal_state["next_action"] = "act"
         assert should_continue(minimal_state) == "act"
 
-    def test_should_continue_observe(self, minimal_state):
+    def test_should_continue_observe_folds_into_think(self, minimal_state):
+        """The observe step is fused into act, so it routes back to think."""
         minimal_state["next_action"] = "observe"
-        assert should_continue(minimal_state) == "observe"
+        assert should_continue(minimal_state) == "think"
 
     def test_should_continue_approval(self, minimal_state):
         minimal_state["next_action"] = "approval"
@@ -149,6 +154,14 @@ class TestSystemPrompts:
         p = get_system_prompt("nonexistent_phase")
         assert p == INFORMATIONAL_PHASE_PROMPT
 
+    def test_get_system_message_is_prebuilt(self):
+        msg = get_system_message(Phase.EXPLOITATION)
+        assert msg.content == EXPLOITATION_PHASE_PROMPT
+        assert get_system_message("exploitation") is msg
+
+    def test_get_system_message_unknown_falls_back(self):
+        assert get_system_message("nonexistent_phase").content == INFORMATIONAL_PHASE_PROMPT
+
     def test_informational_prompt_contains_structured_reasoning(self):
         assert "THOUGHT" in INFORMATIONAL_PHASE_PROMPT.upper() or \
                "SITUATION" in INFORMATIONAL_PHASE_PROMPT.upper() or \
@@ -183,6 +196,85 @@ class TestMemorySaver:
             graph = create_agent_graph(enable_memory=False)
             assert graph is not None
 
+    def test_checkpointer_shared_across_models(self):
+        with patch("app.agent.core.graph.ReActNodes"):
+            gpt = create_agent_graph(model_name="gpt-4")
+            claude = create_agent_graph(model_provider="anthropic", model_name="claude")
+        assert gpt.checkpointer is claude.checkpointer
+
+    def test_unknown_checkpoint_mode_rejected(self):
+        with pytest.raises(ValueError):
+            create_agent_graph(checkpoint_mode="sometimes")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["per_step", "end_of_workflow"])
+    async def test_state_persists_across_runs(self, mode):
+        """Each checkpoint mode restores the thread's state on the next run."""
+        scenario = AgentTestScenario()
+        scenario.add_tool(name="scan", response="80/tcp open")
+
+        nodes = ReActNodes.__new__(ReActNodes)
+        nodes.llm = MockLLM([
+            "THOUGHT: Scan.\nACTION: scan\nTOOL_INPUT: {}",
+            "THOUGHT: Done.\nACTION: respond\nTOOL_INPUT: first",
+        ])
+        thread_id = f"persist-{mode}-{uuid.uuid4()}"
+        config = {"configurable": {"thread_id": thread_id}}
+
+        with patch("app.agent.core.graph.ReActNodes", return_value=nodes), patch(
+            "app.agent.tools.tool_registry.get_global_registry",
+            return_value=scenario.registry,
+        ):
+            graph = create_agent_graph(enable_memory=True, checkpoint_mode=mode)
+            await graph.ainvoke(build_initial_state(thread_id=thread_id), config=config)
+            snapshot = await graph.aget_state(config)
+
+        assert snapshot.values["tool_outputs"] == {"scan": "80/tcp open"}
+        assert snapshot.values["messages"][-1].content == "first"
+
+        history = list(graph.checkpointer.list(config))
+        if mode == "end_of_workflow":
+            assert len(history) == 1
+        else:
+            assert len(history) > 1
+
+    @pytest.mark.parametrize("saver_cls", [ExpiringMemorySaver, DeferredMemorySaver])
+    def test_idle_threads_expire_from_checkpointer(self, saver_cls):
+        """Threads with no checkpoint written for the TTL are forgotten."""
+        saver = saver_cls(thread_ttl_seconds=60)
+
+        def put(thread_id):
+            config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+            saver.put(config, empty_checkpoint(), {}, {})
+
+        with patch("app.agent.core.checkpointer.time.monotonic", return_value=100.0):
+            put("idle")
+            put("busy")
+        with patch("app.agent.core.checkpointer.time.monotonic", return_value=150.0):
+            put("busy")
+        with patch("app.agent.core.checkpointer.time.monotonic", return_value=161.0):
+            put("new")
+            assert saver.get_tuple({"configurable": {"thread_id": "idle"}}) is None
+            assert saver.get_tuple({"configurable": {"thread_id": "busy"}}) is not None
+            assert saver.get_tuple({"configurable": {"thread_id": "new"}}) is not None
+
+    def test_reading_a_deferred_thread_does_not_extend_its_ttl(self):
+        """The TTL counts from the last checkpoint written, not the last flush."""
+        saver = DeferredMemorySaver(thread_ttl_seconds=60)
+        clock = "app.agent.core.checkpointer.time.monotonic"
+
+        def put(thread_id):
+            config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+            saver.put(config, empty_checkpoint(), {}, {})
+
+        with patch(clock, return_value=100.0):
+            put("read")
+        with patch(clock, return_value=150.0):
+            assert saver.get_tuple({"configurable": {"thread_id": "read"}}) is not None
+        with patch(clock, return_value=161.0):
+            put("other")
+            assert saver.get_tuple({"configurable": {"thread_id": "read"}}) is None
+
 
 # ---------------------------------------------------------------------------
 # Day 89: Tool Interface Framework
@@ -218,6 +310,26 @@ class TestToolInterfaceFramework:
         with pytest.raises(RuntimeError, match="boom"):
             asyncio.get_event_loop().run_until_complete(tool.execute())
 
+    def test_subclass_missing_execute_rejected(self):
+        with pytest.raises(TypeError, match="execute"):
+            class Incomplete(BaseTool):
+                def _define_metadata(self) -> ToolMetadata:
+                    return ToolMetadata(name="incomplete", description="no execute")
+
+    def test_mock_tool_satisfies_protocol(self):
+        assert isinstance(MockTool(), ToolProtocol)
+
+    def test_langchain_tool_is_cached(self):
+        tool = MockTool(name="scanner", description="port scanner")
+        lc_tool = tool.to_langchain_tool()
+        assert lc_tool.name == "scanner"
+        assert tool.to_langchain_tool() is lc_tool
+
+    def test_parameters_json_serialized_once(self):
+        meta = ToolMetadata(name="scan", description="d", parameters={"target": {"type": "string"}})
+        assert json.loads(meta.parameters_json) == meta.parameters
+        assert meta == ToolMetadata(name="scan", description="d", parameters=meta.parameters)
+
     def test_tool_registry_phase_control(self):
         registry = ToolRegistry()
         recon_tool = MockTool(name="recon")
@@ -328,18 +440,90 @@ class TestReActPattern:
         assert "not available" in result["observation"] or "Unknown tool" in result["observation"]
 
     @pytest.mark.asyncio
-    async def test_observe_node_adds_message(self):
-        """OBSERVE node appends tool output to messages."""
+    async def test_act_node_adds_observation_message(self):
+        """ACT node appends tool output to messages and returns to think."""
+        scenario = AgentTestScenario()
+        scenario.add_tool(name="scan", response="Port 80 is open")
+
         nodes = ReActNodes.__new__(ReActNodes)
         state = build_initial_state(
-            next_action="observe",
-            observation="Port 80 is open",
+            next_action="act",
+            selected_tool="scan",
+            tool_input={},
         )
-        result = await nodes.observe(state)
+        with patch(
+            "app.agent.tools.tool_registry.get_global_registry",
+            return_value=scenario.registry,
+        ):
+            result = await nodes.act(state)
+
         assert result["next_action"] == "think"
         msg_contents = [m.content for m in result["messages"]]
         assert any("Port 80 is open" in c for c in msg_contents)
 
+    @pytest.mark.asyncio
+    async def test_parallel_tool_calls_fan_out(self):
+        """Multiple ACTION blocks run as parallel act branches and merge in think."""
+        scenario = AgentTestScenario()
+        scenario.add_tool(name="scan_a", response="A done")
+        scenario.add_tool(name="scan_b", response="B done")
+
+        nodes = ReActNodes.__new__(ReActNodes)
+        nodes.llm = MockLLM([
+            "THOUGHT: Run both.\nACTION: scan_a\nTOOL_INPUT: {}\nACTION: scan_b\nTOOL_INPUT: {}",
+            "THOUGHT: Done.\nACTION: respond\nTOOL_INPUT: finished",
+        ])
+
+        with patch("app.agent.core.graph.ReActNodes", return_value=nodes), patch(
+            "app.agent.tools.tool_registry.get_global_registry",
+            return_value=scenario.registry,
+        ):
+            graph = create_agent_graph(enable_memory=False)
+            result = await graph.ainvoke(build_initial_state())
+
+        scenario.assert_tool_called("scan_a")
+        scenario.assert_tool_called("scan_b")
+        assert result["tool_outputs"] == {"scan_a": "A done", "scan_b": "B done"}
+        assert result["observations"] == []
+        assert result["messages"][-1].content == "finished"
+
+    def test_parse_tool_calls_multiple(self):
+        nodes = self._make_nodes()
+        response = (
+            "THOUGHT: Scan two hosts.\n"
+            "ACTION: naabu\nTOOL_INPUT: {\"target\": \"10.0.0.1\"}\n"
+            "ACTION: naabu\nTOOL_INPUT: {\"target\": \"10.0.0.2\"}"
+        )
+        calls = nodes._parse_tool_calls(response)
+        assert calls == [
+            {"tool": "naabu", "input": {"target": "10.0.0.1"}},
+            {"tool": "naabu", "input": {"target": "10.0.0.2"}},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_think_ensemble_majority_vote(self):
+        """ensemble_size > 1 samples candidates concurrently and keeps the majority action."""
+        scenario = AgentTestScenario()
+        scenario.add_tool(name="scan", response="ok")
+
+        nodes = ReActNodes.__new__(ReActNodes)
+        nodes.llm = MockLLM([
+            "THOUGHT: Answer now.\nACTION: respond\nTOOL_INPUT: done",
+            "THOUGHT: Scan first.\nACTION: scan\nTOOL_INPUT: {}",
+            "THOUGHT: Scan it.\nACTION: scan\nTOOL_INPUT: {}",
+        ])
+
+        with patch(
+            "app.agent.tools.tool_registry.get_global_registry",
+            return_value=scenario.registry,
+        ):
+            result = await nodes.think(build_initial_state(ensemble_size=3))
+
+        assert nodes.llm.call_count == 3
+        assert result["next_action"] == "act"
+        assert result["selected_tool"] == "scan"
+        assert result["messages"][-1].content == "THOUGHT: Scan first."
+
     @pytest.mark.asyncio
     async def test_approval_gate_approved(self):
         """Approval gate forwards to act when status is approved."""
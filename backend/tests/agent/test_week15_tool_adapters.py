@@ -35,7 +35,9 @@ from app.agent.tools.error_handling import (
     ToolTimeoutError,
     categorise_error,
     get_recovery_hint,
+    truncate_output,
     with_retry,
+    with_timeout,
     RECOVERY_HINTS,
 )
 
@@ -597,6 +599,47 @@ class TestWithRetry:
         assert call_count == 1
 
 
+class TestWithTimeout:
+    def test_returns_result_within_deadline(self):
+        @with_timeout(timeout_seconds=1)
+        async def fn():
+            return "ok"
+
+        assert run(fn()) == "ok"
+
+    def test_raises_tool_timeout_error(self):
+        @with_timeout(timeout_seconds=0.01)
+        async def fn():
+            await asyncio.sleep(1)
+
+        with pytest.raises(ToolTimeoutError, match="timed out"):
+            run(fn())
+
+    def test_non_positive_timeout_disables_wrapper(self):
+        async def fn():
+            return "ok"
+
+        assert with_timeout(timeout_seconds=0)(fn) is fn
+        assert with_timeout(timeout_seconds=None)(fn) is fn
+
+
+class TestTruncateOutput:
+    def test_short_output_unchanged(self):
+        assert truncate_output("short", max_chars=100) == "short"
+
+    def test_keeps_head_and_tail(self):
+        output = "a" * 900 + "b" * 200
+        result = truncate_output(output, max_chars=1000)
+        assert result.startswith("a" * 800)
+        assert result.endswith("b" * 100)
+        assert "100 chars omitted" in result
+
+    def test_small_limit_does_not_keep_whole_output(self):
+        result = truncate_output("x" * 50, max_chars=5)
+        assert result.endswith("...\n\n")
+        assert "45 chars omitted" in result
+
+
 # ---------------------------------------------------------------------------
 # Day 99: Documentation completeness (adapter metadata validation)
 # ---------------------------------------------------------------------------
@@ -400,6 +400,40 @@ class TestAgentWebSocketHandler:
         cm.broadcast_to_project.assert_called()
 
 
+class TestAgentWebSocketEndpoint:
+    """Agent WebSocket endpoint serialises streamed chunks with orjson."""
+
+    def test_agent_update_serialises_non_json_values(self):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from app.api import agent as agent_api
+
+        class FakeAgent:
+            async def stream_chat(self, message, thread_id=None):
+                yield {"observe": {
+                    "messages": [AIMessage(content="scan done")],
+                    "current_phase": Phase.INFORMATIONAL,
+                    "observations": None,
+                }}
+
+        app = FastAPI()
+        app.include_router(agent_api.router)
+
+        with patch.object(agent_api, "_get_agent", return_value=FakeAgent()):
+            with TestClient(app).websocket_connect("/agent/ws/client-1") as ws:
+                assert ws.receive_json()["type"] == "connected"
+                ws.send_json({"type": "chat", "message": "hi", "thread_id": "t-ws"})
+                update = ws.receive_json()
+                assert ws.receive_json()["type"] == "agent_complete"
+
+        assert update["type"] == "agent_update"
+        assert update["data"]["node"] == "observe"
+        state_update = update["data"]["state_update"]
+        assert state_update["current_phase"] == "informational"
+        assert "scan done" in state_update["messages"][0]
+        assert state_update["observations"] is None
+
+
 # ---------------------------------------------------------------------------
 # Day 104: Agent Session Manager
 # ---------------------------------------------------------------------------
@@ -634,3 +668,4 @@ class TestAgentAuditLogger:
         logger.log_tool_executed("naabu_scan", "done")
         for entry in logger.get_log():
             assert entry["thread_id"] == "test-thread-42"
+
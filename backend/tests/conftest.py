@@ -12,17 +12,23 @@ import pytest
 @pytest.fixture(autouse=True)
 def reset_databases():
     """
-    Clear the legacy in-memory stub dicts between tests.
+    Clear the legacy in-memory stub dicts (and the process-wide user lookup
+    cache) between tests.
 
     These dicts are no longer used by the refactored endpoints, but test
     modules that were written against the old API may still reference them.
     """
     from app.api import auth, projects
+    from app.db.repositories import users_repo
 
     auth.users_db.clear()
     projects.projects_db.clear()
+    users_repo._user_cache.clear()
+    users_repo._user_cache_keys.clear()
 
     yield
 
     auth.users_db.clear()
     projects.projects_db.clear()
+    users_repo._user_cache.clear()
+    users_repo._user_cache_keys.clear()
@@ -652,6 +652,13 @@ class TestDay117GraphQueryServer:
         assert result.get("success") is False
         assert "write" in result.get("error", "").lower()
 
+    @pytest.mark.asyncio
+    async def test_driver_is_created_once_and_reused(self):
+        driver = self.server._get_driver()
+        assert self.server._get_driver() is driver
+        await self.server.close()
+        assert self.server._driver is None
+
     def test_get_attack_surface_requires_project(self):
         resp = self.tc.tools_call("get_attack_surface", {})
         assert_rpc_error(resp, expected_code=ErrorCode.SCHEMA_VALIDATION)
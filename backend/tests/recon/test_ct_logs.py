@@ -0,0 +1,97 @@
+"""
+Unit tests for the Certificate Transparency module.
+"""
+
+import httpx
+import orjson
+import pytest
+from unittest.mock import patch
+
+from app.recon import ct_logs
+from app.recon.ct_logs import CertificateTransparency
+
+_ENTRIES = [
+    {"id": 1, "name_value": "www.example.com\n*.example.com"},
+    {"id": 2, "name_value": "API.example.com\n\nmail.example.com\n"},
+    {"id": 3, "name_value": "other.org"},
+    {"id": 4, "common_name": "no-name-value.example.com"},
+    {"id": 5, "name_value": " dev.example.com "},
+]
+_EXPECTED = {"www.example.com", "api.example.com", "mail.example.com", "dev.example.com"}
+
+
+def _chunked(body: bytes, size: int):
+    """Async byte stream of *body* in *size*-byte chunks."""
+    async def stream():
+        for i in range(0, len(body), size):
+            yield body[i:i + size]
+    return stream()
+
+
+def _mock_client(body: bytes, chunk_size: int = 7):
+    """Patch httpx.AsyncClient to serve *body* from crt.sh in small chunks."""
+    real_client = httpx.AsyncClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=_chunked(body, chunk_size))
+
+    def client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    return patch.object(ct_logs.httpx, "AsyncClient", client)
+
+
+@pytest.mark.asyncio
+class TestCertificateTransparency:
+    """Test suite for CertificateTransparency.discover_subdomains."""
+
+    async def test_stream_parses_names_split_across_chunks(self):
+        """Names straddling chunk boundaries, wildcards and blank lines are handled."""
+        if not ct_logs.IJSON_AVAILABLE:
+            pytest.skip("ijson not installed")
+        with _mock_client(orjson.dumps(_ENTRIES)):
+            subdomains = await CertificateTransparency().discover_subdomains("example.com")
+
+        assert subdomains == _EXPECTED
+
+    async def test_truncated_stream_returns_empty_set(self):
+        """A body cut off mid-document is an error, not a partial result."""
+        if not ct_logs.IJSON_AVAILABLE:
+            pytest.skip("ijson not installed")
+        body = orjson.dumps(_ENTRIES)
+        with _mock_client(body[: len(body) // 2]):
+            subdomains = await CertificateTransparency().discover_subdomains("example.com")
+
+        assert subdomains == set()
+
+    async def test_non_streaming_fallback_matches(self):
+        """Without ijson the whole body is parsed with orjson, with the same result."""
+        with _mock_client(orjson.dumps(_ENTRIES)), \
+                patch.object(ct_logs, "IJSON_AVAILABLE", False):
+            subdomains = await CertificateTransparency().discover_subdomains("example.com")
+
+        assert subdomains == _EXPECTED
+
+    async def test_non_streaming_truncated_body_returns_empty_set(self):
+        """The orjson fallback also treats a truncated body as an error."""
+        body = orjson.dumps(_ENTRIES)
+        with _mock_client(body[:-5]), patch.object(ct_logs, "IJSON_AVAILABLE", False):
+            subdomains = await CertificateTransparency().discover_subdomains("example.com")
+
+        assert subdomains == set()
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    async def test_wildcard_filter_shares_the_parser(self, streaming):
+        """discover_with_wildcard_filter parses crt.sh output the same way."""
+        if streaming and not ct_logs.IJSON_AVAILABLE:
+            pytest.skip("ijson not installed")
+        ct = CertificateTransparency()
+        with _mock_client(orjson.dumps(_ENTRIES)), \
+                patch.object(ct_logs, "IJSON_AVAILABLE", streaming):
+            without = await ct.discover_with_wildcard_filter("example.com")
+            with_wildcards = await ct.discover_with_wildcard_filter(
+                "example.com", include_wildcards=True
+            )
+
+        assert without == _EXPECTED
+        assert with_wildcards == _EXPECTED | {"example.com"}
@@ -3,7 +3,7 @@ Unit tests for DNS Resolver module.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from app.recon.dns_resolver import DNSResolver
 
 
@@ -42,6 +42,17 @@ class TestDNSResolver:
             assert "ipv4" in result["ips"]
             assert "ipv6" in result["ips"]
 
+    @pytest.mark.asyncio
+    async def test_resolve_uses_async_resolver(self):
+        """Test queries are awaited on the async resolver, not an executor."""
+        resolver = DNSResolver()
+
+        with patch.object(resolver.resolver, "resolve", new=AsyncMock(return_value=["93.184.216.34"])) as mock_resolve:
+            records = await resolver.resolve_single_type("example.com", "A")
+
+        mock_resolve.assert_awaited_once_with("example.com", "A")
+        assert records == ["93.184.216.34"]
+
     def test_parse_a_records(self):
         """Test parsing A records."""
         resolver = DNSResolver()
@@ -114,3 +125,21 @@ class TestDNSResolver:
         # Both subdomains share the same IP
         if "93.184.216.34" in ip_mapping:
             assert len(ip_mapping["93.184.216.34"]) == 2
+
+    def test_organize_ips_groups_both_families(self):
+        """Test IPv4 and IPv6 addresses are grouped, keeping subdomain order."""
+        resolver = DNSResolver()
+
+        dns_results = {
+            "b.example.com": {"ips": {"ipv4": ["10.0.0.2", "10.0.0.1"], "ipv6": ["::1"]}},
+            "a.example.com": {"ips": {"ipv4": ["10.0.0.1"], "ipv6": []}},
+            "broken.example.com": {"error": "timeout"},
+        }
+
+        ip_mapping = resolver.organize_ips(dns_results)
+
+        assert ip_mapping == {
+            "10.0.0.1": ["b.example.com", "a.example.com"],
+            "10.0.0.2": ["b.example.com"],
+            "::1": ["b.example.com"],
+        }
@@ -0,0 +1,170 @@
+"""
+Unit tests for the reconnaissance API task lifecycle.
+"""
+
+import asyncio
+import orjson
+import pytest
+from pydantic import ValidationError
+from unittest.mock import AsyncMock, patch
+from fastapi import HTTPException
+
+from app.api import recon
+from app.recon.schemas import ReconTaskRequest
+from app.workers import recon_worker
+
+
+@pytest.mark.asyncio
+class TestReconTaskStore:
+    """Recon tasks are kept in the shared task store."""
+
+    async def _start(self, user_id: str, domain: str = "example.com") -> str:
+        with patch.object(recon, "run_domain_discovery", AsyncMock()):
+            response = await recon.start_domain_discovery(
+                ReconTaskRequest(domain=domain), {"user_id": user_id}
+            )
+        return response.task_id
+
+    async def test_discovery_lifecycle(self):
+        """Status, progress and results are read back from the task store."""
+        task_id = await self._start("recon-u1")
+        status = await recon.get_recon_status(task_id, {"user_id": "recon-u1"})
+        assert orjson.loads(status.body)["status"] == "pending"
+
+        results = {"domain": "example.com", "subdomains": ["www.example.com"]}
+        with patch("app.recon.domain_discovery.DomainDiscovery") as discovery:
+            discovery.return_value.run = AsyncMock(return_value=results)
+            await recon.run_domain_discovery(task_id, "example.com")
+
+        assert (await recon.get_recon_results(task_id, {"user_id": "recon-u1"})) == results
+        with pytest.raises(HTTPException) as exc_info:
+            await recon.get_recon_status(task_id, {"user_id": "someone-else"})
+        assert exc_info.value.status_code == 403
+
+    async def test_progress_refreshes_user_index_ttl(self):
+        """The user's index is kept alive for as long as their tasks are."""
+        task_id = await self._start("recon-u6")
+
+        with patch("app.recon.domain_discovery.DomainDiscovery") as discovery, \
+                patch.object(recon.taskstore, "expire_task", AsyncMock()) as expire:
+            discovery.return_value.run = AsyncMock(return_value={"domain": "example.com"})
+            await recon.run_domain_discovery(task_id, "example.com")
+
+        expired = [call.args[0] for call in expire.await_args_list]
+        assert recon._task_key(task_id) in expired
+        assert expired.count(recon._user_index_key("recon-u6")) == expired.count(recon._task_key(task_id))
+
+    async def test_deleting_a_running_task_sticks(self):
+        """Progress from a running job does not recreate a deleted task."""
+        task_id = await self._start("recon-u7")
+        release = asyncio.Event()
+
+        async def run():
+            await release.wait()
+            return {"domain": "example.com"}
+
+        with patch("app.recon.domain_discovery.DomainDiscovery") as discovery:
+            discovery.return_value.run = run
+            job = asyncio.ensure_future(recon.run_domain_discovery(task_id, "example.com"))
+            await asyncio.sleep(0.05)
+            await recon.delete_recon_task(task_id, {"user_id": "recon-u7"})
+            release.set()
+            await job
+
+        assert await recon.taskstore.hgetall_task(recon._task_key(task_id)) == {}
+        with pytest.raises(HTTPException) as exc_info:
+            await recon.get_recon_status(task_id, {"user_id": "recon-u7"})
+        assert exc_info.value.status_code == 404
+
+    async def test_concurrent_tasks_share_one_discovery_run(self):
+        """Tasks for a domain already being discovered join the same run."""
+        first = await self._start("recon-u4")
+        second = await self._start("recon-u5")
+        release = asyncio.Event()
+        results = {"domain": "example.com", "subdomains": []}
+
+        async def run():
+            await release.wait()
+            return results
+
+        with patch("app.recon.domain_discovery.DomainDiscovery") as discovery:
+            discovery.return_value.run = run
+            jobs = [
+                asyncio.ensure_future(recon.run_domain_discovery(task_id, "example.com"))
+                for task_id in (first, second)
+            ]
+            await asyncio.sleep(0.05)  # both jobs are now waiting on the run
+            release.set()
+            await asyncio.gather(*jobs)
+
+        assert discovery.call_count == 1
+        assert not recon._discovery_inflight
+        for task_id, user_id in ((first, "recon-u4"), (second, "recon-u5")):
+            assert (await recon.get_recon_results(task_id, {"user_id": user_id})) == results
+
+    async def test_discovery_key_separates_api_keys_and_ignores_case(self):
+        """Runs only coalesce when they would return the same results."""
+        keyless = recon._discovery_key("Example.com", None, None)
+        assert keyless == recon._discovery_key("example.com", None, None)
+        assert keyless != recon._discovery_key("example.com", "secret", None)
+        assert "secret" not in repr(recon._discovery_key("example.com", "secret", None))
+
+    async def test_list_pages_through_own_tasks(self):
+        """Listings only include the caller's tasks, oldest first."""
+        # Created within the same millisecond; the index still keeps order
+        with patch.object(recon, "now_ms", return_value=recon.now_ms()):
+            ids = [await self._start("recon-u2", f"d{i}.example.com") for i in range(3)]
+            await self._start("recon-u3")
+
+        page = await recon.list_recon_tasks(page=2, per_page=2, current_user={"user_id": "recon-u2"})
+        assert page.total == 3
+        assert [t.task_id for t in page.tasks] == ids[2:]
+
+        await recon.delete_recon_task(ids[0], {"user_id": "recon-u2"})
+        page = await recon.list_recon_tasks(page=1, per_page=10, current_user={"user_id": "recon-u2"})
+        assert [t.task_id for t in page.tasks] == ids[1:]
+
+
+def test_request_rejects_unknown_fields():
+    with pytest.raises(ValidationError):
+        ReconTaskRequest(domain="example.com", bruteforce=True)
+
+
+@pytest.mark.asyncio
+class TestReconWorkerQueue:
+    """Discovery jobs go to the arq worker only when it is enabled."""
+
+    async def test_enqueue_is_skipped_when_disabled(self):
+        with patch.object(recon_worker.settings, "RECON_WORKER_ENABLED", False):
+            assert await recon_worker.enqueue_domain_discovery("t1", "example.com") is False
+
+    async def test_enqueue_uses_task_id_as_job_id(self):
+        pool = AsyncMock()
+        with patch.object(recon_worker, "worker_enabled", return_value=True), \
+                patch.object(recon_worker, "get_pool", AsyncMock(return_value=pool)):
+            assert await recon_worker.enqueue_domain_discovery("t2", "example.com") is True
+        pool.enqueue_job.assert_awaited_once_with(
+            "run_domain_discovery_task", "t2", "example.com", None, _job_id="t2"
+        )
+
+    async def test_api_key_is_kept_out_of_job_args(self):
+        """The API key is stashed encrypted and handed to the job by task ID."""
+        pool = AsyncMock()
+        with patch.object(recon_worker, "worker_enabled", return_value=True), \
+                patch.object(recon_worker, "get_pool", AsyncMock(return_value=pool)):
+            await recon_worker.enqueue_domain_discovery("t3", "example.com", "ht-secret")
+
+        assert "ht-secret" not in repr(pool.enqueue_job.await_args)
+        stashed = await recon_worker.taskstore.hgetall_task(recon_worker._secret_key("t3"))
+        assert "ht-secret" not in repr(stashed)
+
+        with patch("app.api.recon.run_domain_discovery", AsyncMock()) as run:
+            await recon_worker.run_domain_discovery_task({}, "t3", "example.com")
+        run.assert_awaited_once_with("t3", "example.com", "ht-secret", None)
+        assert await recon_worker.taskstore.hgetall_task(recon_worker._secret_key("t3")) == {}
+
+    async def test_start_does_not_run_in_process_when_queued(self):
+        with patch.object(recon, "enqueue_domain_discovery", AsyncMock(return_value=True)), \
+                patch.object(recon.background, "spawn") as spawn:
+            await recon.start_domain_discovery(ReconTaskRequest(domain="example.com"), {"user_id": "q1"})
+        spawn.assert_not_called()
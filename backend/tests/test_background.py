@@ -0,0 +1,38 @@
+"""
+Tests for detached background jobs.
+"""
+import asyncio
+
+import pytest
+
+from app.core import background
+
+
+@pytest.mark.asyncio
+class TestBackgroundJobs:
+    async def test_spawn_runs_detached_and_releases_reference(self):
+        done = asyncio.Event()
+
+        async def job():
+            done.set()
+
+        task = background.spawn(job(), name="job")
+        assert background.running_count() >= 1
+        await task
+        assert done.is_set()
+        assert task not in background._running
+
+    async def test_failed_job_is_logged_not_raised(self, caplog):
+        async def job():
+            raise RuntimeError("boom")
+
+        task = background.spawn(job(), name="failing")
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert "failing failed: boom" in caplog.text
+
+    async def test_cancel_all(self):
+        task = background.spawn(asyncio.sleep(60), name="sleeper")
+        await background.cancel_all()
+        assert task.cancelled()
+        assert background.running_count() == 0
@@ -6,6 +6,7 @@ import pytest
 from datetime import datetime, timezone
 from unittest.mock import Mock, patch, AsyncMock
 import json
+import httpx
 
 from app.recon.http_probing.schemas import (
     HttpProbeRequest,
@@ -351,6 +352,26 @@ class TestFaviconHasher:
         assert query == "http.favicon.hash:-123456"
 
 
+    @pytest.mark.asyncio
+    async def test_hash_favicon_uses_injected_client(self):
+        """All favicon candidates are fetched through the shared client"""
+        requested = []
+        
+        def handler(request):
+            requested.append(str(request.url))
+            if request.url.path == "/favicon.png":
+                return httpx.Response(200, headers={"content-type": "image/png"}, content=b"png")
+            return httpx.Response(404)
+        
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            hasher = FaviconHasher(client=client)
+            favicon = await hasher.hash_favicon("https://example.com/page")
+            assert not client.is_closed
+        
+        assert requested == ["https://example.com/favicon.ico", "https://example.com/favicon.png"]
+        assert favicon.size_bytes == 3
+
+
 # HttpProbeOrchestrator Tests
 
 class TestHttpProbeOrchestrator:
@@ -466,3 +487,84 @@ def test_base_url_info_with_error():
     assert info.success == False
     assert info.error == "Connection timeout"
     assert info.status_code is None
+
+
+# API Tests
+
+def test_start_http_probe_task_ids_unique():
+    """Concurrent probe requests get distinct, non-timestamp task IDs"""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.api import http_probe
+
+    app = FastAPI()
+    app.include_router(http_probe.router)
+
+    with patch.object(http_probe, "execute_http_probe", AsyncMock()):
+        client = TestClient(app)
+        ids = {
+            client.post("/api/http-probe/probe", json={"targets": ["https://example.com"]}).json()["task_id"]
+            for _ in range(5)
+        }
+
+    assert len(ids) == 5
+    assert all(task_id.startswith("http_probe_") for task_id in ids)
+
+
+def test_list_probe_tasks_returns_summaries_only():
+    """Task listing exposes summary fields, not the stored probe result"""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.api import http_probe
+
+    app = FastAPI()
+    app.include_router(http_probe.router)
+
+    with patch.object(http_probe, "execute_http_probe", AsyncMock()):
+        client = TestClient(app)
+        task_id = client.post(
+            "/api/http-probe/probe", json={"targets": ["https://example.com"]}
+        ).json()["task_id"]
+        listing = client.get("/api/http-probe/tasks").json()
+
+    entry = next(t for t in listing["tasks"] if t["task_id"] == task_id)
+    assert entry["status"] == "running"
+    assert entry["completed_at"] is None
+    assert "result" not in entry
+    assert listing["total"] == len(listing["tasks"])
+
+
+def test_get_probe_results_honours_if_none_match():
+    """Polling with the returned ETag yields 304 until the task changes"""
+    import asyncio
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.api import http_probe
+    from app.core import taskstore
+
+    app = FastAPI()
+    app.include_router(http_probe.router)
+
+    with patch.object(http_probe, "execute_http_probe", AsyncMock()):
+        client = TestClient(app)
+        task_id = client.post(
+            "/api/http-probe/probe", json={"targets": ["https://example.com"]}
+        ).json()["task_id"]
+
+        first = client.get(f"/api/http-probe/results/{task_id}")
+        etag = first.headers["etag"]
+        cached = client.get(f"/api/http-probe/results/{task_id}", headers={"If-None-Match": etag})
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(taskstore.hset_task(f"probe:{task_id}", {
+            "status": "failed", "completed_at": "2024-01-01T00:00:00", "error": "boom",
+        }))
+        loop.close()
+        changed = client.get(f"/api/http-probe/results/{task_id}", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert changed.status_code == 200
+    assert changed.json()["error"] == "boom"
+    assert changed.headers["etag"] != etag
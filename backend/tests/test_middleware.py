@@ -0,0 +1,152 @@
+"""
+Tests for the HTTP middleware stack.
+"""
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from app.middleware import (
+    CompositeMiddleware,
+    CorrelationIDMiddleware,
+    RateLimitMiddleware,
+    SecurityHeadersMiddleware,
+)
+
+
+def _ping_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping(request: Request):
+        return {"ok": True, "request_id": getattr(request.state, "request_id", None)}
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    return app
+
+
+def _limited(**limits) -> RateLimitMiddleware:
+    return RateLimitMiddleware(_ping_app(), **limits)
+
+
+def _client(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+class TestRateLimitMiddleware:
+    async def test_requests_over_limit_are_rejected(self):
+        limiter = _limited(calls=2, period=60)
+        async with _client(limiter) as client:
+            first = await client.get("/ping")
+            second = await client.get("/ping")
+            third = await client.get("/ping")
+
+        assert first.headers["X-RateLimit-Remaining"] == "1"
+        assert second.headers["X-RateLimit-Remaining"] == "0"
+        assert third.status_code == 429
+
+    async def test_window_slides_and_idle_clients_are_swept(self):
+        limiter = _limited(calls=1, period=60)
+        async with _client(limiter) as client:
+            assert (await client.get("/ping")).status_code == 200
+
+            # Age the recorded request past the window
+            windows = limiter.windows
+            times = windows.clients["127.0.0.1"]
+            times[0] -= windows._period_ns
+            windows.clients["10.0.0.1"] = type(times)([times[0]], maxlen=1)
+            windows._next_sweep_ns = 0
+
+            assert (await client.get("/ping")).status_code == 200
+
+        assert "10.0.0.1" not in windows.clients
+        assert len(windows.clients["127.0.0.1"]) == 1
+
+
+@pytest.mark.asyncio
+class TestCorrelationIDMiddleware:
+    async def test_generates_hex_request_id(self):
+        async with _client(CorrelationIDMiddleware(_ping_app())) as client:
+            first = (await client.get("/ping")).headers["X-Request-ID"]
+            second = (await client.get("/ping")).headers["X-Request-ID"]
+
+        assert len(first) == 32 and int(first, 16) >= 0
+        assert first != second
+
+    async def test_propagates_upstream_request_id(self):
+        async with _client(CorrelationIDMiddleware(_ping_app())) as client:
+            response = await client.get("/ping", headers={"X-Request-ID": "abc-123"})
+
+        assert response.headers["X-Request-ID"] == "abc-123"
+
+
+@pytest.mark.asyncio
+class TestSecurityHeadersMiddleware:
+    async def test_adds_each_header_once(self):
+        async with _client(SecurityHeadersMiddleware(_ping_app())) as client:
+            response = await client.get("/ping")
+
+        assert response.headers.get_list("X-Frame-Options") == ["DENY"]
+        assert response.headers["Referrer-Policy"] == "strict-origin-when-cross-origin"
+
+
+@pytest.mark.asyncio
+class TestCompositeMiddleware:
+    async def test_adds_request_rate_and_security_headers(self):
+        async with _client(CompositeMiddleware(_ping_app(), calls=5)) as client:
+            response = await client.get("/ping", headers={"X-Request-ID": "abc-123"})
+
+        assert response.status_code == 200
+        assert response.json()["request_id"] == "abc-123"
+        assert response.headers["X-Request-ID"] == "abc-123"
+        assert response.headers["X-RateLimit-Remaining"] == "4"
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert "Server-Timing" not in response.headers
+
+    async def test_server_timing_header_is_opt_in(self):
+        async with _client(CompositeMiddleware(_ping_app(), server_timing=True)) as client:
+            response = await client.get("/ping")
+
+        assert response.headers["Server-Timing"].startswith("app;dur=")
+
+    async def test_rejects_requests_over_limit(self):
+        async with _client(CompositeMiddleware(_ping_app(), calls=1)) as client:
+            assert (await client.get("/ping")).status_code == 200
+            response = await client.get("/ping")
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "60"
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+
+    async def test_unhandled_exception_becomes_500(self):
+        app = _ping_app()
+        app.add_middleware(CompositeMiddleware)
+        async with _client(app) as client:
+            response = await client.get("/boom")
+
+        assert response.status_code == 500
+        body = response.json()
+        assert body["request_id"] == response.headers["X-Request-ID"]
+        assert "exception" not in body
+
+    async def test_exception_message_hidden_by_default(self):
+        app = _ping_app()
+        app.add_middleware(CompositeMiddleware)
+        async with _client(app) as client:
+            response = await client.get("/boom")
+
+        assert response.json()["message"] == "An unexpected error occurred"
+
+    async def test_exception_message_exposed_when_enabled(self):
+        app = _ping_app()
+        app.add_middleware(CompositeMiddleware)
+        with patch("app.middleware._EXPOSE_EXC", True):
+            async with _client(app) as client:
+                response = await client.get("/boom")
+
+        assert response.json()["message"] == "boom"
@@ -5,18 +5,22 @@ These tests use MagicMock to replace the Prisma client so no live database
 connection is required.  They verify that:
   - Each repository method calls the correct Prisma model accessor
   - Correct data is passed to create / update / delete calls
-  - Helper utilities (strip_none, paginate) work as expected
+  - Helper utilities (strip_none) work as expected
 """
+import asyncio
+
 import pytest
 from datetime import datetime, timedelta
 from typing import Any, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from app.db.repositories.base import BaseRepository
+from app.db.repositories import users_repo
 from app.db.repositories.users_repo import UsersRepository
 from app.db.repositories.projects_repo import ProjectsRepository
 from app.db.repositories.tasks_repo import TasksRepository
+from app.db.repositories import sessions_repo
 from app.db.repositories.sessions_repo import SessionsRepository
+from app.db.prisma_client import _client_kwargs, _pooled_url
 
 
 # ---------------------------------------------------------------------------
@@ -68,32 +72,6 @@ def _task(id="t1", project_id="p1", task_type="recon", status="pending"):
     return t
 
 
-# ===========================================================================
-# BaseRepository
-# ===========================================================================
-
-class TestBaseRepository:
-    def test_strip_none_removes_none_values(self):
-        data = {"a": 1, "b": None, "c": "x", "d": None}
-        result = BaseRepository._strip_none(data)
-        assert result == {"a": 1, "c": "x"}
-
-    def test_strip_none_empty_dict(self):
-        assert BaseRepository._strip_none({}) == {}
-
-    def test_paginate_first_page(self):
-        items = list(range(10))
-        assert BaseRepository._paginate(items, 0, 3) == [0, 1, 2]
-
-    def test_paginate_second_page(self):
-        items = list(range(10))
-        assert BaseRepository._paginate(items, 3, 3) == [3, 4, 5]
-
-    def test_paginate_beyond_end(self):
-        items = list(range(5))
-        assert BaseRepository._paginate(items, 4, 10) == [4]
-
-
 # ===========================================================================
 # UsersRepository
 # ===========================================================================
@@ -131,6 +109,47 @@ class TestUsersRepository:
         db.user.find_unique.assert_awaited_once_with(where={"id": "u1"})
         assert result is expected
 
+    @pytest.mark.asyncio
+    async def test_concurrent_get_by_id_is_batched(self):
+        db = _make_db()
+        db.user.find_many.return_value = [_user(id="u2"), _user(id="u1")]
+
+        repo = UsersRepository(db)
+        first, second, missing = await asyncio.gather(
+            repo.get_by_id("u1"), repo.get_by_id("u2"), repo.get_by_id("u3")
+        )
+
+        db.user.find_many.assert_awaited_once_with(where={"id": {"in": ["u1", "u2", "u3"]}})
+        db.user.find_unique.assert_not_awaited()
+        assert (first.id, second.id, missing) == ("u1", "u2", None)
+
+    @pytest.mark.asyncio
+    async def test_batched_lookup_failure_reaches_every_caller(self):
+        db = _make_db()
+        db.user.find_many.side_effect = RuntimeError("db down")
+
+        repo = UsersRepository(db)
+        results = await asyncio.gather(
+            repo.get_by_username("a"), repo.get_by_username("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_cancels_every_caller(self):
+        db = _make_db()
+        db.user.find_many.side_effect = asyncio.CancelledError()
+
+        repo = UsersRepository(db)
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                repo.get_by_username("a"), repo.get_by_username("b"), return_exceptions=True
+            ),
+            1,
+        )
+
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
     @pytest.mark.asyncio
     async def test_get_by_email(self):
         db = _make_db()
@@ -151,6 +170,36 @@ class TestUsersRepository:
 
         db.user.find_unique.assert_awaited_once_with(where={"username": "alice"})
 
+    @pytest.mark.asyncio
+    async def test_user_lookups_are_cached_until_a_write(self):
+        db = _make_db()
+        db.user.find_unique.return_value = _user()
+
+        repo = UsersRepository(db)
+        await repo.get_by_username("alice")
+        assert (await UsersRepository(db).get_by_email("alice@example.com")).id == "u1"
+        db.user.find_unique.assert_awaited_once()
+
+        await repo.update_password("u1", "new-secret")
+        await repo.get_by_username("alice")
+        assert db.user.find_unique.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_user_expires_even_when_read_often(self):
+        db = _make_db()
+        db.user.find_unique.return_value = _user()
+
+        repo = UsersRepository(db)
+        clock = "app.utils.ttl_cache.time.monotonic"
+        for now in (100.0, 104.0):  # reads within the TTL do not extend it
+            with patch(clock, return_value=now):
+                await repo.get_by_username("alice")
+        assert db.user.find_unique.await_count == 1
+
+        with patch(clock, return_value=100.0 + users_repo.USER_CACHE_TTL_SECONDS + 1):
+            await UsersRepository(db).get_by_username("alice")
+        assert db.user.find_unique.await_count == 2
+
     @pytest.mark.asyncio
     async def test_update_user_only_sends_non_none_fields(self):
         db = _make_db()
@@ -165,15 +214,15 @@ class TestUsersRepository:
         assert "is_active" not in call_data
 
     @pytest.mark.asyncio
-    async def test_update_user_no_changes_returns_current(self):
+    async def test_update_user_no_changes_skips_db(self):
         db = _make_db()
-        db.user.find_unique.return_value = _user()
 
         repo = UsersRepository(db)
         result = await repo.update_user("u1")
 
+        assert result is None
         db.user.update.assert_not_awaited()
-        db.user.find_unique.assert_awaited_once()
+        db.user.find_unique.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_delete_user(self):
@@ -215,9 +264,11 @@ class TestUsersRepository:
         db.user.find_unique.return_value = None
 
         repo = UsersRepository(db)
-        result = await repo.authenticate("nobody", "pass")
+        with patch("app.db.repositories.users_repo.verify_password", return_value=True) as verify:
+            result = await repo.authenticate("nobody", "pass")
 
         assert result is None
+        verify.assert_called_once_with("pass", users_repo._DUMMY_HASH)
 
 
 # ===========================================================================
@@ -278,6 +329,17 @@ class TestProjectsRepository:
         data = db.project.update.call_args.kwargs["data"]
         assert data["status"] == "running"
 
+    @pytest.mark.asyncio
+    async def test_update_with_no_fields_skips_database(self):
+        db = _make_db()
+
+        repo = ProjectsRepository(db)
+        result = await repo.update("p1")
+
+        assert result is None
+        db.project.update.assert_not_awaited()
+        db.project.find_unique.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_delete_project(self):
         db = _make_db()
@@ -302,12 +364,46 @@ class TestProjectsRepository:
         assert "total" in result
         assert result["total"] == 1
 
+    @pytest.mark.asyncio
+    async def test_list_with_filters_issues_queries_concurrently(self):
+        import asyncio
+
+        db = _make_db()
+        both_started = asyncio.Event()
+        started = []
+
+        async def _query(name, value):
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return value
+
+        db.project.find_many = lambda **kw: _query("find_many", [_project()])
+        db.project.count = lambda **kw: _query("count", 1)
+
+        result = await ProjectsRepository(db).list_with_filters("u1", status="running")
+
+        assert sorted(started) == ["count", "find_many"]
+        assert result["total"] == 1
+
 
 # ===========================================================================
 # TasksRepository
 # ===========================================================================
 
 class TestTasksRepository:
+    @pytest.mark.asyncio
+    async def test_concurrent_get_by_id_is_batched(self):
+        db = _make_db()
+        db.task.find_many.return_value = [_task(id="t1"), _task(id="t2")]
+
+        repo = TasksRepository(db)
+        tasks = await asyncio.gather(repo.get_by_id("t2"), repo.get_by_id("t1"))
+
+        db.task.find_many.assert_awaited_once_with(where={"id": {"in": ["t2", "t1"]}})
+        assert [t.id for t in tasks] == ["t2", "t1"]
+
     @pytest.mark.asyncio
     async def test_create_task(self):
         db = _make_db()
@@ -372,6 +468,22 @@ class TestTasksRepository:
         assert data["message"] == "Task started"
         assert data["level"] == "info"
 
+    @pytest.mark.asyncio
+    async def test_iter_logs_walks_keyset_pages(self):
+        db = _make_db()
+        db.tasklog.find_many.side_effect = [
+            [MagicMock(id="l1"), MagicMock(id="l2")],
+            [MagicMock(id="l3")],
+        ]
+
+        repo = TasksRepository(db)
+        logs = [log.id async for log in repo.iter_logs("t1", page_size=2)]
+
+        assert logs == ["l1", "l2", "l3"]
+        second = db.tasklog.find_many.call_args_list[1].kwargs
+        assert second["cursor"] == {"id": "l2"}
+        assert second["skip"] == 1
+
     @pytest.mark.asyncio
     async def test_upsert_metrics(self):
         db = _make_db()
@@ -384,18 +496,66 @@ class TestTasksRepository:
         call = db.taskmetrics.upsert.call_args.kwargs
         assert call["where"] == {"task_id": "t1"}
 
+    @pytest.mark.asyncio
+    async def test_finalize_task_writes_in_one_transaction(self):
+        db, tx = _make_db(), _make_db()
+        db.tx.return_value.__aenter__ = AsyncMock(return_value=tx)
+        db.tx.return_value.__aexit__ = AsyncMock(return_value=False)
+        tx.task.update.return_value = _task(status="completed")
+
+        repo = TasksRepository(db)
+        result = await repo.finalize_task(
+            "t1", "completed", metrics={"items_processed": 3}, log_msg="done"
+        )
+
+        assert result.status == "completed"
+        assert tx.task.update.call_args.kwargs["data"]["status"] == "completed"
+        assert "completed_at" in tx.task.update.call_args.kwargs["data"]
+        assert tx.taskmetrics.upsert.call_args.kwargs["data"]["update"]["items_processed"] == 3
+        tx.tasklog.create.assert_awaited_once()
+        db.task.update.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_get_by_project_with_filters(self):
         db = _make_db()
         db.task.find_many.return_value = [_task()]
 
         repo = TasksRepository(db)
-        await repo.get_by_project("p1", status="running", task_type="recon")
+        tasks, next_cursor = await repo.get_by_project("p1", status="running", task_type="recon")
 
         where = db.task.find_many.call_args.kwargs["where"]
         assert where["project_id"] == "p1"
         assert where["status"] == "running"
         assert where["type"] == "recon"
+        assert "cursor" not in db.task.find_many.call_args.kwargs
+        assert next_cursor is None  # short page
+
+    @pytest.mark.asyncio
+    async def test_get_by_project_resumes_after_cursor(self):
+        db = _make_db()
+        db.task.find_many.return_value = [_task(id="t3"), _task(id="t4")]
+
+        repo = TasksRepository(db)
+        tasks, next_cursor = await repo.get_by_project("p1", cursor="t2", take=2)
+
+        kwargs = db.task.find_many.call_args.kwargs
+        assert kwargs["cursor"] == {"id": "t2"}
+        assert kwargs["skip"] == 1
+        assert kwargs["take"] == 2
+        assert next_cursor == "t4"
+
+    @pytest.mark.asyncio
+    async def test_get_logs_is_keyset_paginated(self):
+        db = _make_db()
+        db.tasklog.find_many.return_value = [MagicMock(id="l1")]
+
+        repo = TasksRepository(db)
+        logs, next_cursor = await repo.get_logs("t1", level="error", cursor="l0", take=1)
+
+        kwargs = db.tasklog.find_many.call_args.kwargs
+        assert kwargs["where"] == {"task_id": "t1", "level": "error"}
+        assert kwargs["cursor"] == {"id": "l0"}
+        assert next_cursor == "l1"
 
 
 # ===========================================================================
@@ -407,7 +567,7 @@ class TestSessionsRepository:
         s = MagicMock()
         s.id = "sess1"
         s.user_id = "u1"
-        s.token = "tok"
+        s.token_hash = sessions_repo.hash_token("tok")
         s.is_revoked = revoked
         s.expires_at = (
             datetime.utcnow() - timedelta(hours=1)
@@ -427,7 +587,8 @@ class TestSessionsRepository:
         db.session.create.assert_awaited_once()
         data = db.session.create.call_args.kwargs["data"]
         assert data["user_id"] == "u1"
-        assert data["token"] == "mytoken"
+        assert data["token_hash"] == sessions_repo.hash_token("mytoken")
+        assert "token" not in data
         assert "expires_at" in data
 
     @pytest.mark.asyncio
@@ -438,7 +599,15 @@ class TestSessionsRepository:
         repo = SessionsRepository(db)
         await repo.get_by_token("mytoken")
 
-        db.session.find_unique.assert_awaited_once_with(where={"token": "mytoken"})
+        db.session.find_unique.assert_awaited_once_with(
+            where={"token_hash": sessions_repo.hash_token("mytoken")}
+        )
+
+    def test_hash_token_is_fixed_length_digest(self):
+        digest = sessions_repo.hash_token("a" * 500)
+        assert len(digest) == 64
+        assert digest == sessions_repo.hash_token("a" * 500)
+        assert digest != sessions_repo.hash_token("b" * 500)
 
     @pytest.mark.asyncio
     async def test_is_valid_returns_true_for_valid_session(self):
@@ -475,26 +644,27 @@ class TestSessionsRepository:
     @pytest.mark.asyncio
     async def test_revoke_session(self):
         db = _make_db()
-        db.session.find_unique.return_value = self._session()
         db.session.update.return_value = self._session(revoked=True)
 
         repo = SessionsRepository(db)
         result = await repo.revoke_session("tok")
 
         db.session.update.assert_awaited_once()
+        db.session.find_unique.assert_not_awaited()
         data = db.session.update.call_args.kwargs["data"]
         assert data["is_revoked"] is True
+        assert result.is_revoked is True
 
     @pytest.mark.asyncio
     async def test_revoke_session_returns_none_if_not_found(self):
         db = _make_db()
-        db.session.find_unique.return_value = None
+        db.session.update.return_value = None
 
         repo = SessionsRepository(db)
         result = await repo.revoke_session("nonexistent")
 
         assert result is None
-        db.session.update.assert_not_awaited()
+        db.session.update.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_revoke_all_user_sessions(self):
@@ -510,6 +680,10 @@ class TestSessionsRepository:
     @pytest.mark.asyncio
     async def test_cleanup_expired(self):
         db = _make_db()
+        db.session.find_many.side_effect = [
+            [self._session()] * 5,  # expired
+            [],                     # revoked
+        ]
         db.session.delete_many.return_value = 5
 
         repo = SessionsRepository(db)
@@ -517,3 +691,33 @@ class TestSessionsRepository:
 
         assert count == 5
         db.session.delete_many.assert_awaited_once()
+        for call in db.session.find_many.call_args_list:
+            assert "OR" not in call.kwargs["where"]
+
+    @pytest.mark.asyncio
+    async def test_cleanup_expired_deletes_in_batches(self):
+        db = _make_db()
+        full = [self._session()] * sessions_repo.CLEANUP_BATCH_SIZE
+        db.session.find_many.side_effect = [full, [self._session()], []]
+        db.session.delete_many.side_effect = [len(full), 1]
+
+        repo = SessionsRepository(db)
+        count = await repo.cleanup_expired()
+
+        assert count == len(full) + 1
+        assert db.session.delete_many.await_count == 2
+        assert db.session.find_many.call_args.kwargs["where"] == {"is_revoked": True}
+
+
+# ===========================================================================
+# Prisma client
+# ===========================================================================
+
+class TestPrismaClient:
+    def test_pooled_url_sets_connection_limit(self):
+        url = _pooled_url("postgresql://u:p@db:5432/app?schema=public&connection_limit=5", 16)
+        assert url == "postgresql://u:p@db:5432/app?schema=public&connection_limit=16"
+
+    def test_pool_size_unset_keeps_prisma_default(self):
+        with patch("app.core.config.settings.DATABASE_POOL_SIZE", 0):
+            assert _client_kwargs() == {}
@@ -248,6 +248,18 @@ class TestProjectService:
         result = await svc.delete_project("p1", "u1")
         assert result is True
 
+    @pytest.mark.asyncio
+    async def test_update_project_with_no_changes_returns_project(self):
+        from app.schemas import ProjectUpdate
+
+        svc = _make_project_service()
+        p = _project(user_id="u1")
+        svc.projects.get_by_id = AsyncMock(return_value=p)
+        svc.projects.update = AsyncMock(return_value=None)
+
+        result = await svc.update_project("p1", "u1", ProjectUpdate())
+        assert result is p
+
     @pytest.mark.asyncio
     async def test_enqueue_tasks_creates_correct_task_types(self):
         svc = _make_project_service()
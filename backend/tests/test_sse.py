@@ -0,0 +1,222 @@
+"""
+Tests for the SSE manager's per-client event queues.
+"""
+import asyncio
+import json
+from collections import defaultdict
+
+import pytest
+
+from app.api.sse import SSEManager
+
+
+class _Broker:
+    """In-process stand-in for Redis pub/sub, shared by several managers."""
+
+    def __init__(self):
+        self.channels = defaultdict(list)
+
+    def pubsub(self):
+        return _PubSub(self)
+
+    async def publish(self, channel, data):
+        for queue in self.channels[channel]:
+            queue.put_nowait({"type": "message", "data": data})
+
+
+class _PubSub:
+    def __init__(self, broker):
+        self.broker = broker
+        self.queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.broker.channels[channel].append(self.queue)
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self):
+        for queues in self.broker.channels.values():
+            if self.queue in queues:
+                queues.remove(self.queue)
+
+
+class _Request:
+    """Minimal stand-in for a connected Starlette request."""
+
+    async def is_disconnected(self) -> bool:
+        return False
+
+
+@pytest.mark.asyncio
+class TestSSEScanQueues:
+    async def test_scan_update_reaches_connected_client(self):
+        manager = SSEManager()
+        stream = manager.scan_event_generator("p1", _Request())
+        assert (await stream.__anext__())["event"] == "connected"
+
+        await manager.send_scan_update("p1", "port_scan", "running", {"ports": 3})
+        event = await stream.__anext__()
+        assert event["event"] == "scan_update"
+        assert json.loads(event["data"])["data"] == {"ports": 3}
+
+        await stream.aclose()
+        assert "p1" not in manager.active_streams
+
+    async def test_full_queue_drops_oldest_event(self):
+        manager = SSEManager(max_queue_size=2)
+        queue = manager._get_scan_queue("p1")
+        for status in ("a", "b", "c"):
+            await manager.send_scan_update("p1", "scan", status)
+
+        assert [json.loads(queue.get_nowait())["status"] for _ in range(2)] == ["b", "c"]
+        assert queue.dropped == 1
+        assert manager.dropped["p1"] == 1
+
+    async def test_slow_client_is_disconnected(self):
+        manager = SSEManager(max_queue_size=1, slow_client_disconnect=2)
+        stream = manager.scan_event_generator("p1", _Request())
+        await stream.__anext__()
+        for status in ("a", "b", "c"):
+            await manager.send_scan_update("p1", "scan", status)
+
+        event = await stream.__anext__()
+        assert event["event"] == "error"
+        with pytest.raises(StopAsyncIteration):
+            await stream.__anext__()
+        assert "p1" not in manager.active_streams
+
+    async def test_idle_stream_emits_heartbeats(self):
+        manager = SSEManager(heartbeat_interval=0.01)
+        stream = manager.scan_event_generator("p1", _Request())
+        await stream.__anext__()
+        assert (await stream.__anext__())["event"] == "heartbeat"
+
+        await manager.send_scan_update("p1", "scan", "running")
+        assert (await stream.__anext__())["event"] == "scan_update"
+        await stream.aclose()
+
+    async def test_heartbeat_payload_is_shared_between_streams(self):
+        manager = SSEManager(heartbeat_interval=0.01)
+        first = manager.scan_event_generator("p1", _Request())
+        second = manager.scan_event_generator("p2", _Request())
+        await first.__anext__()
+        await second.__anext__()
+
+        beat1 = await first.__anext__()
+        beat2 = await second.__anext__()
+        assert beat1["data"] is beat2["data"]
+        assert "timestamp" in json.loads(beat1["data"])
+        await first.aclose()
+        await second.aclose()
+
+    async def test_streams_share_one_heartbeat_ticker(self):
+        manager = SSEManager(heartbeat_interval=0.01)
+        first = manager.scan_event_generator("p1", _Request())
+        second = manager.scan_event_generator("p2", _Request())
+        await first.__anext__()
+        ticker = manager._ticker
+        await second.__anext__()
+        assert manager._ticker is ticker
+
+        assert (await first.__anext__())["event"] == "heartbeat"
+        assert (await second.__anext__())["event"] == "heartbeat"
+        await first.aclose()
+        await second.aclose()
+        assert manager._ticker is None  # stopped once no clients remain
+        await asyncio.gather(ticker, return_exceptions=True)
+        assert ticker.cancelled()
+
+    async def test_connected_event_escapes_project_id(self):
+        manager = SSEManager()
+        stream = manager.log_event_generator('p"1\\', _Request())
+
+        event = await stream.__anext__()
+        data = json.loads(event["data"])
+        assert data["project_id"] == 'p"1\\'
+        assert data["message"] == 'Connected to logs for project p"1\\'
+        assert data["timestamp"]
+        await stream.aclose()
+
+    async def test_publish_is_synchronous_and_releases_clients(self):
+        manager = SSEManager()
+        first = manager._get_scan_queue("p1")
+        second = manager._get_scan_queue("p1")
+        manager.publish_scan_update("p1", "scan", "running")
+        assert first.qsize() == second.qsize() == 1
+
+        assert first.get_nowait() is second.get_nowait()  # encoded once
+
+        manager._release_scan_queue("p1", first)
+        manager._release_scan_queue("p1", first)
+        assert manager.active_streams["p1"] == {second}
+        manager._release_scan_queue("p1", second)
+        assert "p1" not in manager.active_streams
+
+
+@pytest.mark.asyncio
+class TestSSERedisFanOut:
+    def _worker(self, broker):
+        manager = SSEManager(redis_url="redis://test")
+        manager._redis = broker
+        return manager
+
+    async def test_update_reaches_clients_of_other_workers(self):
+        broker = _Broker()
+        producer, consumer = self._worker(broker), self._worker(broker)
+        stream = consumer.scan_event_generator("p1", _Request())
+        await stream.__anext__()
+        await asyncio.sleep(0)  # let the relay subscribe
+
+        await producer.send_scan_update("p1", "port_scan", "running")
+        event = await asyncio.wait_for(stream.__anext__(), 1)
+        assert event["event"] == "scan_update"
+        assert json.loads(event["data"])["status"] == "running"
+
+        await stream.aclose()
+        assert "p1" not in consumer._subscribers
+        await asyncio.sleep(0)
+        assert not broker.channels["sse:scan:p1"]
+
+    async def test_relay_resubscribes_after_redis_error(self, monkeypatch):
+        monkeypatch.setattr("app.api.sse.SSE_RELAY_RETRY_SECONDS", 0)
+        broker = _Broker()
+        failures = [ConnectionError("redis down")]
+        subscribe = _PubSub.subscribe
+
+        async def flaky_subscribe(pubsub, channel):
+            if failures:
+                raise failures.pop()
+            await subscribe(pubsub, channel)
+
+        monkeypatch.setattr(_PubSub, "subscribe", flaky_subscribe)
+        producer, consumer = self._worker(broker), self._worker(broker)
+        stream = consumer.scan_event_generator("p1", _Request())
+        await stream.__anext__()
+        for _ in range(3):
+            await asyncio.sleep(0)  # fail, back off, resubscribe
+
+        await producer.send_scan_update("p1", "port_scan", "running")
+        event = await asyncio.wait_for(stream.__anext__(), 1)
+        assert json.loads(event["data"])["status"] == "running"
+        await stream.aclose()
+
+    async def test_failed_relay_unregisters_once_clients_are_gone(self, monkeypatch):
+        monkeypatch.setattr("app.api.sse.SSE_RELAY_RETRY_SECONDS", 0)
+
+        async def failing_subscribe(pubsub, channel):
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(_PubSub, "subscribe", failing_subscribe)
+        consumer = self._worker(_Broker())
+        consumer._get_scan_queue("p1")
+        relay = consumer._subscribers["p1"]
+        await asyncio.sleep(0)
+        del consumer.active_streams["p1"]  # last client left mid-backoff
+
+        await asyncio.wait_for(relay, 1)
+        assert "p1" not in consumer._subscribers
+        consumer._get_scan_queue("p1")
+        assert consumer._subscribers["p1"] is not relay
+        consumer._subscribers["p1"].cancel()
@@ -0,0 +1,130 @@
+"""
+Tests for the background task store (in-process backend).
+"""
+import time
+
+import orjson
+import pytest
+from unittest.mock import patch
+
+from app.core import taskstore
+from app.core.taskstore import InMemoryTaskStore, RedisTaskStore
+
+
+class _FakePipeline:
+    """Just enough of a redis-py pipeline to serve LINDEX from stored lists."""
+
+    def __init__(self, lists):
+        self.lists = lists
+        self.queued = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def lindex(self, key, i):
+        self.queued.append((key, i))
+
+    async def execute(self):
+        results = []
+        for key, i in self.queued:
+            items = self.lists.get(key, [])
+            results.append(items[i] if -len(items) <= i < len(items) else None)
+        return results
+
+
+class _FakeRedis:
+    def __init__(self, lists):
+        self.lists = {
+            key: [orjson.dumps(item) for item in items] for key, items in lists.items()
+        }
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self.lists)
+
+
+def _redis_store(lists):
+    store = RedisTaskStore.__new__(RedisTaskStore)
+    store._redis = _FakeRedis(lists)
+    return store
+
+
+@pytest.mark.asyncio
+class TestInMemoryTaskStore:
+    async def test_hset_merges_fields(self):
+        store = InMemoryTaskStore()
+        await store.hset_task("disc:1", {"status": "pending", "targets": ["a"]})
+        await store.hset_task("disc:1", {"status": "running"})
+        assert await store.hgetall_task("disc:1") == {"status": "running", "targets": ["a"]}
+
+    async def test_hset_if_exists_skips_missing_task(self):
+        store = InMemoryTaskStore()
+        assert not await store.hset_task_if_exists("recon:1", {"progress": 50})
+        assert await store.hgetall_task("recon:1") == {}
+        await store.hset_task("recon:1", {"status": "running"})
+        assert await store.hset_task_if_exists("recon:1", {"progress": 50})
+        assert await store.hgetall_task("recon:1") == {"status": "running", "progress": 50}
+
+    async def test_missing_task_is_empty(self):
+        store = InMemoryTaskStore()
+        assert await store.hgetall_task("disc:missing") == {}
+
+    async def test_hgetall_returns_copy(self):
+        store = InMemoryTaskStore()
+        await store.hset_task("disc:1", {"status": "pending"})
+        task = await store.hgetall_task("disc:1")
+        task["status"] = "mutated"
+        assert (await store.hgetall_task("disc:1"))["status"] == "pending"
+
+    async def test_lrange_uses_inclusive_end(self):
+        store = InMemoryTaskStore()
+        await store.rpush_items("disc:1:result", [1, 2, 3])
+        await store.rpush_items("disc:1:result", [4])
+        assert await store.lrange_items("disc:1:result") == [1, 2, 3, 4]
+        assert await store.lrange_items("disc:1:result", 1, 2) == [2, 3]
+
+    async def test_hdel_and_scan(self):
+        store = InMemoryTaskStore()
+        await store.hset_task("probe:a", {"status": "running"})
+        await store.hset_task("probe:b", {"status": "running"})
+        await store.hset_task("disc:c", {"status": "running"})
+        await store.hdel_task("probe:a")
+        assert [key async for key in store.scan_tasks("probe:")] == ["probe:b"]
+
+    async def test_expired_task_is_dropped(self):
+        store = InMemoryTaskStore()
+        await store.hset_task("recon:1", {"status": "running"})
+        await store.expire_task("recon:1", 60)
+        assert await store.hgetall_task("recon:1") == {"status": "running"}
+        with patch.object(time, "monotonic", return_value=time.monotonic() + 61):
+            assert await store.hgetall_task("recon:1") == {}
+            assert [key async for key in store.scan_tasks("recon:")] == []
+
+    async def test_index_orders_by_score(self):
+        store = InMemoryTaskStore()
+        await store.zadd_index("recon:user:u1", "b", 2)
+        await store.zadd_index("recon:user:u1", "a", 1)
+        await store.zadd_index("recon:user:u1", "c", 3)
+        await store.zrem_index("recon:user:u1", "b")
+        assert await store.zcard_index("recon:user:u1") == 2
+        assert await store.zrange_index("recon:user:u1") == ["a", "c"]
+        assert await store.zrange_index("recon:user:u1", 1, 1) == ["c"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["memory", "redis"])
+async def test_lindex_skips_missing_positions(backend):
+    """Both backends return present items in order and skip missing ones."""
+    items = ["a", "b", "c"]
+    if backend == "memory":
+        store = InMemoryTaskStore()
+        await store.rpush_items("disc:1:result", items)
+    else:
+        store = _redis_store({"disc:1:result": items})
+
+    with patch.object(taskstore, "_store", store):
+        assert await taskstore.lindex_items("disc:1:result", [2, 0]) == ["c", "a"]
+        assert await taskstore.lindex_items("disc:1:result", [1, 7, -1]) == ["b", "c"]
+        assert await taskstore.lindex_items("disc:gone:result", [0, 1]) == []
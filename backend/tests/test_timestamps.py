@@ -0,0 +1,19 @@
+"""
+Tests for epoch-millisecond task timestamps.
+"""
+import time
+
+from app.utils.timestamps import ms_to_iso, now_ms
+
+
+class TestTimestamps:
+    def test_now_ms_is_epoch_milliseconds(self):
+        assert isinstance(now_ms(), int)
+        assert abs(now_ms() - time.time() * 1000) < 1000
+
+    def test_ms_to_iso_is_naive_utc(self):
+        assert ms_to_iso(1704067200000) == "2024-01-01T00:00:00"
+        assert ms_to_iso(1704067200123) == "2024-01-01T00:00:00.123000"
+
+    def test_ms_to_iso_passes_none(self):
+        assert ms_to_iso(None) is None
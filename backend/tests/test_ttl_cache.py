@@ -0,0 +1,74 @@
+"""
+Tests for the bounded LRU/TTL cache used by per-process registries.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    def test_set_and_get(self):
+        cache = TTLCache(maxsize=4, ttl_seconds=60)
+        cache["a"] = 1
+        assert "a" in cache
+        assert cache["a"] == 1
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl_seconds=60)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")  # "b" is now least recently used
+        cache["c"] = 3
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    def test_entries_expire_after_idle_ttl(self):
+        cache = TTLCache(maxsize=4, ttl_seconds=10)
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=100.0):
+            cache["a"] = 1
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=111.0):
+            assert "a" not in cache
+            with pytest.raises(KeyError):
+                cache["a"]
+
+    def test_reads_do_not_extend_fixed_ttl(self):
+        cache = TTLCache(maxsize=4, ttl_seconds=10, refresh_on_access=False)
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=100.0):
+            cache["a"] = 1
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=108.0):
+            assert cache["a"] == 1
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=111.0):
+            assert "a" not in cache
+
+    def test_expire_only_removes_stale_entries(self):
+        cache = TTLCache(maxsize=4, ttl_seconds=10)
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=100.0):
+            cache["old"] = 1
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=105.0):
+            cache["new"] = 2
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=112.0):
+            assert cache.expire() == 1
+            assert list(cache) == ["new"]
+
+    def test_weight_bound_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=10, ttl_seconds=60, maxweight=10, weigh=len)
+        cache["a"] = b"xxxx"
+        cache["b"] = b"xxxx"
+        cache["c"] = b"xxxx"  # 12 bytes > 10: "a" goes
+        assert list(cache) == ["b", "c"]
+        assert cache.weight == 8
+        cache["huge"] = b"x" * 11  # heavier than the whole budget: never kept
+        assert "huge" not in cache
+        assert list(cache) == ["b", "c"]
+        assert cache.pop("b") == b"xxxx"
+        assert cache.weight == 4
+
+    def test_pop(self):
+        cache = TTLCache()
+        cache["a"] = 1
+        assert cache.pop("a") == 1
+        assert cache.pop("a", "gone") == "gone"
@@ -180,3 +180,25 @@ def test_sanitize_string_strips_whitespace():
 
 def test_sanitize_string_removes_null_bytes():
     assert "\x00" not in sanitize_string("hello\x00world")
+
+# --- Token verification cache ---
+def test_verify_token_caches_verified_payload():
+    from app.core import security
+    token = security.create_access_token({"sub": "user-cache"})
+    security._token_cache.clear()
+    with patch.object(security, "decode_token", wraps=security.decode_token) as decode:
+        first = security.verify_token(token)
+        first["sub"] = "mutated"
+        second = security.verify_token(token)
+    assert decode.call_count == 1
+    assert second["sub"] == "user-cache"
+
+def test_verify_token_reverifies_after_exp():
+    from app.core import security
+    token = security.create_access_token({"sub": "user-exp"})
+    security._token_cache.clear()
+    security.verify_token(token)
+    with patch.object(security, "decode_token", wraps=security.decode_token) as decode, \
+            patch.object(security.time, "time", return_value=time.time() + 3600):
+        security.verify_token(token)
+    assert decode.call_count == 1
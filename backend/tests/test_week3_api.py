@@ -311,6 +311,19 @@ class TestProjectEndpoints:
         assert "projects" in data
         assert data["total"] == 1
 
+    @pytest.mark.asyncio
+    async def test_list_projects_serialises_items(self, project_client):
+        client, svc, token = project_client
+        response = await client.get(
+            "/api/projects",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        item = response.json()["projects"][0]
+        assert item["id"] == "p1"
+        assert item["description"] is None
+        assert item["created_at"] == "2026-01-01T00:00:00"
+        assert item["enable_auto_exploit"] is False
+
     @pytest.mark.asyncio
     async def test_get_project_returns_project(self, project_client):
         client, svc, token = project_client
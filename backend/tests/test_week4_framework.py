@@ -14,8 +14,10 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from contextlib import nullcontext
 from typing import Any, List
 from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 import pytest
 
@@ -32,6 +34,9 @@ from app.recon.dedup import (
     EndpointDeduplicator,
     FindingDeduplicator,
     TechnologyDeduplicator,
+    _fast_normalise,
+    _first_match,
+    _normalise_url,
     levenshtein,
     similarity,
 )
@@ -360,6 +365,38 @@ class TestSimilarity:
         assert similarity("https://example.com/api/users", "https://example.com/api/user") > 0.9
 
 
+class TestNormaliseUrl:
+    @pytest.mark.parametrize("url", [
+        "https://Example.com:443/api/v1/users/",
+        "http://example.com:8080",
+        "http://example.com:0080/a//?b=2&a=1&a=3#frag",
+        "https://example.com/search?q=&page=2&flag&=x",
+        "https://example.com/?z=1&y=a==b",
+        "  HTTP://EXAMPLE.COM/Path/  ",
+    ])
+    def test_fast_path_matches_urlparse(self, url):
+        p = urlparse(url.strip())
+        port = None if p.port in (80, 443) else p.port
+        netloc = p.hostname if port is None else f"{p.hostname}:{port}"
+        path = p.path.rstrip("/") or "/"
+        query = urlencode(sorted(parse_qs(p.query).items()))
+        expected = urlunparse((p.scheme, netloc, path, "", query, ""))
+        assert _fast_normalise(url) == expected
+
+    @pytest.mark.parametrize("url", [
+        "https://example.com/a%20b",
+        "https://user@example.com/",
+        "http://[::1]:8080/",
+        "https://example.com/a;params",
+        "ftp://example.com/file",
+        "http://example.com:99999/",
+        "https:///path",
+    ])
+    def test_unusual_urls_use_the_full_parser(self, url):
+        assert _fast_normalise(url) is None
+        assert _normalise_url(url)
+
+
 class TestEndpointDeduplicator:
     def test_exact_duplicates_are_removed(self, sample_endpoints):
         dedup = EndpointDeduplicator()
@@ -381,6 +418,47 @@ class TestEndpointDeduplicator:
     def test_empty_list(self):
         assert EndpointDeduplicator().deduplicate([]) == []
 
+    def test_fuzzy_pass_skips_pairs_outside_length_window(self):
+        endpoints = [
+            Endpoint(url="https://example.com/a"),
+            Endpoint(url="https://example.com/api/v1/users/profile/settings"),
+            Endpoint(url="https://example.com/api/v1/users/profile/setting"),
+        ]
+        with patch("app.recon.dedup._rf_cdist", None), \
+                patch("app.recon.dedup.similarity", wraps=similarity) as scored:
+            result = EndpointDeduplicator().deduplicate(endpoints)
+
+        assert len(result) == 2
+        assert scored.call_count == 1  # only the two long URLs were compared
+
+    def test_length_window_bounds_each_scored_row(self):
+        endpoints = [
+            Endpoint(url="https://example.com/a"),
+            Endpoint(url="https://example.com/b"),
+            Endpoint(url="https://example.com/api/v1/users/profile/settings"),
+        ]
+        with patch("app.recon.dedup._first_match", wraps=_first_match) as rows:
+            EndpointDeduplicator().deduplicate(endpoints)
+
+        # The long URL's row holds no survivors: both short ones are out of range
+        assert [len(call.args[1]) for call in rows.call_args_list] == [0, 1, 0]
+
+
+    @pytest.mark.parametrize("use_cdist", [True, False])
+    def test_pair_exactly_on_threshold_matches(self, use_cdist):
+        url = "a" * 20
+        others = ["b" * 20, "a" * 17 + "bbb"]  # similarity 0.0 and exactly 0.85
+        cdist = patch("app.recon.dedup._rf_cdist", None) if not use_cdist else nullcontext()
+        with cdist:
+            assert _first_match(url, others, 0.85) == 1
+
+    def test_endpoints_exactly_on_threshold_are_merged(self):
+        endpoints = [
+            Endpoint(url="https://A.com:80/a/b/c/?id=1", confidence=0.87),
+            Endpoint(url="https://A.com:80/x?a=1"),
+            Endpoint(url="https://A.com:80/login?id=10", confidence=0.93),
+        ]
+        assert len(EndpointDeduplicator(fuzzy_threshold=0.85).deduplicate(endpoints)) == 2
 
 class TestTechnologyDeduplicator:
     def test_versioned_preferred_over_unversioned(self, sample_technologies):
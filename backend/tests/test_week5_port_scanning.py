@@ -325,6 +325,33 @@ class TestScanPortsAPIContracts:
         assert req.exclude_private is True
 
 
+class TestPortScanTaskListing:
+    """Task listings read only the caller's per-user index."""
+
+    @pytest.mark.asyncio
+    async def test_list_pages_newest_first_and_skips_other_users(self):
+        from fastapi import BackgroundTasks
+        from app.api import port_scan
+        from app.recon.port_scanning import PortScanRequest
+
+        async def _start(user_id):
+            resp = await port_scan.start_port_scan(
+                PortScanRequest(targets=["203.0.113.1"]), BackgroundTasks(), {"sub": user_id}
+            )
+            return resp["task_id"]
+
+        ids = [await _start("ps-u1") for _ in range(3)]
+        await _start("ps-u2")
+
+        page = await port_scan.list_scan_tasks(page=1, per_page=2, current_user={"sub": "ps-u1"})
+        assert page["total"] == 3
+        assert [t["task_id"] for t in page["tasks"]] == [ids[2], ids[1]]
+
+        await port_scan.delete_scan_task(ids[2], {"sub": "ps-u1"})
+        page = await port_scan.list_scan_tasks(page=1, per_page=10, current_user={"sub": "ps-u1"})
+        assert [t["task_id"] for t in page["tasks"]] == [ids[1], ids[0]]
+
+
 # ===========================================================================
 # Day 33 – NmapOrchestrator XML parsing
 # ===========================================================================
@@ -517,6 +517,16 @@ class TestURLMerger:
         merged = merger.merge()
         assert merged[0].confidence >= merged[-1].confidence
 
+    def test_add_accepts_generator_and_scores_incrementally(self):
+        merger = URLMerger()
+        merger.add((self._ep(f"https://example.com/api/{i}") for i in range(3)), source="katana")
+        merger.add(iter([self._ep("https://example.com/api/0")]), source="gau")
+        record = merger._records[normalise_url("https://example.com/api/0")]
+        assert record.category == URLCategory.API
+        assert record.sources == {"katana", "gau"}
+        assert record.confidence == compute_confidence(record)
+        assert len(merger.merge()) == 3
+
     def test_stats_returns_dict(self):
         merger = URLMerger()
         merger.add([self._ep("https://example.com/api/v1")], source="katana")
@@ -563,11 +573,222 @@ class TestURLDiscoveryAPIContracts:
         assert req.use_kiterunner is False
         assert req.katana_depth == 3
 
+    def test_request_enabled_tools(self):
+        from app.api.discovery_urls import URLDiscoveryCreateRequest
+        req = URLDiscoveryCreateRequest(targets=["https://example.com"], use_kiterunner=True)
+        assert req.enabled_tools == ("katana", "gau", "kiterunner")
+        assert req.enabled_tools is req.enabled_tools
+        req = URLDiscoveryCreateRequest(targets=["https://example.com"], use_katana=False)
+        assert req.enabled_tools == ("gau",)
+
     def test_results_endpoint_in_routes(self):
         from app.api.discovery_urls import router
         paths = [r.path for r in router.routes]
         assert any("results" in p for p in paths)
 
+    def test_result_index_filters_match_scan(self):
+        from app.api.discovery_urls import _build_result_index, _filter_positions
+        results = [
+            {"confidence": 0.9, "extra": {"category": "api", "sources": ["katana", "gau"]}},
+            {"confidence": 0.4, "extra": {"category": "api", "sources": ["gau"]}},
+            {"confidence": 0.7, "extra": {"category": "static", "sources": ["katana"]}},
+            {"confidence": None, "extra": {}},
+        ]
+        index = _build_result_index(results)
+        assert _filter_positions(index, "api", None, 0.0) == [0, 1]
+        assert _filter_positions(index, None, "katana", 0.0) == [0, 2]
+        assert _filter_positions(index, None, None, 0.7) == [0, 2]
+        assert _filter_positions(index, "api", "gau", 0.5) == [0]
+        assert _filter_positions(index, "missing", None, 0.0) == []
+
+    @pytest.mark.asyncio
+    async def test_run_discovery_runs_tools_concurrently(self):
+        import asyncio
+        from app.api import discovery_urls
+        from app.api.discovery_urls import URLDiscoveryCreateRequest, _run_discovery
+        from app.core import taskstore
+
+        started: List[str] = []
+        release = asyncio.Event()
+
+        async def fake_katana(req):
+            started.append("katana")
+            await release.wait()
+            return [Endpoint(url="https://example.com/a", method=EndpointMethod.GET, discovered_by="katana")]
+
+        async def fake_gau(req):
+            started.append("gau")
+            release.set()  # only reached while katana is still pending if run concurrently
+            raise RuntimeError("provider down")
+
+        req = URLDiscoveryCreateRequest(targets=["https://example.com"])
+        await taskstore.hset_task("disc:concurrent", {"status": "pending"})
+        with patch.object(discovery_urls, "_run_katana", fake_katana), \
+                patch.object(discovery_urls, "_run_gau", fake_gau):
+            await asyncio.wait_for(_run_discovery("concurrent", req), timeout=5)
+
+        task = await taskstore.hgetall_task("disc:concurrent")
+        assert started == ["katana", "gau"]
+        assert task["status"] == "completed"
+        assert task["errors"] == ["gau: provider down"]
+        assert len(await taskstore.lrange_items("disc:concurrent:result")) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_run_is_marked_failed_and_expires(self):
+        import asyncio
+        from app.api import discovery_urls
+        from app.api.discovery_urls import URLDiscoveryCreateRequest, _run_discovery
+        from app.core import taskstore
+
+        async def hang(req):
+            await asyncio.Event().wait()
+
+        req = URLDiscoveryCreateRequest(targets=["https://example.com"], use_gau=False, use_kiterunner=False)
+        await taskstore.hset_task("disc:cancelled", {"status": "pending"})
+        with patch.object(discovery_urls, "_run_katana", hang), \
+                patch.object(taskstore, "expire_task", wraps=taskstore.expire_task) as expire:
+            job = asyncio.ensure_future(_run_discovery("cancelled", req))
+            await asyncio.sleep(0.05)
+            job.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await job
+
+        task = await taskstore.hgetall_task("disc:cancelled")
+        assert task["status"] == "failed"
+        assert task["error"] == "Task interrupted"
+        expire.assert_any_await("disc:cancelled", discovery_urls.DISCOVERY_TASK_TTL_SECONDS)
+
+    @pytest.mark.asyncio
+    async def test_identical_inflight_requests_are_coalesced(self):
+        import asyncio
+        from app.api import discovery_urls
+        from app.api.discovery_urls import URLDiscoveryCreateRequest, start_url_discovery
+
+        release = asyncio.Event()
+        runs: List[str] = []
+
+        async def fake_run(task_id, req):
+            runs.append(task_id)
+            await release.wait()
+
+        req = URLDiscoveryCreateRequest(targets=["https://coalesce.example.com"])
+        with patch.object(discovery_urls, "_run_discovery", fake_run):
+            first = await start_url_discovery(req, {"sub": "u1"})
+            again = await start_url_discovery(req.model_copy(), {"sub": "u1"})
+            other_user = await start_url_discovery(req, {"sub": "u2"})
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            after = await start_url_discovery(req, {"sub": "u1"})
+
+        assert again["task_id"] == first["task_id"]
+        assert other_user["task_id"] != first["task_id"]
+        assert after["task_id"] != first["task_id"]
+        assert runs[:2] == [first["task_id"], other_user["task_id"]]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_during_initial_write_joins_the_task(self):
+        import asyncio
+        from app.api import discovery_urls
+        from app.api.discovery_urls import URLDiscoveryCreateRequest, start_url_discovery
+        from app.core import taskstore
+
+        runs: List[str] = []
+        hset_task = taskstore.hset_task
+
+        async def slow_hset_task(key, mapping):
+            await asyncio.sleep(0.01)
+            await hset_task(key, mapping)
+
+        async def fake_run(task_id, req):
+            runs.append(task_id)
+
+        req = URLDiscoveryCreateRequest(targets=["https://racing.example.com"])
+        with patch.object(discovery_urls, "_run_discovery", fake_run), \
+                patch.object(taskstore, "hset_task", slow_hset_task):
+            first, second = await asyncio.gather(
+                start_url_discovery(req, {"sub": "u1"}),
+                start_url_discovery(req, {"sub": "u1"}),
+            )
+            await asyncio.sleep(0)
+
+        assert second["task_id"] == first["task_id"]
+        assert second["status"] == "pending"
+        assert runs == [first["task_id"]]
+
+    @pytest.mark.asyncio
+    async def test_status_poll_returns_304_for_matching_etag(self):
+        from fastapi import Response
+        from starlette.requests import Request
+        from app.api.discovery_urls import get_discovery_status
+        from app.core import taskstore
+
+        def _request(etag=None):
+            headers = [(b"if-none-match", etag.encode())] if etag else []
+            return Request({"type": "http", "method": "GET", "headers": headers})
+
+        await taskstore.hset_task("disc:etag", {
+            "user_id": "u1", "status": "running", "targets": ["https://example.com"],
+            "tools": ["katana"], "errors": [], "stats": None,
+            "created_at": 1704067200000, "updated_at": 1704067200000,
+        })
+
+        response = Response()
+        body = await get_discovery_status("etag", _request(), response, {"sub": "u1"})
+        etag = response.headers["etag"]
+        assert body["status"] == "running"
+
+        cached = await get_discovery_status("etag", _request(etag), Response(), {"sub": "u1"})
+        assert cached.status_code == 304
+
+        await taskstore.hset_task("disc:etag", {"status": "completed", "updated_at": 1704067201000})
+        fresh = await get_discovery_status("etag", _request(etag), Response(), {"sub": "u1"})
+        assert fresh["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_unfiltered_results_served_from_cached_bytes(self):
+        import orjson
+        from fastapi import HTTPException
+        from app.api.discovery_urls import get_discovery_results
+        from app.core import taskstore
+
+        await taskstore.hset_task("disc:cached", {
+            "user_id": "u1", "status": "completed", "stats": {},
+            "created_at": 1704067200000, "updated_at": 1704067200000,
+        })
+        await taskstore.rpush_items("disc:cached:result", [{"url": "https://example.com/a"}])
+
+        first = await get_discovery_results("cached", {"sub": "u1"}, None, None, 0.0)
+        with patch.object(taskstore, "lrange_items", side_effect=AssertionError("reloaded")):
+            second = await get_discovery_results("cached", {"sub": "u1"}, None, None, 0.0)
+
+        assert second.body == first.body
+        assert orjson.loads(second.body)["total"] == 1
+        assert orjson.loads(second.body)["created_at"] == "2024-01-01T00:00:00"
+        with pytest.raises(HTTPException) as exc_info:
+            await get_discovery_results("cached", {"sub": "other"}, None, None, 0.0)
+        assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_cached_results_dropped_with_their_task(self):
+        from fastapi import HTTPException
+        from app.api import discovery_urls
+        from app.core import taskstore
+
+        await taskstore.hset_task("disc:gone", {
+            "user_id": "u1", "status": "completed", "stats": {},
+            "created_at": 1704067200000, "updated_at": 1704067200000,
+        })
+        await discovery_urls.get_discovery_results("gone", {"sub": "u1"}, None, None, 0.0)
+        assert "gone" in discovery_urls._results_cache
+
+        await taskstore.hdel_task("disc:gone")
+        with pytest.raises(HTTPException) as exc_info:
+            await discovery_urls.get_discovery_results("gone", {"sub": "u1"}, None, None, 0.0)
+        assert exc_info.value.status_code == 404
+        assert "gone" not in discovery_urls._results_cache
+
 
 # ===========================================================================
 # Day 48 – Documentation & Package Exports